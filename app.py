@@ -3,14 +3,17 @@ import os
 import re
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QGridLayout, QLabel, QPushButton, 
-                             QScrollArea, QStackedWidget)
-from PyQt5.QtGui import QPixmap, QPixmapCache
-from PyQt5.QtCore import Qt, QTimer, QSize, pyqtSignal, QEvent
-from services.api_services import fetch_games_list, fetch_live_game_updates
-from services.logo_handler import _preload_logos
-from services.theme_handler import DarkModeToggle, DARK_THEME, LIGHT_THEME
-from services.main_view_handler import GameCell
+                             QScrollArea, QStackedWidget, QShortcut)
+from PyQt5.QtGui import QPixmap, QPixmapCache, QKeySequence
+from PyQt5.QtCore import Qt, QTimer, QSize, QThread, pyqtSignal, QEvent
+from services.refresh_worker import RefreshWorker
+from services.change_events import GameChange
+from services.logo_handler import _index_logos
+from services.theme_handler import DarkModeToggle, apply_app_theme
+from services.main_view_handler import GameCell, SkeletonCell
 from services.detail_view_handler import GameDetailView
+from services import perf
+from services.perf_overlay import EventLoopLagProbe, PerfOverlay
 
 
 # MainWindow
@@ -18,41 +21,62 @@ from services.detail_view_handler import GameDetailView
 
 # Creates the main UI layout with header and content area
 # Manages navigation between the main view (list of games) and detail views
-# Maintains a timer to update game data every 1 seconds
+# Runs a RefreshWorker on a background thread that polls each game as often as its state needs
 # Contains collections of game cells and detail views
 # Handles the dark/light theme switching functionality
 # Organizes the UI with QStackedWidget for page switching
+# Paints a skeleton grid immediately and lets cached, then live, data stream in
+
+SKELETON_CELL_COUNT = 6  # Placeholder cards shown until the first games list arrives
+PERF_OVERLAY_SHORTCUT = "Ctrl+Shift+P"
+PERF_OVERLAY_ENV = "NBA_PERF_OVERLAY"  # Show the performance overlay from startup
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    game_components_requested = pyqtSignal(str, int)  # game_id, GameComponent flags its views need
+
+    def __init__(self, start_refresh=True):
+        """start_refresh=False leaves the worker on the GUI thread, unstarted, for benchmarks to drive."""
         super().__init__()
-        # Preload available logos into memory for fast access
-        _preload_logos()
+        # Index logo files only; pixmaps are decoded on demand when cells need them
+        _index_logos()
         self.game_cells = {}
         self.game_detail_views = {}
+        self.games = []
+        self.game_summaries = {}  # game_id -> GameSummary, what the cells show
+        self.game_updates = {}    # game_id -> GameUpdate, fetched only for opened detail views
+        self._grid_game_ids = []
         self.is_dark_mode = False
+        self.skeleton_cells = []
         self.init_ui()
+
+        # Performance overlay (requests/min, cache hits, tick time, event-loop lag), toggled by shortcut
+        self.lag_probe = EventLoopLagProbe(self)
+        self.perf_overlay = PerfOverlay(self, self.lag_probe)
+        QShortcut(QKeySequence(PERF_OVERLAY_SHORTCUT), self, activated=self.perf_overlay.toggle)
+        if perf.trace_enabled():
+            self.lag_probe.acquire()  # Put event-loop lag in the trace too
+        if os.environ.get(PERF_OVERLAY_ENV):
+            self.perf_overlay.set_shown(True)
         
-        # Set up timer for auto-updates
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_games)
-        self.update_timer.start(1000)  # Update every 1 second
-        
-        # Initial update
-        self.update_games()
-        QTimer.singleShot(100, self.fix_layout_with_navigation)
+        # All network access happens on the refresh thread; results arrive via signals
+        self.refresh_thread = QThread(self)
+        # Polls each game on its own state-driven schedule, fetching what its cell shows by default
+        self.refresh_worker = RefreshWorker(default_components=GameCell.REQUIRED_COMPONENTS)
+        self.refresh_worker.games_ready.connect(self.update_games)
+        self.refresh_worker.summary_changed.connect(self.update_summary)
+        self.refresh_worker.game_changed.connect(self.update_game)
+        self.game_components_requested.connect(self.refresh_worker.set_components)
+        if start_refresh:
+            self.refresh_worker.moveToThread(self.refresh_thread)
+            self.refresh_thread.started.connect(self.refresh_worker.start)
+            self.refresh_thread.finished.connect(self.refresh_worker.deleteLater)
+            self.refresh_thread.start()
+
+    def closeEvent(self, event):
+        self.refresh_thread.quit()
+        self.refresh_thread.wait()
+        super().closeEvent(event)
 
-    def fix_layout_with_navigation(self):
-        # Get the first game ID if any exist
-        games = fetch_games_list()
-        if games:
-            # Simulate clicking the first game
-            first_game_id = games[0].game_id
-            self.cell_clicked(first_game_id)
-            
-            # Then go back to main view after a very short delay
-            QTimer.singleShot(50, self.show_main_view)
-            
     def init_ui(self):
         self.setWindowTitle("NBA Desktop Widget")
         self.setMinimumSize(450, 600)
@@ -74,7 +98,7 @@ class MainWindow(QMainWindow):
         title_layout = QHBoxLayout(self.title_widget)
         title_layout.setContentsMargins(0, 0, 0, 0)
         self.title_label = QLabel("NBA Games")
-        self.title_label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        self.title_label.setObjectName("titleLabel")
         title_layout.addWidget(self.title_label)
         
         # Back button for detail view - aligned far left
@@ -125,46 +149,84 @@ class MainWindow(QMainWindow):
         self.scroll_area.setWidget(self.scroll_content)
         
         self.main_view_layout.addWidget(self.scroll_area)
+        self._show_skeleton_grid()
         
         self.stacked_widget.addWidget(self.main_view)
-        self.main_layout.addWidget(self.stacked_widget)
+        # Content takes all spare height so the header stays compact
+        self.main_layout.addWidget(self.stacked_widget, 1)
         
         # Apply initial theme
         self.apply_theme(False)
         
-    def update_games(self):
+    @perf.timed("MainWindow.update_games", "ui")
+    def update_games(self, games):
         try:
-            # Fetch games list
-            games = fetch_games_list()
+            self.games = list(games)
             
             # Get current game IDs for comparison
             current_game_ids = [game.game_id for game in games]
             
-            # Remove widgets from grid first
-            self._clear_grid_layout()
-            
-            # Add or update game cells
-            for i, game in enumerate(games):
-                row, col = i // 2, i % 2
-                
+            # Create cells for games we haven't seen yet
+            for game in games:
                 if game.game_id not in self.game_cells:
                     # Create new game cell and detail view
                     self._create_game_widgets(game)
-                
-                # Add to layout and update
-                cell = self.game_cells[game.game_id]
-                self.grid_layout.addWidget(cell, row, col)
-                
-                # Apply theme and update state
-                self._update_game_cell(game.game_id)
+                    
+                    # Show any state we already have
+                    self._update_game_cell(game.game_id)
+            
+            self._clear_skeleton_grid()
+            
+            # Only re-lay out the grid when the set or order of games changed;
+            # otherwise cells stay put and update their own labels in place
+            if current_game_ids != self._grid_game_ids:
+                self._rebuild_grid(current_game_ids)
             
             # Clean up cells that are no longer needed
             self._remove_stale_games(current_game_ids)
-            
                 
         except Exception as e:
             print(f"Error in update_games: {e}")
+
+    def update_summary(self, game_id, summary, changes):
+        """Store a changed GameSummary and refresh its cell if the cell shows those changes"""
+        self.game_summaries[game_id] = summary
+        cell = self.game_cells.get(game_id)
+        if cell and GameChange(changes) & cell.SUBSCRIBED_CHANGES:
+            cell.update_game_status(summary)
+
+    def update_game(self, game_id, game_update, changes):
+        """Store a changed GameUpdate and notify the detail view if it shows those changes"""
+        self.game_updates[game_id] = game_update
+        changes = GameChange(changes)
+
+        detail_view = self.game_detail_views.get(game_id)
+        if detail_view and changes & detail_view.SUBSCRIBED_CHANGES:
+            detail_view.apply_changes(game_update, changes)
     
+    def _show_skeleton_grid(self):
+        """Fill the grid with placeholder cards until real games arrive"""
+        for i in range(SKELETON_CELL_COUNT):
+            skeleton = SkeletonCell()
+            self.grid_layout.addWidget(skeleton, i // 2, i % 2)
+            self.skeleton_cells.append(skeleton)
+
+    def _clear_skeleton_grid(self):
+        for skeleton in self.skeleton_cells:
+            self.grid_layout.removeWidget(skeleton)
+            skeleton.deleteLater()
+        self.skeleton_cells = []
+
+    @perf.timed("MainWindow._rebuild_grid", "ui")
+    def _rebuild_grid(self, game_ids):
+        """Lay out the cells for game_ids two per row"""
+        self._clear_grid_layout()
+        for i, game_id in enumerate(game_ids):
+            row, col = i // 2, i % 2
+            self.grid_layout.addWidget(self.game_cells[game_id], row, col)
+        self._grid_game_ids = list(game_ids)
+
+    @perf.timed("MainWindow._clear_grid_layout", "ui")
     def _clear_grid_layout(self):
         """Remove all widgets from grid layout without deleting them"""
         for i in reversed(range(self.grid_layout.count())):
@@ -186,30 +248,18 @@ class MainWindow(QMainWindow):
         # self.stacked_widget.addWidget(detail_view)
     
     def _update_game_cell(self, game_id):
-        """Apply theme and update game status for a cell"""
+        """Update game status for a cell and its detail view"""
         if game_id not in self.game_cells:
             return
             
         cell = self.game_cells[game_id]
         detail_view = self.game_detail_views.get(game_id)
         
-        # Apply theme
-        cell.apply_theme(self.is_dark_mode)
-        if detail_view:
-            detail_view.apply_theme(self.is_dark_mode)
-        
-        # Update game status
-        try:
-            game_update = fetch_live_game_updates(game_id)
-            if game_update:
-                cell.update_game_status(game_update)
-                if detail_view:
-                    detail_view.update_game_status(game_update)
-            else:
-                cell.update_game_status(None)
-        except Exception as e:
-            print(f"Error updating game {game_id}: {e}")
-            cell.update_game_status(None)
+        # Update game status from the latest snapshots
+        cell.update_game_status(self.game_summaries.get(game_id))
+        game_update = self.game_updates.get(game_id)
+        if game_update and detail_view:
+            detail_view.update_game_status(game_update)
     
     def _remove_stale_games(self, current_game_ids):
         """Remove games that are no longer in the current list"""
@@ -224,17 +274,19 @@ class MainWindow(QMainWindow):
                 if self.stacked_widget.currentWidget() == self.main_view:
                     cell = self.game_cells.pop(game_id)
                     cell.deleteLater()
+                    self.game_summaries.pop(game_id, None)
+                    self.game_updates.pop(game_id, None)
         
     def cell_clicked(self, game_id):
         # Create detail view only when needed
         if game_id not in self.game_detail_views:
             # Find the game object
-            for game in fetch_games_list():
+            for game in self.games:
                 if game.game_id == game_id:
                     # Create the detail view
                     detail_view = GameDetailView(game)
                     detail_view.back_signal.connect(self.show_main_view)
-                    detail_view.apply_theme(self.is_dark_mode)
+                    detail_view.components_changed.connect(lambda game_id=game_id: self._request_components(game_id))
                     self.game_detail_views[game_id] = detail_view
                     self.stacked_widget.addWidget(detail_view)
                     break
@@ -246,31 +298,72 @@ class MainWindow(QMainWindow):
             # Switch header to back button
             self.header_left_stack.setCurrentWidget(self.back_widget)
             self._update_game_cell(game_id)
+            self._request_components(game_id)  # The worker fetches the newly needed components at once
     
     def show_main_view(self):
+        previous_widget = self.stacked_widget.currentWidget()
         self.stacked_widget.setCurrentWidget(self.main_view)
         # Switch header back to title
         self.header_left_stack.setCurrentWidget(self.title_widget)
+        if isinstance(previous_widget, GameDetailView):
+            self._request_components(previous_widget.game_id)
+
+    def _request_components(self, game_id):
+        """Tell the worker what the views currently showing game_id need fetched"""
+        components = GameCell.REQUIRED_COMPONENTS
+        detail_view = self.game_detail_views.get(game_id)
+        if detail_view is not None and self.stacked_widget.currentWidget() is detail_view:
+            components |= detail_view.required_components()
+        self.game_components_requested.emit(game_id, int(components))
     
+    @perf.timed("MainWindow.apply_theme", "ui")
     def apply_theme(self, is_dark_mode):
+        """Switch the application stylesheet; only called when the theme changes"""
         self.is_dark_mode = is_dark_mode
-        theme = DARK_THEME if is_dark_mode else LIGHT_THEME
-        
-        # Apply theme to all game cells and detail views
-        for game_id in self.game_cells:
-            self._update_game_cell(game_id)
-            
-        # Apply theme to main window and header elements
-        self.setStyleSheet(f"""
-            QMainWindow {{ background-color: {theme['main_bg']}; }}
-            QScrollArea {{ background-color: {theme['main_bg']}; border: none; }}
-            QWidget {{ background-color: {theme['main_bg']}; color: {theme['text_color']}; }}
-            QLabel {{ color: {theme['text_color']}; }}
-        """)
+        apply_app_theme(is_dark_mode)
         
 
+def _apply_cli_options(argv):
+    """Handle the feed and profiling options and return the arguments left for Qt.
+
+    The feed options only set the environment the data layer reads when its
+    HTTP client is created (see services.http_client), so they cost nothing
+    at startup.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="NBA Desktop Widget")
+    feed = parser.add_mutually_exclusive_group()
+    feed.add_argument("--record", metavar="ARCHIVE", help="append every fetched feed payload to a gzip archive")
+    feed.add_argument("--replay", metavar="ARCHIVE", help="serve a recorded archive instead of cdn.nba.com")
+    parser.add_argument("--replay-speed", metavar="N|max", default="1",
+                        help="replay N times faster than recorded, or 'max' to step poll by poll (default 1)")
+    parser.add_argument("--trace", metavar="FILE", help="write timing spans as a Chrome trace (chrome://tracing, Perfetto)")
+    parser.add_argument("--perf-overlay", action="store_true",
+                        help=f"show the performance overlay from startup ({PERF_OVERLAY_SHORTCUT} toggles it)")
+    args, qt_args = parser.parse_known_args(argv[1:])
+
+    if args.record:
+        os.environ["NBA_RECORD_ARCHIVE"] = args.record
+    if args.replay:
+        from services.feed_archive import parse_speed
+        try:
+            parse_speed(args.replay_speed)
+        except ValueError as e:
+            parser.error(str(e))
+        os.environ["NBA_REPLAY_ARCHIVE"] = args.replay
+        os.environ["NBA_REPLAY_SPEED"] = args.replay_speed
+    if args.trace:
+        try:
+            perf.start_trace(args.trace)
+        except OSError as e:
+            parser.error(f"cannot write trace file: {e}")
+    if args.perf_overlay:
+        os.environ[PERF_OVERLAY_ENV] = "1"
+    return argv[:1] + qt_args
+
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    app = QApplication(_apply_cli_options(sys.argv))
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file
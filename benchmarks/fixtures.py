@@ -0,0 +1,147 @@
+"""Synthetic game nights in the cdn.nba.com live-feed format, written as replay archives.
+
+A slate mixes scheduled, live and final games. Live games advance every
+poll: the clock runs down, scores and player lines move, and play-by-play
+grows by a few actions. The payloads carry every field the parsers read.
+They are recorded with services.feed_archive, so a synthetic night replays
+exactly like a recorded one. Everything is seeded and deterministic.
+"""
+import json
+import os
+import random
+import sys
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.feed_archive import FeedRecorder
+from services.http_client import FetchedPayload, SCOREBOARD_ENDPOINT, BOXSCORE_ENDPOINT, PLAYBYPLAY_ENDPOINT
+from services.teams import TEAMS
+
+NIGHT_START = 1_792_000_000  # Virtual time of the first poll (a UTC timestamp)
+POLL_SECONDS = 5             # How often the recorder polled, the live poll interval
+PLAYERS_PER_TEAM = 13
+INITIAL_ACTIONS = 120        # Play-by-play length when recording starts
+ACTIONS_PER_POLL = 2
+
+
+def _utc(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def game_id(index):
+    return f"00226{index:05d}"
+
+
+class _Game:
+    """One synthetic game's evolving state"""
+
+    def __init__(self, index, rng):
+        self.index, self.rng = index, rng
+        self.home, self.away = TEAMS[(2 * index) % len(TEAMS)], TEAMS[(2 * index + 1) % len(TEAMS)]
+        self.status = 3 if index % 10 == 8 else 1 if index % 10 == 9 else 2  # 10% final, 10% scheduled
+        self.period = 0 if self.status == 1 else 4 if self.status == 3 else 1 + index % 4
+        self.seconds_left = 0 if self.status != 2 else rng.randint(60, 720)
+        self.players = {side: [[rng.randint(0, 36)] + [rng.randint(0, 8) for _ in range(14)]
+                               for _ in range(PLAYERS_PER_TEAM)] for side in ("home", "away")}
+        self.actions = INITIAL_ACTIONS if self.status != 1 else 0
+
+    def score(self, side):
+        return sum(stats[1] for stats in self.players[side]) if self.status != 1 else 0
+
+    def advance(self):
+        if self.status != 2:
+            return
+        self.seconds_left = max(self.seconds_left - POLL_SECONDS, 0)
+        if self.seconds_left == 0 and self.period < 4:
+            self.period, self.seconds_left = self.period + 1, 720
+        for side in ("home", "away"):
+            stats = self.rng.choice(self.players[side])
+            stats[1] += self.rng.choice((0, 2, 3))  # points
+            stats[self.rng.randint(2, 14)] += 1
+        self.actions += ACTIONS_PER_POLL
+
+    def status_text(self):
+        if self.status == 1:
+            return "7:30 pm ET"
+        if self.status == 3:
+            return "Final"
+        return f"Q{self.period} {self.seconds_left // 60}:{self.seconds_left % 60:02d}"
+
+    def clock(self):
+        return f"PT{self.seconds_left // 60:02d}M{self.seconds_left % 60:02d}.00S" if self.status == 2 else ""
+
+    def team(self, side, players=False):
+        team = self.home if side == "home" else self.away
+        block = {"teamId": team.team_id, "teamName": team.nickname, "teamCity": team.city,
+                 "teamTricode": team.tricode, "score": self.score(side)}
+        if players:
+            block["players"] = [self._player(side, number, stats) for number, stats in enumerate(self.players[side])]
+        return block
+
+    def _player(self, side, number, stats):
+        names = ("minutes", "points", "reboundsTotal", "assists", "fieldGoalsMade", "fieldGoalsAttempted",
+                 "threePointersMade", "threePointersAttempted", "freeThrowsMade", "freeThrowsAttempted",
+                 "plusMinusPoints", "turnovers", "steals", "blocks", "foulsPersonal")
+        statistics = dict(zip(names, stats))
+        statistics["minutesCalculated"] = f"PT{statistics.pop('minutes'):02d}M"
+        statistics["plusMinusPoints"] = float(statistics["plusMinusPoints"] - 4)
+        return {"personId": self.index * 100 + number, "name": f"{side.title()} Player {self.index}-{number}",
+                "statistics": statistics}
+
+    def leader(self, side):
+        if self.status == 1:
+            return {"personId": 0, "name": "", "points": 0, "rebounds": 0, "assists": 0}
+        stats = max(self.players[side], key=lambda stats: stats[1])
+        return {"personId": 1, "name": f"{side.title()} Leader {self.index}",
+                "points": stats[1], "rebounds": stats[2], "assists": stats[3]}
+
+    def scoreboard_entry(self):
+        return {
+            "gameId": game_id(self.index), "gameStatus": self.status, "gameStatusText": self.status_text(),
+            "period": self.period, "gameClock": self.clock(),
+            "gameTimeUTC": _utc(NIGHT_START + (3 * 3600 if self.status == 1 else -3600)),
+            "homeTeam": self.team("home"), "awayTeam": self.team("away"),
+            "gameLeaders": {"homeLeaders": self.leader("home"), "awayLeaders": self.leader("away")},
+        }
+
+    def boxscore(self):
+        return {"meta": {}, "game": {
+            "gameId": game_id(self.index), "gameStatus": self.status, "gameStatusText": self.status_text(),
+            "period": self.period, "gameClock": self.clock(),
+            "homeTeam": self.team("home", players=True), "awayTeam": self.team("away", players=True),
+        }}
+
+    def playbyplay(self):
+        return {"meta": {}, "game": {"gameId": game_id(self.index), "actions": [
+            {"actionNumber": number, "clock": f"PT{(720 - number * 5) % 720 // 60:02d}M{number * 5 % 60:02d}.00S",
+             "period": 1 + number // 120, "description": f"Action {number}: jump shot", "edited": "2026-10-16T23:45:00Z"}
+            for number in range(1, self.actions + 1)
+        ]}}
+
+
+def write_archive(path, games, polls, seed=0):
+    """Record polls snapshots of a games-game night to path, one poll every POLL_SECONDS; return game ids."""
+    rng = random.Random(seed)
+    slate = [_Game(index, rng) for index in range(games)]
+    recorder = FeedRecorder(path)
+
+    def record(endpoint, payload, at):
+        recorder.record(endpoint, FetchedPayload(json.dumps(payload).encode(), None, None), at)
+
+    for poll in range(polls):
+        at = NIGHT_START + poll * POLL_SECONDS
+        record(SCOREBOARD_ENDPOINT, {"meta": {}, "scoreboard": {"games": [game.scoreboard_entry() for game in slate]}}, at)
+        for game in slate:
+            if game.status != 1:
+                record(BOXSCORE_ENDPOINT.format(game_id=game_id(game.index)), game.boxscore(), at + 0.01)
+                record(PLAYBYPLAY_ENDPOINT.format(game_id=game_id(game.index)), game.playbyplay(), at + 0.02)
+            game.advance()
+    recorder.close()
+    return [game_id(game.index) for game in slate]
+
+
+def first_live_game(games):
+    """Id of the first game write_archive makes live"""
+    return game_id(next(index for index in range(games) if index % 10 < 8))
@@ -0,0 +1,62 @@
+"""Report per-module import cost of `import app` using `python -X importtime`.
+
+Prints the total, the most expensive modules, and fails if any module that
+is supposed to load lazily (the data layer and its dependencies) is pulled
+in at import time, or if the total exceeds --max-ms.
+
+    python benchmarks/import_time.py --top 15 --max-ms 200
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded by the refresh worker on first use, never by `import app`
+DEFERRED_MODULES = ("services.api_services", "aiohttp", "asyncio", "dateutil", "sqlite3")
+
+
+def import_times(statement="import app"):
+    """Return [(module, self_us, cumulative_us)] in import order."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=15, help="how many modules to list")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if `import app` takes longer")
+    args = parser.parse_args()
+
+    rows = import_times()
+    total_us = next(cumulative for module, _, cumulative in rows if module == "app")
+    print(f"import app: {total_us / 1000:.1f} ms cumulative, {len(rows)} modules")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for module, self_us, cumulative_us in sorted(rows, key=lambda row: row[1], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {module}")
+
+    failed = False
+    eager = sorted({module for module, _, _ in rows
+                    if any(module == name or module.startswith(name + ".") for name in DEFERRED_MODULES)})
+    if eager:
+        print(f"FAIL: imported eagerly but should be deferred: {', '.join(eager)}")
+        failed = True
+    if args.max_ms is not None and total_us / 1000 > args.max_ms:
+        print(f"FAIL: import app took {total_us / 1000:.1f} ms (limit {args.max_ms:.0f} ms)")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Compare the memory and hashing cost of the box score data model.
+
+Builds the same synthetic slate twice: once with the dict-backed dataclasses
+and per-player PlayerStats tuples the app used to keep, once with the
+slotted GameUpdate and column-array BoxScore it keeps now. Each game holds
+--history snapshots, as the worker and views do across polls.
+
+    python benchmarks/memory_model.py --games 15 --history 10
+"""
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass, fields
+from typing import Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.api_services import GameUpdate
+from services.box_score import BoxScore, STAT_FIELDS
+from services.game_state import GameState
+
+PLAYERS_PER_TEAM = 13
+
+
+@dataclass(frozen=True)
+class _LegacyPlayerStats:
+    player_name: str
+    minutes_played: int
+    points: int
+    rebounds: int
+    assists: int
+    field_goals_made: int
+    field_goals_attempted: int
+    three_pointers_made: int
+    three_pointers_attempted: int
+    free_throws_made: int
+    free_throws_attempted: int
+    plus_minus: int
+    turnovers: int
+    steals: int
+    blocks: int
+    fouls: int
+
+
+@dataclass(frozen=True)
+class _LegacyGameUpdate:
+    status: str
+    period: int
+    clock: str
+    home_score: str
+    away_score: str
+    home_players: Tuple[_LegacyPlayerStats, ...]
+    away_players: Tuple[_LegacyPlayerStats, ...]
+    best_home_player: str
+    best_away_player: str
+    best_overall_player: str
+    recent_plays: Tuple[str, ...]
+    last_action_number: int = 0
+    state: GameState = GameState.UNKNOWN
+
+
+assert [field.name for field in fields(_LegacyGameUpdate)] == [field.name for field in fields(GameUpdate)]
+
+
+def _rows(game, snapshot, side):
+    # Realistic stat ranges (small ints are shared either way); names differ per game
+    rows = []
+    for player in range(PLAYERS_PER_TEAM):
+        seed = game * 1000 + snapshot * 10 + player
+        name = f"Player {side}{game}-{player}"
+        rows.append((name, tuple((seed + offset) % 48 for offset in range(len(STAT_FIELDS)))))
+    return rows
+
+
+def _legacy_update(game, snapshot):
+    teams = [tuple(_LegacyPlayerStats(name, *stats) for name, stats in _rows(game, snapshot, side)) for side in "HA"]
+    return _LegacyGameUpdate("Q2 5:00", 2, "5:00", "50", "48", teams[0], teams[1], "", "", "", ())
+
+
+def _compact_update(game, snapshot):
+    teams = [BoxScore.from_rows(_rows(game, snapshot, side)) for side in "HA"]
+    return GameUpdate("Q2 5:00", 2, "5:00", "50", "48", teams[0], teams[1], "", "", "", ())
+
+
+def _measure(build, games, history):
+    tracemalloc.start()
+    slate = [[build(game, snapshot) for snapshot in range(history)] for game in range(games)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, slate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=15, help="games on the slate")
+    parser.add_argument("--history", type=int, default=10, help="snapshots kept per game")
+    parser.add_argument("--number", type=int, default=2000, help="hash calls per timing")
+    args = parser.parse_args()
+
+    results = []
+    for label, build in (("dataclass + PlayerStats", _legacy_update), ("slots + BoxScore", _compact_update)):
+        size, slate = _measure(build, args.games, args.history)
+        update = slate[0][0]
+        players = (update.home_players, update.away_players)
+        hash_us = min(timeit.repeat(lambda: hash(players), number=args.number, repeat=3)) / args.number * 1e6
+        results.append((label, size, hash_us))
+
+    snapshots = args.games * args.history
+    for label, size, hash_us in results:
+        print(f"{label:24} {size / 1024:9.1f} KiB  {size / snapshots:8.0f} B/snapshot  hash {hash_us:6.2f} us")
+    (_, old_size, old_hash), (_, new_size, new_hash) = results
+    print(f"{'':24} {old_size / new_size:9.1f}x smaller      {'':19}{old_hash / new_hash:6.1f}x faster hash")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Micro-benchmark the feed's timestamp, clock and minutes parsers.
+
+Times services.time_parsing against the implementations it replaced
+(dateutil for gameTimeUTC, an uncompiled regex for clocks and a per-character
+isdigit join for minutes). dateutil is only needed for the comparison row.
+
+    python benchmarks/parse_time.py --number 100000
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.time_parsing import format_clock, parse_minutes, parse_utc_timestamp
+
+GAME_TIME = "2026-10-16T23:30:00Z"
+GAME_CLOCK = "PT08M47.00S"
+MINUTES = "PT33M"
+
+
+def _legacy_clock(raw_clock):
+    match_time = re.search(r'PT(\d+)M(\d+\.\d+)S', raw_clock)
+    return f"{match_time.group(1)}:{match_time.group(2).split('.')[0]}"
+
+
+def _legacy_minutes(raw_minutes):
+    return int(''.join(c for c in raw_minutes if c.isdigit()))
+
+
+def _cases():
+    cases = [
+        ("game clock", "regex.search", lambda: _legacy_clock(GAME_CLOCK), "format_clock", lambda: format_clock(GAME_CLOCK)),
+        ("minutes", "isdigit join", lambda: _legacy_minutes(MINUTES), "parse_minutes", lambda: parse_minutes(MINUTES)),
+    ]
+    try:
+        from dateutil import parser
+    except ImportError:
+        cases.insert(0, ("gameTimeUTC", None, None, "parse_utc_timestamp", lambda: parse_utc_timestamp(GAME_TIME)))
+    else:
+        cases.insert(0, ("gameTimeUTC", "dateutil.parse", lambda: parser.parse(GAME_TIME),
+                         "parse_utc_timestamp", lambda: parse_utc_timestamp(GAME_TIME)))
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100000, help="calls per measurement")
+    args = parser.parse_args()
+
+    def per_call_us(func):
+        return min(timeit.repeat(func, number=args.number, repeat=3)) / args.number * 1e6
+
+    for label, old_name, old_func, new_name, new_func in _cases():
+        new_us = per_call_us(new_func)
+        if old_func is None:
+            print(f"{label:12} {new_name:20} {new_us:7.2f} us  (dateutil not installed, no baseline)")
+            continue
+        old_us = per_call_us(old_func)
+        print(f"{label:12} {old_name:16} {old_us:7.2f} us -> {new_name:20} {new_us:7.2f} us  ({old_us / new_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""Benchmark the refresh pipeline end to end on synthetic slates, headless.
+
+For each slate size a synthetic night is written with benchmarks/fixtures.py
+and replayed at max speed through services.feed_archive. The data layer,
+the refresh worker and the widgets all run unmodified. Each measurement
+runs in its own offscreen interpreter, so module caches never leak between
+runs. Scenarios:
+
+  cells      main view only: one scoreboard request fills every card
+  detail     one live game's detail view open: adds its boxscore and play-by-play
+  all_games  data layer only: every started game's boxscore and play-by-play
+             fetched and parsed on every tick, no widgets
+
+Reports p50/p99 tick latency (worker refresh plus the GUI slots and paint
+it triggers), peak traced allocation per tick, requests and 304s per tick,
+box score model update time, parse cost, time to first paint (skeleton and
+filled slate) and logo preload time. With --output the results are saved as
+JSON; --compare prints them against an earlier results file.
+
+    python benchmarks/refresh_pipeline.py --output bench.json
+    python benchmarks/refresh_pipeline.py --slates 15 --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SLATES = (1, 15, 100)
+SCENARIOS = ("cells", "detail", "all_games")
+DEFAULT_TICKS = 40
+LOWER_IS_BETTER = ("_ms", "_kib", "_per_tick")  # Metrics --compare flags when they grow (not totals, which scale with --ticks)
+
+
+def _percentiles(values):
+    if not values:
+        return None
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+    return {"p50": round(pick(0.5), 3), "p99": round(pick(0.99), 3), "max": round(ordered[-1], 3)}
+
+# Child processes: each prints one JSON object on its last line
+
+
+def _child_ticks(scenario, ticks, trace_alloc):
+    import tracemalloc
+    from services.http_client import get_client
+    import fixtures
+
+    client = get_client()
+    result = {"tick_ms": [], "requests": [], "not_modified": 0, "alloc_kib": []}
+
+    if scenario == "all_games":
+        from services import api_services
+        from services.change_events import GameComponent
+        from services.game_state import GameState
+
+        def tick():
+            games, summaries = api_services.fetch_scoreboard()
+            started = [game.game_id for game in games if summaries[game.game_id].state is not GameState.SCHEDULED]
+            api_services.fetch_live_game_updates_many(started, dict.fromkeys(started, GameComponent.ALL))
+
+        def advance():
+            api_services.wait_time(fixtures.POLL_SECONDS)
+    else:
+        from PyQt5.QtWidgets import QApplication
+        import app as widget_app
+
+        qt_app = QApplication(sys.argv[:1])
+        window = widget_app.MainWindow(start_refresh=False)
+        window.show()
+        qt_app.processEvents()
+        worker = window.refresh_worker
+
+        started_at = time.perf_counter()
+        worker.start()  # First fetch: games list, every card, then arms the timer
+        worker.stop()
+        qt_app.processEvents()
+        result["first_tick_ms"] = (time.perf_counter() - started_at) * 1000
+
+        if scenario == "detail":
+            live_game_id = fixtures.first_live_game(len(window.games))
+            window.cell_clicked(live_game_id)  # Requests boxscore + play-by-play and fetches them at once
+            worker.stop()
+            qt_app.processEvents()
+            detail_view = window.game_detail_views[live_game_id]
+            box_score_ms = result["box_score_ms"] = []
+            update_box_score = detail_view.update_box_score
+
+            def timed_update_box_score(*args):
+                update_started = time.perf_counter()
+                update_box_score(*args)
+                box_score_ms.append((time.perf_counter() - update_started) * 1000)
+            detail_view.update_box_score = timed_update_box_score
+
+        def tick():
+            worker.refresh()  # Also moves the replay clock on to the next deadline
+            worker.stop()
+            qt_app.processEvents()
+
+        def advance():
+            pass
+
+    if trace_alloc:
+        tracemalloc.start()
+    for _ in range(ticks):
+        if client.finished:
+            break
+        requests_before = client.requests
+        if trace_alloc:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        tick_started = time.perf_counter()
+        tick()
+        result["tick_ms"].append((time.perf_counter() - tick_started) * 1000)
+        if trace_alloc:
+            result["alloc_kib"].append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+        result["requests"].append(client.requests - requests_before)
+        advance()
+    result["not_modified"] = client.not_modified
+
+    if scenario == "all_games":
+        result["parse_ms"] = _parse_cost(client.archive)
+    else:
+        from services import logo_handler
+        logo_handler.shutdown_logo_decoding()  # The event loop never ran, so aboutToQuit won't drain the pool
+    print(json.dumps(result))
+
+
+def _parse_cost(archive, repeat=20):
+    """Per-call time of the scoreboard and boxscore parsers on the night's last payloads"""
+    from services import api_services
+    from services.http_client import SCOREBOARD_ENDPOINT, BOXSCORE_ENDPOINT
+
+    def per_call_ms(func, arg):
+        started_at = time.perf_counter()
+        for _ in range(repeat):
+            func(arg)
+        return (time.perf_counter() - started_at) * 1000 / repeat
+
+    games = json.loads(archive.lookup(SCOREBOARD_ENDPOINT, archive.end)[1].body)['scoreboard']['games']
+    boxscores = [json.loads(payload.body)['game'] for payload in
+                 (archive.lookup(BOXSCORE_ENDPOINT.format(game_id=game['gameId']), archive.end)[1] for game in games)
+                 if payload is not None]
+    parse_scoreboard = lambda games: (api_services._parse_games_list(games), api_services._parse_game_summaries(games))
+    return {
+        "scoreboard_ms": round(per_call_ms(parse_scoreboard, games), 4),
+        "boxscore_ms": round(statistics.mean(per_call_ms(api_services._parse_boxscore, box) for box in boxscores), 4)
+        if boxscores else None,
+    }
+
+
+def _child_startup():
+    from PyQt5.QtCore import QEvent, QObject
+    from PyQt5.QtWidgets import QApplication
+    import app as widget_app
+
+    qt_app = QApplication(sys.argv[:1])
+
+    class PaintWatcher(QObject):
+        """Stamps the first paint, then the first paint after the games list reached the window"""
+        first_paint_at = slate_ready_at = slate_paint_at = None
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                if self.first_paint_at is None:
+                    self.first_paint_at = time.time()
+                elif self.slate_ready_at is not None and self.slate_paint_at is None:
+                    self.slate_paint_at = time.time()
+                    qt_app.quit()
+            return False
+
+        def slate_ready(self, games):
+            self.slate_ready_at = self.slate_ready_at or time.time()
+
+    watcher = PaintWatcher()
+    qt_app.installEventFilter(watcher)
+    window = widget_app.MainWindow()
+    window.refresh_worker.games_ready.connect(watcher.slate_ready)  # Queued after the window's own slot
+    window.show()
+    qt_app.exec_()  # Quitting drains the logo decode pool (aboutToQuit)
+    window.close()
+    print(json.dumps({"first_paint_at": watcher.first_paint_at, "slate_paint_at": watcher.slate_paint_at}))
+
+
+def _child_logos():
+    from PyQt5.QtWidgets import QApplication
+    from services import logo_handler
+
+    qt_app = QApplication(sys.argv[:1])
+    started_at = time.perf_counter()
+    logo_handler._preload_logos(sizes=(40, 60), device_pixel_ratio=1.0)
+    logo_handler.wait_for_logo_decodes()
+    qt_app.processEvents()  # Deliver the decoded images to the GUI thread
+    print(json.dumps({
+        "preload_ms": (time.perf_counter() - started_at) * 1000,
+        "atlas": logo_handler._atlas is not None and logo_handler._atlas.image is not None,
+        "decoded_logos": logo_handler.logo_cache_stats()["entries"],
+    }))
+
+# Parent
+
+
+def _run_child(mode, env, *extra):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", mode, *extra],
+        env=env, cwd=ROOT, capture_output=True, text=True,
+    )
+    if output.returncode != 0:
+        raise RuntimeError(f"{mode} benchmark failed:\n{output.stderr}")
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def _child_env(archive_path, cache_dir):
+    return dict(os.environ, QT_QPA_PLATFORM="offscreen", NBA_WIDGET_CACHE_DIR=cache_dir,
+                NBA_REPLAY_ARCHIVE=archive_path, NBA_REPLAY_SPEED="max",
+                PYTHONPATH=os.pathsep.join([os.path.dirname(os.path.abspath(__file__)), ROOT]))
+
+
+def bench_slate(games, ticks, startup_runs, trace_alloc, work_dir):
+    import fixtures
+    archive_path = os.path.join(work_dir, f"night-{games}.jsonl.gz")
+    fixtures.write_archive(archive_path, games, polls=ticks + 1)
+    env = _child_env(archive_path, work_dir)
+    slate = {}
+
+    startups = []
+    for _ in range(startup_runs):
+        launched_at = time.time()
+        stamps = _run_child("startup", env)
+        startups.append(((stamps["first_paint_at"] - launched_at) * 1000, (stamps["slate_paint_at"] - launched_at) * 1000))
+    slate["startup"] = {"first_paint_ms": round(statistics.median(first for first, _ in startups), 1),
+                        "slate_paint_ms": round(statistics.median(filled for _, filled in startups), 1)}
+
+    for scenario in SCENARIOS:
+        timed = _run_child("ticks", env, "--scenario", scenario, "--ticks", str(ticks))
+        result = {
+            "ticks": len(timed["tick_ms"]),
+            "tick_ms": _percentiles(timed["tick_ms"]),
+            "requests": sum(timed["requests"]),
+            "requests_per_tick": round(statistics.mean(timed["requests"]), 2) if timed["requests"] else 0,
+            "not_modified": timed["not_modified"],
+        }
+        for key in ("first_tick_ms", "parse_ms"):
+            if key in timed:
+                result[key] = timed[key] if key == "parse_ms" else round(timed[key], 2)
+        if "box_score_ms" in timed:
+            result["box_score_ms"] = _percentiles(timed["box_score_ms"])
+        if trace_alloc:
+            traced = _run_child("ticks", env, "--scenario", scenario, "--ticks", str(ticks), "--trace-alloc")
+            result["alloc_kib"] = _percentiles(traced["alloc_kib"])
+        slate[scenario] = result
+    return slate
+
+
+def _flatten(results, prefix=""):
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from _flatten(value, name)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+def compare(baseline, results, threshold):
+    """Print every shared metric against baseline; return the names that regressed past threshold."""
+    old = dict(_flatten(baseline.get("slates", {}), "slates"))
+    old.update(_flatten(baseline.get("logos", {}), "logos"))
+    new = dict(_flatten(results["slates"], "slates"))
+    new.update(_flatten(results["logos"], "logos"))
+    print(f"\nAgainst {baseline.get('commit') or 'baseline'}:")
+    if baseline.get("ticks") != results["ticks"]:
+        print(f"  (baseline ran {baseline.get('ticks')} ticks per scenario, this run {results['ticks']})")
+    regressed = []
+    for name, value in new.items():
+        if name not in old or not old[name]:
+            continue
+        ratio = value / old[name]
+        parts = name.split(".")
+        worse = (parts[-1] != "max"  # A single sample; too noisy to gate on
+                 and any(part.endswith(LOWER_IS_BETTER) for part in parts[-2:]) and ratio > 1 + threshold)
+        if worse:
+            regressed.append(name)
+        print(f"{'!' if worse else ' '} {name:52} {old[name]:10.2f} -> {value:10.2f}  ({ratio:.2f}x)")
+    return regressed
+
+
+def _print_results(results):
+    print(f"logo preload: {results['logos']['preload_ms']:.1f} ms "
+          f"({'atlas' if results['logos']['atlas'] else str(results['logos']['decoded_logos']) + ' files'})")
+    for games, slate in results["slates"].items():
+        startup = slate["startup"]
+        print(f"\n{games} games: first paint {startup['first_paint_ms']:.0f} ms, slate painted {startup['slate_paint_ms']:.0f} ms")
+        for scenario in SCENARIOS:
+            result = slate[scenario]
+            ticks = result["tick_ms"] or {"p50": 0, "p99": 0}
+            line = (f"  {scenario:10} {result['ticks']:3} ticks  p50 {ticks['p50']:8.2f} ms  p99 {ticks['p99']:8.2f} ms"
+                    f"  {result['requests_per_tick']:6.2f} req/tick  {result['not_modified']:4} x 304")
+            if result.get("alloc_kib"):
+                line += f"  alloc p50 {result['alloc_kib']['p50']:8.1f} KiB"
+            if result.get("box_score_ms"):
+                line += f"  box score p50 {result['box_score_ms']['p50']:.3f} ms"
+            if result.get("parse_ms"):
+                line += f"  parse: scoreboard {result['parse_ms']['scoreboard_ms']:.3f} ms, boxscore {result['parse_ms']['boxscore_ms']:.3f} ms"
+            print(line)
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slates", type=int, nargs="+", default=list(SLATES), help="slate sizes (games)")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="refresh ticks per scenario")
+    parser.add_argument("--startup-runs", type=int, default=3)
+    parser.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="with --compare, fail when a latency/allocation/request metric grows by more than this")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)
+    parser.add_argument("--trace-alloc", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child == "ticks":
+        _child_ticks(args.scenario, args.ticks, args.trace_alloc)
+        return 0
+    if args.child == "startup":
+        _child_startup()
+        return 0
+    if args.child == "logos":
+        _child_logos()
+        return 0
+
+    results = {"commit": _commit(), "python": platform.python_version(), "platform": platform.platform(),
+               "ticks": args.ticks, "slates": {}}
+    with tempfile.TemporaryDirectory() as work_dir:
+        results["logos"] = _run_child("logos", dict(os.environ, QT_QPA_PLATFORM="offscreen"))
+        results["logos"]["preload_ms"] = round(results["logos"]["preload_ms"], 2)
+        for games in args.slates:
+            results["slates"][str(games)] = bench_slate(games, args.ticks, args.startup_runs, not args.no_alloc, work_dir)
+    _print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressed = compare(json.load(baseline_file), results, args.threshold)
+        if regressed:
+            print(f"\n{len(regressed)} metrics regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Measure time from interpreter launch to the main window's first paint.
+
+Each run starts a fresh interpreter under the offscreen Qt platform with an
+empty response cache and the live API pointed at a closed port, so the
+number reflects only what the app does before it can draw: imports,
+widget construction and logo indexing. Exits non-zero when the median
+exceeds the target.
+
+    python benchmarks/startup_time.py --runs 5 --target-ms 400
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TARGET_MS = 400
+OFFLINE_BASE_URL = "http://127.0.0.1:9"
+
+
+def _measure_in_child():
+    """Runs inside the spawned interpreter: report wall time of the first paint."""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    from PyQt5.QtCore import QEvent, QObject
+    from PyQt5.QtWidgets import QApplication
+    import app as widget_app
+
+    qt_app = QApplication(sys.argv[:1])
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and not hasattr(self, "painted_at"):
+                self.painted_at = time.time()
+                qt_app.quit()
+            return False
+
+    first_paint = FirstPaintFilter()
+    qt_app.installEventFilter(first_paint)
+    window = widget_app.MainWindow()
+    window.show()
+    qt_app.exec_()
+    window.close()
+    print(json.dumps({"painted_at": first_paint.painted_at}))
+
+
+def measure_once(live_base_url):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", NBA_LIVE_BASE_URL=live_base_url)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env["NBA_WIDGET_CACHE_DIR"] = cache_dir
+        started_at = time.time()
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child"],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+    painted_at = json.loads(output.strip().splitlines()[-1])["painted_at"]
+    return (painted_at - started_at) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS)
+    parser.add_argument("--live-base-url", default=OFFLINE_BASE_URL,
+                        help="API base URL for the app under test (default: unreachable)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _measure_in_child()
+        return 0
+
+    timings = [measure_once(args.live_base_url) for _ in range(args.runs)]
+    median = statistics.median(timings)
+    print(f"time to first paint: median {median:.0f} ms, min {min(timings):.0f} ms, "
+          f"max {max(timings):.0f} ms over {args.runs} runs (target {args.target_ms:.0f} ms)")
+    return 0 if median <= args.target_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -37,6 +37,13 @@ else
   exit 3
 fi
 
+# Pack the team logos into a pre-scaled atlas, again whenever a logo changes (the app falls back to the files without it)
+ATLAS_INDEX="$ROOT_DIR/nba-logos/atlas/logos.json"
+if [ ! -f "$ATLAS_INDEX" ] || [ -n "$(find "$ROOT_DIR/nba-logos" -maxdepth 1 -name '*.png' -newer "$ATLAS_INDEX" -print -quit)" ]; then
+  echo "Building logo atlas..."
+  "$VENVDIR/bin/python" "$ROOT_DIR/scripts/build_logo_atlas.py" || echo "Logo atlas build failed; using logo files" >&2
+fi
+
 echo
 echo "Launching NBA Desktop Widget (app.py)..."
 cd "$ROOT_DIR"
@@ -0,0 +1,89 @@
+"""Pack nba-logos/*.png into one pre-scaled atlas image plus a JSON index.
+
+Every logo is smooth-scaled once, here, to each standard pixel size (the
+40 px card and 60 px header logos at 1x and 2x device pixel ratio) and laid
+out one size per row. The index maps NBA team IDs to tile rectangles, so at
+runtime a logo is a dict lookup plus a sub-rect copy out of an image decoded
+once. It also records each source file's mtime; the app ignores an atlas
+whose sources have changed since, so rerun this after replacing a logo.
+
+    python scripts/build_logo_atlas.py
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.logo_handler import ATLAS_VERSION
+from services.teams import TEAMS
+
+LOGOS_DIR = os.path.join(ROOT, "nba-logos")
+ATLAS_DIR = os.path.join(LOGOS_DIR, "atlas")
+ATLAS_IMAGE = "logos.png"
+ATLAS_INDEX = "logos.json"
+
+LOGICAL_SIZES = (40, 60)       # Card and detail-header logos
+DEVICE_PIXEL_RATIOS = (1, 2)
+
+def build_atlas(logos_dir=LOGOS_DIR, out_dir=ATLAS_DIR):
+    """Write the atlas image and index; return the index dict."""
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QImage, QPainter
+
+    pixel_sizes = sorted({size * ratio for size in LOGICAL_SIZES for ratio in DEVICE_PIXEL_RATIOS})
+    logos = []
+    for team in TEAMS:
+        source = f"{team.logo}.png"
+        image = QImage(os.path.join(logos_dir, source))
+        if image.isNull():
+            print(f"Skipping {team.city} {team.nickname}: no readable {source}")
+            continue
+        logos.append((team, source, image))
+
+    atlas = QImage(len(logos) * max(pixel_sizes), sum(pixel_sizes), QImage.Format_ARGB32_Premultiplied)
+    atlas.fill(Qt.transparent)
+    painter = QPainter(atlas)
+
+    teams = {}
+    y = 0
+    for pixels in pixel_sizes:
+        for column, (team, source, image) in enumerate(logos):
+            scaled = image.scaled(pixels, pixels, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            x = column * pixels
+            painter.drawImage(x, y, scaled)
+
+            entry = teams.setdefault(str(team.team_id), {
+                "name": team.nickname,
+                "source": source,
+                "mtime": os.path.getmtime(os.path.join(logos_dir, source)),
+                "tiles": {},
+            })
+            entry["tiles"][str(pixels)] = [x, y, scaled.width(), scaled.height()]
+        y += pixels
+    painter.end()
+
+    os.makedirs(out_dir, exist_ok=True)
+    if not atlas.save(os.path.join(out_dir, ATLAS_IMAGE)):
+        raise OSError(f"could not write {os.path.join(out_dir, ATLAS_IMAGE)}")
+    index = {"version": ATLAS_VERSION, "image": ATLAS_IMAGE, "pixel_sizes": pixel_sizes, "teams": teams}
+    with open(os.path.join(out_dir, ATLAS_INDEX), "w") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logos-dir", default=LOGOS_DIR)
+    parser.add_argument("--out-dir", default=ATLAS_DIR)
+    args = parser.parse_args()
+
+    index = build_atlas(args.logos_dir, args.out_dir)
+    print(f"Packed {len(index['teams'])} logos at {index['pixel_sizes']} px into {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
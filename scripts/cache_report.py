@@ -0,0 +1,86 @@
+"""Replay a recorded night through the data layer under a cache policy and report how the cache did.
+
+Serves ARCHIVE (see scripts/record_feeds.py) at max speed and asks the data
+layer for the scoreboard plus every started game's boxscore and play-by-play
+every STEP seconds of the night, as if every detail view were open. The cache
+policy decides what is actually refetched, so comparing runs shows what a
+policy costs in requests and bytes and what it gains in freshness (the oldest
+data served). --policy takes the NBA_CACHE_POLICY syntax.
+
+    python scripts/cache_report.py night.jsonl.gz
+    python scripts/cache_report.py night.jsonl.gz --policy live=10,clutch=3,halftime=120
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.change_events import GameComponent
+from services.game_cache import CachePolicy, SCOREBOARD_KEY
+from services.game_state import GameState
+from services.http_client import REPLAY_ARCHIVE_ENV, REPLAY_SPEED_ENV
+
+STEP = 1.0  # Seconds of the night between two asks, finer than any TTL
+COLUMNS = ("hits", "misses", "not_modified", "stale_serves", "bytes", "max_age", "hit_ratio")
+
+
+def replay(archive_path, policy, scoreboard_only=False):
+    """Replay the whole archive under policy; return the data layer's cache_stats()"""
+    os.environ[REPLAY_ARCHIVE_ENV] = archive_path
+    os.environ[REPLAY_SPEED_ENV] = "max"
+    from services import api_services
+    from services.http_client import get_client
+    api_services.set_cache_policy(policy)
+    client = get_client()
+
+    while not client.finished:
+        try:
+            games, summaries = api_services.fetch_scoreboard()
+            started = [game.game_id for game in games
+                       if game.game_id in summaries and summaries[game.game_id].state is not GameState.SCHEDULED]
+            if started and not scoreboard_only:
+                api_services.fetch_live_game_updates_many(started, dict.fromkeys(started, GameComponent.ALL))
+        except Exception as e:
+            print(f"Error replaying feeds: {e}")
+        api_services.wait_time(STEP)
+    return api_services.cache_stats()
+
+
+def _print_report(stats, minutes):
+    print(f"{'entry':18}" + "".join(f"{column:>14}" for column in COLUMNS))
+    rows = list(stats["entries"].items()) + [("total", stats["total"])]
+    for key, counters in rows:
+        label = key if key in (SCOREBOARD_KEY, "total") else f"{key} {counters['state']}"
+        print(f"{label[:18]:18}" + "".join(f"{'-' if counters[column] is None else round(counters[column], 3):>14}"
+                                          for column in COLUMNS))
+    total = stats["total"]
+    print(f"\n{total['misses'] / minutes:.1f} requests/min, {total['bytes'] / minutes / 1024:.0f} KiB/min "
+          f"over {minutes:.0f} minutes; {stats['games']} games cached, {stats['evictions']} evicted")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("archive", help="gzip archive recorded by scripts/record_feeds.py or app.py --record")
+    parser.add_argument("--policy", default="", help='TTL overrides, e.g. "live=10,clutch=3,final=none,max_games=32"')
+    parser.add_argument("--scoreboard-only", action="store_true", help="main view only: no boxscore or play-by-play")
+    parser.add_argument("--json", action="store_true", help="print cache_stats() as JSON instead of a table")
+    args = parser.parse_args()
+    try:
+        policy = CachePolicy.parse(args.policy)
+    except ValueError as e:
+        parser.error(str(e))
+
+    stats = replay(args.archive, policy, args.scoreboard_only)
+    from services.http_client import get_client
+    archive = get_client().archive
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        _print_report(stats, max((archive.end - archive.start) / 60, 1 / 60))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Record a game night's live feeds into a replayable archive, without the GUI.
+
+Polls the scoreboard plus every started game's boxscore and play-by-play
+through services.api_services, so each endpoint is fetched exactly as often
+as the app's state-based poll policy allows, and appends every changed
+payload to ARCHIVE (see services.feed_archive). Re-running appends to the
+same archive. Stops on Ctrl-C, or with --until-final once every game is final.
+
+    python scripts/record_feeds.py nights/2026-10-16.jsonl.gz --until-final
+    python app.py --replay nights/2026-10-16.jsonl.gz --replay-speed 10
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.change_events import GameComponent
+from services.game_state import GameState
+from services.http_client import RECORD_ARCHIVE_ENV
+
+POLL_EVERY = 2  # Seconds between passes; api_services only refetches what its poll policy says is due
+
+
+def record(archive_path, until_final=False):
+    os.environ[RECORD_ARCHIVE_ENV] = archive_path
+    from services import api_services
+    from services.http_client import get_client
+    recorder = get_client().recorder
+
+    while True:
+        try:
+            games, summaries = api_services.fetch_scoreboard()
+            started = [game.game_id for game in games
+                       if game.game_id in summaries and summaries[game.game_id].state is not GameState.SCHEDULED]
+            if started:
+                api_services.fetch_live_game_updates_many(started, dict.fromkeys(started, GameComponent.ALL))
+        except Exception as e:
+            print(f"Error recording feeds: {e}")
+            games, summaries = (), {}
+        print(f"\r{len(games)} games, {recorder.records} payloads recorded", end="", flush=True)
+
+        if until_final and games and all(summary.state is GameState.FINAL for summary in summaries.values()):
+            print("\nEvery game is final")
+            return
+        time.sleep(POLL_EVERY)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("archive", help="gzip archive to append to (created if missing)")
+    parser.add_argument("--until-final", action="store_true", help="stop once every game on the slate is final")
+    args = parser.parse_args()
+    try:
+        record(args.archive, args.until_final)
+    except KeyboardInterrupt:
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,147 @@
-from datetime import timezone
-from dateutil import parser
-from nba_api.live.nba.endpoints import scoreboard, boxscore, playbyplay
-import re, time
-from dataclasses import dataclass
-from typing import List, Dict
-
-@dataclass
+import asyncio, json, sqlite3, threading
+from services.pbp_store import PlayByPlayStore
+from services.disk_cache import ResponseCache
+from services import perf
+from services.time_parsing import parse_utc_timestamp, parse_duration, format_clock, parse_minutes
+from services.game_state import GameState, classify_game
+from services.game_cache import GameCache, GameEntry, CacheStats, CachePolicy, COMPONENTS, policy_from_environment
+from services.change_events import GameComponent
+from services.box_score import BoxScore, PlayerStats, EMPTY_BOX_SCORE
+from services.http_client import get_client, NOT_MODIFIED, SCOREBOARD_ENDPOINT, BOXSCORE_ENDPOINT, PLAYBYPLAY_ENDPOINT
+from dataclasses import dataclass, replace
+from typing import List, Dict, Optional, Tuple
+
+@dataclass(frozen=True, slots=True)
 class Game:
     game_id: str
     game_time: str
     home_team: str
     away_team: str
+    start_time: float = 0.0  # Tip-off as a UTC timestamp
+    home_team_id: int = 0    # NBA teamId, see services.teams
+    away_team_id: int = 0
 
-@dataclass
-class PlayerStats:
-    player_name: str
-    minutes_played: int
-    points: int
-    rebounds: int
-    assists: int
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameUpdate:
     status: str
     period: int
     clock: str
     home_score: str
     away_score: str
-    home_players: List[PlayerStats]
-    away_players: List[PlayerStats]
+    home_players: BoxScore  # Columnar, sorted by minutes played
+    away_players: BoxScore
+    best_home_player: str
+    best_away_player: str
+    best_overall_player: str
+    recent_plays: Tuple[str, ...]
+    last_action_number: int = 0
+    state: GameState = GameState.UNKNOWN
+
+@dataclass(frozen=True, slots=True)
+class GameSummary:
+    """Scoreboard line for one game: everything a main-view card shows"""
+    status: str
+    period: int
+    clock: str
+    home_score: str
+    away_score: str
     best_home_player: str
     best_away_player: str
     best_overall_player: str
-    recent_plays: List[str]
+    state: GameState = GameState.UNKNOWN
+
+def now() -> float:
+    """Current time on the HTTP client's clock: the wall clock, or the recorded night's when replaying"""
+    return get_client().now()
+
+def wait_time(seconds: float) -> float:
+    """Wall-clock seconds until seconds have passed on now()'s clock"""
+    return get_client().wait_time(seconds)
+
+# Raw payloads persist across launches so a cold start can paint before the network answers
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+def _get_response_cache() -> ResponseCache:
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            if not get_client().persistent_cache:  # Recording or replaying
+                _response_cache = ResponseCache(":memory:")
+            else:
+                try:
+                    _response_cache = ResponseCache()
+                except (OSError, sqlite3.Error) as e:
+                    print(f"On-disk response cache unavailable, using memory: {e}")
+                    _response_cache = ResponseCache(":memory:")
+    return _response_cache
+
+async def _get_json(endpoint: str, stats: CacheStats, conditional=False):
+    """Decode endpoint's JSON, going through the on-disk response cache.
 
-def _fetch_games_list_fresh() -> List[Game]:
-    board = scoreboard.ScoreBoard()
-    games = board.games.get_dict()
+    A payload still inside its TTL (forever for final games) is served from
+    disk. Otherwise the stored validators are sent, so an unchanged payload
+    costs a 304, and the stored body is decoded (after a restart, say). With
+    conditional=True the caller still holds the last decoded payload, and
+    NOT_MODIFIED is returned instead of decoding it again.
+    The lookup is counted in stats, the cache entry endpoint belongs to.
+    """
+    cache = _get_response_cache()
+    current_time = now()
+    kind = endpoint.split("/", 1)[0]  # scoreboard / boxscore / playbyplay, the span name
+    entry = cache.get(endpoint)
+    if entry is not None and entry.is_fresh(current_time):
+        perf.count("cache_hit")
+        stats.hit(current_time - entry.fetched_at)
+        if conditional:
+            return NOT_MODIFIED
+        with perf.span(f"json.loads {kind}", "parse"):
+            return json.loads(cache.body(endpoint))
 
+    perf.count("requests")
+    stats.misses += 1
+    with perf.span(f"GET {kind}", "net"):
+        if entry is not None:
+            response = await get_client().fetch(endpoint, entry.etag, entry.last_modified)
+        else:
+            response = await get_client().fetch(endpoint)
+    if response is NOT_MODIFIED:
+        perf.count("not_modified")
+        stats.not_modified += 1
+        cache.touch(endpoint, current_time)
+        if conditional:
+            return NOT_MODIFIED
+        with perf.span(f"json.loads {kind}", "parse"):
+            return json.loads(cache.body(endpoint))
+
+    stats.bytes += len(response.body)
+    with perf.span(f"json.loads {kind}", "parse"):
+        payload = json.loads(response.body)
+    cache.put(endpoint, response.body, response.etag, response.last_modified, current_time)
+    return payload
+
+# The fetchers below return NOT_MODIFIED when conditional=True and the payload hasn't changed
+
+async def _fetch_scoreboard_games_async(conditional=False) -> List[Dict]:
+    data = await _get_json(SCOREBOARD_ENDPOINT, _cache.scoreboard_stats, conditional)
+    return data if data is NOT_MODIFIED else data['scoreboard']['games']
+
+async def _fetch_boxscore_data_async(game_id: str, stats: CacheStats, conditional=False) -> Dict:
+    data = await _get_json(BOXSCORE_ENDPOINT.format(game_id=game_id), stats, conditional)
+    return data if data is NOT_MODIFIED else data['game']
+
+async def _fetch_playbyplay_actions_async(game_id: str, stats: CacheStats, conditional=False) -> List[Dict]:
+    data = await _get_json(PLAYBYPLAY_ENDPOINT.format(game_id=game_id), stats, conditional)
+    return data if data is NOT_MODIFIED else data['game']['actions']
+
+def _fetch_scoreboard_fresh() -> Tuple[List[Game], Dict[str, GameSummary]]:
+    games = get_client().run(_fetch_scoreboard_games_async(conditional=_cache.scoreboard is not None))
+    if games is NOT_MODIFIED:
+        return _cache.scoreboard
+    with perf.span("parse scoreboard", "parse"):
+        return _parse_games_list(games), _parse_game_summaries(games)
+
+def _parse_games_list(games: List[Dict]) -> List[Game]:
     if not games:
         return []
     
@@ -48,31 +152,66 @@ def _fetch_games_list_fresh() -> List[Game]:
         away_team = game['awayTeam']['teamName']
 
         #convert UTC to local time
-        game_time_utc = parser.parse(game["gameTimeUTC"])
-        game_time_ltz = game_time_utc.replace(tzinfo=timezone.utc).astimezone(tz=None)
+        game_time_utc = parse_utc_timestamp(game["gameTimeUTC"])
+        game_time_ltz = game_time_utc.astimezone(tz=None)
         # Convert to 12 hour clock format
         game_time_12hr_clock = game_time_ltz.strftime("%I:%M %p")
 
-        list_of_games.append(Game(game_id, game_time_12hr_clock, home_team, away_team))
+        list_of_games.append(Game(game_id, game_time_12hr_clock, home_team, away_team, game_time_utc.timestamp(),
+                                  game['homeTeam'].get('teamId', 0), game['awayTeam'].get('teamId', 0)))
     
-    list_of_games.sort(key=lambda x: x.game_time)
+    list_of_games.sort(key=lambda x: x.start_time)
 
     return list_of_games
 
-def _fetch_live_game_updates_fresh(game_id: str) -> GameUpdate:
+def _player_line(name: str, points, rebounds, assists) -> str:
+    return f"{name.split()[-1]}: {points} PTS, {rebounds} REB, {assists} AST"
 
+def _impact(points, rebounds, assists) -> float:
+    # How the "best player" on a card is chosen
+    return points + 1.5 * rebounds + 2 * assists
+
+def _parse_game_summaries(games: List[Dict]) -> Dict[str, GameSummary]:
+    """Build every game's card data from the scoreboard's own status, score and leader fields"""
+    summaries = {}
+    for game in games:
+        try:
+            leaders = game.get('gameLeaders') or {}
+            lines = []
+            for side in ('homeLeaders', 'awayLeaders'):
+                leader = leaders.get(side) or {}
+                if leader.get('name'): # Leaders are blank before tip-off
+                    stats = (leader.get('points', 0), leader.get('rebounds', 0), leader.get('assists', 0))
+                    lines.append((_impact(*stats), _player_line(leader['name'], *stats)))
+                else:
+                    lines.append((0, ""))
+            best_overall = max(lines)[1]
+
+            raw_clock = game.get('gameClock', '')
+            summaries[game['gameId']] = GameSummary(
+                game['gameStatusText'], game['period'], format_clock(raw_clock),
+                game['homeTeam']['score'], game['awayTeam']['score'],
+                lines[0][1], lines[1][1], best_overall,
+                classify_game(game.get('gameStatus', 0), game['gameStatusText'], game['period'], parse_duration(raw_clock)),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Error parsing scoreboard game {game.get('gameId')}: {e}")
+    return summaries
+
+def _empty_game_update() -> GameUpdate:
+    return GameUpdate("Not Started", 0, "--", "-", "-", EMPTY_BOX_SCORE, EMPTY_BOX_SCORE, "", "", "", ())
+
+@perf.timed("parse boxscore", "parse")
+def _parse_boxscore(game_data: Dict) -> GameUpdate:
+    """Parse a boxscore 'game' block into a GameUpdate without recent plays"""
     try:
-        box = boxscore.BoxScore(game_id)
-        game_data = box.game.get_dict()
         game_status = game_data['gameStatusText']
 
         # Get the clock and period
         period = game_data['period']
-        raw_clock = game_data['gameClock'] # Returns something like PT00M19.50S
-        match_time = re.search(r'PT(\d+)M(\d+\.\d+)S', raw_clock) # Outputs something like PT08M47.00S. We want 8:47
-        minutes = match_time.group(1)
-        seconds = match_time.group(2).split('.')[0]  # Remove decimal part
-        clock = f"{minutes}:{seconds}"  # In the form 00:00
+        raw_clock = game_data['gameClock']
+        clock = format_clock(raw_clock) # PT08M47.00S -> 08:47, '' before tip-off -> --
+        state = classify_game(game_data.get('gameStatus', 0), game_status, period, parse_duration(raw_clock))
 
         home_score = game_data['homeTeam']['score']
         away_score = game_data['awayTeam']['score']
@@ -80,116 +219,224 @@ def _fetch_live_game_updates_fresh(game_id: str) -> GameUpdate:
         home_players = game_data['homeTeam']['players']
         away_players = game_data['awayTeam']['players']
 
-        def fetch_player_stats(players: List[Dict]) -> List[PlayerStats]:
-            player_stats = []
+        def fetch_player_stats(players: List[Dict]) -> BoxScore:
+            rows = []
             for player in players:
-                player_name = player['name']
-                player_minutes_played_raw = player['statistics']['minutesCalculated'] #Returns something like PT33M
-                player_minutes_played = int(''.join(c for c in player_minutes_played_raw if c.isdigit())) #Returns only the numbers
-                player_points = player['statistics']['points']
-                player_rebounds = player['statistics']['reboundsTotal']
-                player_assists = player['statistics']['assists']
-                player_stats.append(PlayerStats(player_name, player_minutes_played, player_points, player_rebounds, player_assists))
-            player_stats = sorted(player_stats, key=lambda player:player.minutes_played, reverse=True) # Sort by minutes played in descending order
-            return player_stats
+                stats = player['statistics']
+                player_minutes_played = parse_minutes(stats['minutesCalculated']) #Returns something like PT33M
+                rows.append((player['name'], (
+                    player_minutes_played, stats['points'], stats['reboundsTotal'], stats['assists'],
+                    stats['fieldGoalsMade'], stats['fieldGoalsAttempted'],
+                    stats['threePointersMade'], stats['threePointersAttempted'],
+                    stats['freeThrowsMade'], stats['freeThrowsAttempted'],
+                    int(stats['plusMinusPoints']), stats['turnovers'], stats['steals'], stats['blocks'], stats['foulsPersonal'],
+                )))
+            rows.sort(key=lambda row: row[1][0], reverse=True) # Sort by minutes played in descending order
+            return BoxScore.from_rows(rows)
         
         home_player_stats = fetch_player_stats(home_players)
         away_player_stats = fetch_player_stats(away_players)
 
         def best_player(players: List[Dict]) -> str:
-            best = max(players, key=lambda x: x['statistics']['points'] + 1.5 * x['statistics']['reboundsTotal'] + 2 * x['statistics']['assists'])
-            return f"{best['name'].split()[-1]}: {best['statistics']['points']} PTS, {best['statistics']['reboundsTotal']} REB, {best['statistics']['assists']} AST"
+            if not players: # Rosters can be missing before tip-off
+                return ""
+            best = max(players, key=lambda x: _impact(x['statistics']['points'], x['statistics']['reboundsTotal'], x['statistics']['assists']))
+            return _player_line(best['name'], best['statistics']['points'], best['statistics']['reboundsTotal'], best['statistics']['assists'])
         
         best_home_player = best_player(home_players)
         best_away_player = best_player(away_players)
         best_overall_player = best_player(home_players+away_players)
 
-        pbp = playbyplay.PlayByPlay(game_id)
-        plays = pbp.get_dict()['game']['actions']
-        recent_plays = []
+        return GameUpdate(game_status, period, clock, home_score, away_score, home_player_stats, away_player_stats, best_home_player, best_away_player, best_overall_player, (), state=state)
 
-        if plays:
-            sorted_plays = sorted(plays, key=lambda x: x.get('actionNumber', 0), reverse=True)
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Error parsing boxscore: {e!r}")
+        return None
 
-            for play in sorted_plays[:5]:
-                match_time = re.search(r'PT(\d+)M(\d+\.\d+)S', play['clock'])
-                if match_time:
-                    minutes = match_time.group(1)
-                    seconds = match_time.group(2).split('.')[0]
-                    time_str = f"{minutes}:{seconds}"
+@perf.timed("parse playbyplay", "parse")
+def _parse_recent_plays(store: PlayByPlayStore, plays: List[Dict]) -> Tuple[str, ...]:
+    """Update a game's play-by-play window incrementally and return its recent plays"""
+    try:
+        store.ingest(plays)
+        return store.recent()
 
-                play_period = play.get('period', 0)
-                period_str = f"Q{play_period}" if play_period <= 4 else f"OT{play_period - 4}"
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Error parsing play-by-play: {e!r}")
+        return None
 
-                play_description = play.get('description', 'Unknown action')
-                play_text = f"{period_str} {time_str} | {play_description}"
-                recent_plays.append(play_text)
+def _merge_game_update(game_id: str, entry: GameEntry, game_data, plays):
+    """Combine freshly decoded components with the entry's last parsed snapshot.
 
-        recent_plays.reverse()
+    Either component may be NOT_MODIFIED, in which case the previous
+    snapshot's part is reused. Returns None if parsing failed.
+    """
+    previous = entry.parsed
+    # Nothing changed upstream: hand back the same snapshot, no JSON was decoded
+    if game_data is NOT_MODIFIED and plays is NOT_MODIFIED:
+        return previous
 
-        return GameUpdate(game_status, period, clock, home_score, away_score, home_player_stats, away_player_stats, best_home_player, best_away_player, best_overall_player, recent_plays)
+    box_update = previous if game_data is NOT_MODIFIED else _parse_boxscore(game_data)
+    if plays is NOT_MODIFIED:
+        recent_plays = previous.recent_plays if previous else ()
+    else:
+        recent_plays = _parse_recent_plays(entry.play_by_play(), plays)
+    if box_update is None or recent_plays is None:
+        entry.parsed = None
+        return None
 
-    except: return GameUpdate("Not Started", 0, "--", "-", "-", "", "", "", "", "", "")
+    store = entry.pbp
+    game_update = replace(box_update, recent_plays=recent_plays, last_action_number=store.last_action_number if store else 0)
+    entry.parsed = game_update
 
-# Cache data structures
-_games_list_cache = None
-_games_list_timestamp = 0
-_game_updates_cache = {}
-_game_updates_timestamp = {}
+    # Final games never change again (TTL None): keep their payloads on disk for good
+    disk_ttl = _cache.game_ttl(game_update)
+    cache = _get_response_cache()
+    cache.set_ttl(BOXSCORE_ENDPOINT.format(game_id=game_id), disk_ttl)
+    cache.set_ttl(PLAYBYPLAY_ENDPOINT.format(game_id=game_id), disk_ttl)
+    return game_update
 
-# Cache timeout settings
-GAMES_LIST_CACHE_TIMEOUT = 600  # 10 minutes for games list
-LIVE_GAME_CACHE_TIMEOUT = 5    # 5 seconds for live games
-FINAL_GAME_CACHE_TIMEOUT = 300  # 5 minutes for finished games
-FUTURE_GAME_CACHE_TIMEOUT = 60  # 1 minute for upcoming games
+async def _not_fetched():
+    return NOT_MODIFIED
 
-# Original fetch_games_list function with caching
-def fetch_games_list():
-    global _games_list_cache, _games_list_timestamp
-    current_time = time.time()
+async def _fetch_live_game_update_async(game_id: str, entry: GameEntry, components, current_time) -> GameUpdate:
+    """Fetch the requested components of one game and merge them into its last snapshot.
+
+    A component that isn't requested is treated like a 304 and keeps its
+    previous value; the boxscore is always fetched for a game seen for the first time.
+    If the fetch fails, the last snapshot is served stale and nothing is stamped
+    fresh, so the next call tries again.
+    """
+    previous = entry.parsed
+    fetched = components if previous is not None else components | GameComponent.BOXSCORE
+    if fetched & GameComponent.BOXSCORE:
+        game_data = _fetch_boxscore_data_async(game_id, entry.stats, conditional=previous is not None)
+    else:
+        game_data = _not_fetched()
+    if fetched & GameComponent.PLAYBYPLAY:
+        plays = _fetch_playbyplay_actions_async(game_id, entry.stats, conditional=entry.pbp is not None)
+    else:
+        plays = _not_fetched()
+    try:
+        game_data, plays = await asyncio.gather(game_data, plays)
+    except Exception:
+        if previous is None:
+            return _empty_game_update()
+        entry.stats.stale(current_time - min(entry.fetched_at.values(), default=current_time))
+        return previous
+
+    for component in COMPONENTS:
+        if fetched & component:
+            entry.fetched_at[component] = current_time
+    game_update = _merge_game_update(game_id, entry, game_data, plays)
+    return game_update if game_update is not None else _empty_game_update()
+
+async def _fetch_live_game_updates_many_async(components: Dict[str, GameComponent], current_time) -> Dict[str, GameUpdate]:
+    # Concurrency is bounded by the client's connection pool
+    game_updates = await asyncio.gather(*(
+        _fetch_live_game_update_async(game_id, _cache.game_entry(game_id), game_components, current_time)
+        for game_id, game_components in components.items()))
+    return dict(zip(components, game_updates))
+
+def _fetch_live_game_updates_fresh_many(components: Dict[str, GameComponent], current_time) -> Dict[str, GameUpdate]:
+    """Fetch each game's requested components in parallel; returns when the slowest finishes."""
+    return get_client().run(_fetch_live_game_updates_many_async(components, current_time))
+
+# Parsed scoreboard and per-game updates, fresh for as long as the cache policy allows
+# (set NBA_CACHE_POLICY or call set_cache_policy to tune it)
+_cache = GameCache(policy_from_environment())
+
+def cache_policy() -> CachePolicy:
+    return _cache.policy
+
+def set_cache_policy(policy: CachePolicy):
+    """Use policy for every freshness check from now on (and for the refresh worker's poll intervals)"""
+    _cache.set_policy(policy)
+
+def cache_stats() -> Dict:
+    """Hits, misses, 304s, stale serves, bytes and oldest data served, per entry and in total; see GameCache.stats"""
+    return _cache.stats()
+
+def scoreboard_poll_interval(games, summaries, current_time) -> float:
+    """Seconds until the scoreboard is due again: as soon as its most urgent game needs it"""
+    return _cache.policy.scoreboard_ttl(games, summaries, current_time)
+
+def game_poll_interval(state: GameState, tip_off: float = 0.0, current_time: float = 0.0) -> Optional[float]:
+    """Seconds until a game in state is due again under the cache policy; None once it is final"""
+    return _cache.policy.ttl(state, tip_off, current_time)
+
+@perf.timed("fetch_scoreboard", "fetch")
+def fetch_scoreboard():
+    """Return (games, {game_id: GameSummary}) from one scoreboard request.
+
+    The result stays fresh, in memory and on disk, for scoreboard_poll_interval.
+    """
+    current_time = now()
     
     # Check if cache is valid
-    if _games_list_cache is not None and current_time - _games_list_timestamp < GAMES_LIST_CACHE_TIMEOUT:
-        return _games_list_cache
+    if _cache.scoreboard_fresh(current_time):
+        _cache.scoreboard_stats.hit(current_time - _cache.scoreboard_fetched_at)
+        return _cache.scoreboard
     
     # Fetch fresh data
-    games = _fetch_games_list_fresh() 
+    games, summaries = _fetch_scoreboard_fresh()
     
     # Update cache
-    _games_list_cache = games
-    _games_list_timestamp = current_time
+    ttl = _cache.set_scoreboard(games, summaries, current_time)
+    _get_response_cache().set_ttl(SCOREBOARD_ENDPOINT, ttl)
     
-    return games
+    return _cache.scoreboard
+
+# Original fetch_games_list function with caching
+def fetch_games_list():
+    return fetch_scoreboard()[0]
 
 # Original fetch_live_game_updates with caching
-def fetch_live_game_updates(game_id):
-    global _game_updates_cache, _game_updates_timestamp
-    current_time = time.time()
-    
-    # Check if cache exists for this game
-    if game_id in _game_updates_cache and game_id in _game_updates_timestamp:
-        game_update = _game_updates_cache[game_id]
-        last_update_time = _game_updates_timestamp[game_id]
-        
-        # Determine appropriate cache timeout based on game state
-        if game_update and "Final" in game_update.status:
-            cache_timeout = FINAL_GAME_CACHE_TIMEOUT
-        elif game_update and ("PM" in game_update.status or "AM" in game_update.status):
-            cache_timeout = FUTURE_GAME_CACHE_TIMEOUT
+def fetch_live_game_updates(game_id, components=GameComponent.ALL):
+    return fetch_live_game_updates_many([game_id], {game_id: components})[game_id]
+
+@perf.timed("fetch_live_game_updates", "fetch")
+def fetch_live_game_updates_many(game_ids, components=None):
+    """Batched fetch_live_game_updates: stale components are refreshed concurrently.
+
+    components maps a game_id to the GameComponent flags its views need;
+    games not in it (or every game, when it is None) get all of them.
+    Returns a dict of game_id -> GameUpdate in the order of game_ids.
+    """
+    current_time = now()
+    game_updates = {}
+    stale = {}
+    for game_id in game_ids:
+        wanted = components.get(game_id, GameComponent.ALL) if components is not None else GameComponent.ALL
+        entry = _cache.game_entry(game_id)
+        stale_components = _cache.stale_components(entry, wanted, current_time)
+        if stale_components:
+            stale[game_id] = stale_components
         else:
-            cache_timeout = LIVE_GAME_CACHE_TIMEOUT
-        
-        # Return cached data if still valid
-        if current_time - last_update_time < cache_timeout:
-            return game_update
-    
-    # Fetch fresh data
-    game_update = _fetch_live_game_updates_fresh(game_id) 
-    
-    # Update cache
-    _game_updates_cache[game_id] = game_update
-    _game_updates_timestamp[game_id] = current_time
-    
-    return game_update
+            game_updates[game_id] = entry.update
 
+    if stale:
+        fresh_updates = _fetch_live_game_updates_fresh_many(stale, current_time)
+        for game_id, game_update in fresh_updates.items():
+            _cache.game_entry(game_id).update = game_update
+        game_updates.update(fresh_updates)
 
+    return {game_id: game_updates[game_id] for game_id in game_ids}
+
+def load_cached_snapshot():
+    """Parse the scoreboard held by the on-disk cache, without touching the network.
+
+    Returns (games, {game_id: GameSummary}) so the UI can paint immediately at
+    startup. Everything loaded here is revalidated by the next regular fetch.
+    """
+    try:
+        body = _get_response_cache().body(SCOREBOARD_ENDPOINT)
+        if body is None:
+            return [], {}
+        scoreboard_games = json.loads(body)['scoreboard']['games']
+        games, summaries = _parse_games_list(scoreboard_games), _parse_game_summaries(scoreboard_games)
+    except Exception as e:
+        print(f"Ignoring unreadable cached scoreboard: {e}")
+        return [], {}
+    # Seed the in-memory cache already expired, so it is revalidated right away
+    _cache.seed_scoreboard(games, summaries)
+    return games, summaries
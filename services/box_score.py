@@ -0,0 +1,88 @@
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Sequence, Tuple
+
+# Per-player stat fields, in PlayerStats order after the name
+STAT_FIELDS = (
+    "minutes_played", "points", "rebounds", "assists",
+    "field_goals_made", "field_goals_attempted",
+    "three_pointers_made", "three_pointers_attempted",
+    "free_throws_made", "free_throws_attempted",
+    "plus_minus", "turnovers", "steals", "blocks", "fouls",
+)
+# Unsigned 16-bit columns, except plus/minus which can go negative
+_TYPECODES = tuple('h' if field == "plus_minus" else 'H' for field in STAT_FIELDS)
+_FIELD_INDEX = {field: index for index, field in enumerate(STAT_FIELDS)}
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerStats:
+    player_name: str
+    minutes_played: int
+    points: int
+    rebounds: int
+    assists: int
+    field_goals_made: int
+    field_goals_attempted: int
+    three_pointers_made: int
+    three_pointers_attempted: int
+    free_throws_made: int
+    free_throws_attempted: int
+    plus_minus: int
+    turnovers: int
+    steals: int
+    blocks: int
+    fouls: int
+
+# BoxScore
+# One team's box score stored by column. It:
+
+# Keeps the roster as a tuple of names and each stat as a compact array ('H', or 'h' for +/-)
+# Is immutable by convention: the arrays are never written after construction,
+#   so views may hold on to them
+# Compares and hashes by value (names plus raw column bytes), so change detection
+#   never touches per-player objects
+# Still hands out PlayerStats rows for callers that want a record per player
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BoxScore:
+    names: Tuple[str, ...] = ()
+    columns: Tuple[array, ...] = tuple(array(typecode) for typecode in _TYPECODES)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, Sequence[int]]]) -> "BoxScore":
+        """Build from (player_name, stat values in STAT_FIELDS order) rows, keeping their order."""
+        rows = list(rows)
+        names = tuple(name for name, _ in rows)
+        columns = tuple(
+            array(typecode, (stats[index] for _, stats in rows))
+            for index, typecode in enumerate(_TYPECODES)
+        )
+        return cls(names, columns)
+
+    def column(self, field: str) -> array:
+        return self.columns[_FIELD_INDEX[field]]
+
+    def player(self, row: int) -> PlayerStats:
+        return PlayerStats(self.names[row], *(column[row] for column in self.columns))
+
+    def reordered(self, names: Sequence[str]) -> "BoxScore":
+        """The same players in the given order; names must be a permutation of self.names."""
+        index = {name: row for row, name in enumerate(self.names)}
+        rows = [index[name] for name in names]
+        columns = tuple(array(column.typecode, (column[row] for row in rows)) for column in self.columns)
+        return BoxScore(tuple(names), columns)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __eq__(self, other):
+        if not isinstance(other, BoxScore):
+            return NotImplemented
+        return self.names == other.names and self.columns == other.columns
+
+    def __hash__(self):
+        return hash((self.names, tuple(column.tobytes() for column in self.columns)))
+
+
+EMPTY_BOX_SCORE = BoxScore()
@@ -0,0 +1,113 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from services.box_score import BoxScore, EMPTY_BOX_SCORE, STAT_FIELDS
+
+# Display columns after "Player": (header, PlayerStats fields shown in the cell)
+BOX_SCORE_COLUMNS = (
+    ("MIN", ("minutes_played",)),
+    ("PTS", ("points",)),
+    ("REB", ("rebounds",)),
+    ("AST", ("assists",)),
+    ("FG", ("field_goals_made", "field_goals_attempted")),
+    ("3P", ("three_pointers_made", "three_pointers_attempted")),
+    ("FT", ("free_throws_made", "free_throws_attempted")),
+    ("+/-", ("plus_minus",)),
+    ("TO", ("turnovers",)),
+    ("STL", ("steals",)),
+    ("BLK", ("blocks",)),
+    ("PF", ("fouls",)),
+)
+HEADERS = ("Player",) + tuple(header for header, _ in BOX_SCORE_COLUMNS)
+MINUTES_COLUMN = 1
+
+# Role the proxy sorts by: the player name or the column's first stat as a number
+SORT_ROLE = Qt.UserRole
+
+# Table column of every stat field, so a changed value maps straight to a cell
+_FIELD_COLUMN = {field: column for column, (_, fields) in enumerate(BOX_SCORE_COLUMNS, start=1) for field in fields}
+
+# BoxScoreModel
+# Table model behind one team's box score. It:
+
+# Shares the incoming BoxScore's name tuple and stat arrays instead of copying them
+# Keeps row order stable while the roster is unchanged, even when the feed re-sorts it
+# Compares column by column and emits dataChanged only for the rows that changed
+# Resets only when the roster itself changes
+# Formats cells on demand (FG/3P/FT as made-attempted, signed +/-)
+
+class BoxScoreModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = EMPTY_BOX_SCORE.names
+        self._rows = {}  # player name -> row
+        self._columns = {field: EMPTY_BOX_SCORE.column(field) for field in STAT_FIELDS}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if column == 0:
+            if role in (Qt.DisplayRole, SORT_ROLE):
+                return self._names[row]
+            return None
+
+        fields = BOX_SCORE_COLUMNS[column - 1][1]
+        if role == Qt.DisplayRole:
+            if len(fields) == 2:
+                return f"{self._columns[fields[0]][row]}-{self._columns[fields[1]][row]}"
+            value = self._columns[fields[0]][row]
+            return f"{value:+d}" if fields[0] == "plus_minus" and value else str(value)
+        if role == SORT_ROLE:
+            return self._columns[fields[0]][row]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def set_players(self, box_score: BoxScore):
+        """Load a BoxScore, signalling only the cells that changed."""
+        if box_score.names != self._names:
+            if len(box_score) != len(self._names) or any(name not in self._rows for name in box_score.names):
+                self._reset(box_score)
+                return
+            box_score = box_score.reordered(self._names)  # Same roster, re-sorted by minutes: keep our rows
+
+        changed = {}  # column -> [first_row, last_row]
+        for field in STAT_FIELDS:
+            old_column, new_column = self._columns[field], box_score.column(field)
+            if old_column == new_column:
+                continue
+            rows = [row for row, (old, new) in enumerate(zip(old_column, new_column)) if old != new]
+            span = changed.setdefault(_FIELD_COLUMN[field], [rows[0], rows[-1]])
+            span[0] = min(span[0], rows[0])
+            span[1] = max(span[1], rows[-1])
+            self._columns[field] = new_column  # BoxScore columns are never written, so share them
+
+        for column, (first_row, last_row) in changed.items():
+            self.dataChanged.emit(self.index(first_row, column), self.index(last_row, column), [Qt.DisplayRole, SORT_ROLE])
+
+    def _reset(self, box_score):
+        self.beginResetModel()
+        self._names = box_score.names
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        self._columns = {field: box_score.column(field) for field in STAT_FIELDS}
+        self.endResetModel()
+
+
+def create_box_score_proxy(model, parent=None):
+    """Wrap model in a proxy that sorts numerically on any stat column."""
+    proxy = QSortFilterProxyModel(parent)
+    proxy.setSourceModel(model)
+    proxy.setSortRole(SORT_ROLE)
+    proxy.setDynamicSortFilter(True)
+    return proxy
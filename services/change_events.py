@@ -0,0 +1,73 @@
+from enum import IntFlag
+from typing import NamedTuple, Optional
+
+
+class GameChange(IntFlag):
+    """What changed between two snapshots of the same game."""
+    NONE = 0
+    SCORE = 1
+    PERIOD = 2
+    CLOCK = 4
+    STATUS = 8
+    FINAL = 16   # The game went final on this update
+    PLAYS = 32   # New, corrected or deleted play-by-play actions
+    STATS = 64   # Any player's box score line
+    ALL = SCORE | PERIOD | CLOCK | STATUS | PLAYS | STATS
+
+
+class GameComponent(IntFlag):
+    """Separately fetched and cached parts of a GameUpdate; views declare which they need."""
+    NONE = 0
+    BOXSCORE = 1    # Status, clock, scores and player lines
+    PLAYBYPLAY = 2  # Recent plays, the largest payload
+    SUMMARY = 4     # Scoreboard line (status, clock, scores, leaders); one request covers the slate
+    ALL = BOXSCORE | PLAYBYPLAY | SUMMARY
+
+
+class GameFingerprint(NamedTuple):
+    status: str
+    home_score: str
+    away_score: str
+    period: int
+    clock: str
+    last_action_number: int
+    plays_hash: int
+    stats_hash: int
+
+
+def fingerprint(game_update) -> GameFingerprint:
+    """Reduce a GameUpdate or GameSummary to the few values change detection compares."""
+    # A GameSummary has no plays or player lines; its leader lines stand in for the stats
+    return GameFingerprint(
+        game_update.status,
+        str(game_update.home_score),
+        str(game_update.away_score),
+        game_update.period,
+        game_update.clock,
+        getattr(game_update, "last_action_number", 0),
+        hash(getattr(game_update, "recent_plays", ())),
+        hash((getattr(game_update, "home_players", ()), getattr(game_update, "away_players", ()),
+              game_update.best_overall_player)),
+    )
+
+
+def diff_fingerprints(old: Optional[GameFingerprint], new: GameFingerprint) -> GameChange:
+    """Return the GameChange flags between two fingerprints (old may be None)."""
+    went_final = "Final" in new.status and (old is None or "Final" not in old.status)
+    changes = GameChange.FINAL if went_final else GameChange.NONE
+    if old is None:
+        return changes | GameChange.ALL
+
+    if old.home_score != new.home_score or old.away_score != new.away_score:
+        changes |= GameChange.SCORE
+    if old.period != new.period:
+        changes |= GameChange.PERIOD
+    if old.clock != new.clock:
+        changes |= GameChange.CLOCK
+    if old.status != new.status:
+        changes |= GameChange.STATUS
+    if old.last_action_number != new.last_action_number or old.plays_hash != new.plays_hash:
+        changes |= GameChange.PLAYS
+    if old.stats_hash != new.stats_hash:
+        changes |= GameChange.STATS
+    return changes
@@ -1,9 +1,14 @@
+from typing import TYPE_CHECKING
 from PyQt5.QtWidgets import (QWidget, QLabel, QHBoxLayout, QVBoxLayout, QTabWidget, QScrollArea,
-                             QTableWidget, QHeaderView, QTableWidgetItem, QPushButton)
+                             QTableView, QHeaderView, QPushButton)
 from PyQt5.QtCore import Qt, pyqtSignal
-from services.theme_handler import ThemedWidget
-from services.logo_handler import _load_logo_pixmap
-from services.api_services import Game, GameUpdate
+from services.logo_handler import _set_logo
+from services.box_score_model import BoxScoreModel, create_box_score_proxy, HEADERS, MINUTES_COLUMN
+from services.change_events import GameChange, GameComponent
+from services import perf
+
+if TYPE_CHECKING:
+    from services.api_services import Game, GameUpdate
 
 # GameDetailView
 # The expanded view for a single game when selected. It:
@@ -12,18 +17,22 @@ from services.api_services import Game, GameUpdate
 # Contains a tabbed interface with "Feed" and "Box Score" sections
 # Displays team logos, names, scores, and game status
 # Shows live game updates and recent plays
-# Presents player statistics in table format
+# Presents full player statistics in sortable model-backed tables
 # Has a back button to return to the main view
+# Needs play-by-play only while its Feed tab is showing, and says so when the tab changes
 
-class GameDetailView(QWidget, ThemedWidget):
+class GameDetailView(QWidget):
     back_signal = pyqtSignal()
+    components_changed = pyqtSignal()
+    SUBSCRIBED_CHANGES = GameChange.ALL
     
-    def __init__(self, game: Game, parent=None):
+    def __init__(self, game: "Game", parent=None):
         super().__init__(parent)
         self.game = game
         self.game_id = game.game_id
         self.game_update = None
-        self.is_dark_mode = False
+        self.feed_labels = []
+        self.rendered_plays = ()
         self.init_ui()
         
     def init_ui(self):
@@ -35,16 +44,18 @@ class GameDetailView(QWidget, ThemedWidget):
         
         # Back button
         self.back_button = QPushButton("← Back")
+        self.back_button.setObjectName("detailBackButton")
         self.back_button.setFixedWidth(80)
         self.back_button.clicked.connect(self.back_signal.emit)
         
         # Team layouts
-        self.home_logo, self.home_team_name, self.home_score, home_layout = self._create_header_team_layout(self.game.home_team)
-        self.away_logo, self.away_team_name, self.away_score, away_layout = self._create_header_team_layout(self.game.away_team)
+        self.home_logo, self.home_team_name, self.home_score, home_layout = self._create_header_team_layout(self.game.home_team_id, self.game.home_team)
+        self.away_logo, self.away_team_name, self.away_score, away_layout = self._create_header_team_layout(self.game.away_team_id, self.game.away_team)
         
         # Game status
         status_layout = QVBoxLayout()
         self.status_label = QLabel(self.game.game_time)
+        self.status_label.setObjectName("detailStatus")
         self.status_label.setAlignment(Qt.AlignCenter)
         status_layout.addWidget(self.status_label)
         
@@ -67,24 +78,29 @@ class GameDetailView(QWidget, ThemedWidget):
         self.tab_widget.addTab(self.feed_tab, "Feed")
         self.tab_widget.addTab(self.box_score_tab, "Box Score")
         
+        self.tab_widget.currentChanged.connect(self.components_changed.emit)
+        
         main_layout.addWidget(self.tab_widget)
         
-    def _create_header_team_layout(self, team_name):
+    def required_components(self) -> GameComponent:
+        """Data this view needs fetched while it is on screen"""
+        if self.tab_widget.currentWidget() is self.feed_tab:
+            return GameComponent.BOXSCORE | GameComponent.PLAYBYPLAY
+        return GameComponent.BOXSCORE
+
+    def _create_header_team_layout(self, team_id, team_name):
         layout = QHBoxLayout()
         
         logo = QLabel()
         logo.setFixedSize(60, 60)
         
-        # Load logo from disk on demand
-        pixmap = _load_logo_pixmap(team_name, 60)
-        if pixmap:
-            logo.setPixmap(pixmap)
-        else:
-            logo.setText(team_name)
+        # Decoded off the GUI thread on first use, then served from the LRU
+        _set_logo(logo, team_id, team_name, 60)
         
         name = QLabel(team_name)
+        name.setObjectName("detailTeamName")
         score = QLabel("--")
-        score.setStyleSheet("font-size: 24px; font-weight: bold;")
+        score.setObjectName("detailScore")
         
         layout.addWidget(logo)
         layout.addWidget(name)
@@ -103,8 +119,21 @@ class GameDetailView(QWidget, ThemedWidget):
         self.feed_layout.setAlignment(Qt.AlignTop)
         scroll.setWidget(content)
         
+        # Newest plays are at the bottom: stay pinned there unless the user scrolls up
+        self.feed_pinned = True
+        self.feed_scroll_bar = scroll.verticalScrollBar()
+        self.feed_scroll_bar.valueChanged.connect(self._on_feed_scrolled)
+        self.feed_scroll_bar.rangeChanged.connect(self._on_feed_range_changed)
+        
         layout.addWidget(scroll)
         return tab
+
+    def _on_feed_scrolled(self, value):
+        self.feed_pinned = value == self.feed_scroll_bar.maximum()
+
+    def _on_feed_range_changed(self, minimum, maximum):
+        if self.feed_pinned:
+            self.feed_scroll_bar.setValue(maximum)
     
     def _create_box_score_tab(self):
         tab = QWidget()
@@ -112,15 +141,17 @@ class GameDetailView(QWidget, ThemedWidget):
         
         # Home team box score
         self.home_box_score_label = QLabel(f"{self.game.home_team} Players")
-        self.home_box_score_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self.home_box_score_label.setObjectName("boxScoreLabel")
         
-        self.home_box_score = self._create_box_score_table()
+        self.home_box_score_model = BoxScoreModel(self)
+        self.home_box_score = self._create_box_score_table(self.home_box_score_model)
         
         # Away team box score
         self.away_box_score_label = QLabel(f"{self.game.away_team} Players")
-        self.away_box_score_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self.away_box_score_label.setObjectName("boxScoreLabel")
         
-        self.away_box_score = self._create_box_score_table()
+        self.away_box_score_model = BoxScoreModel(self)
+        self.away_box_score = self._create_box_score_table(self.away_box_score_model)
         
         layout.addWidget(self.home_box_score_label)
         layout.addWidget(self.home_box_score)
@@ -129,85 +160,119 @@ class GameDetailView(QWidget, ThemedWidget):
         
         return tab
     
-    def _create_box_score_table(self):
-        table = QTableWidget()
-        table.setColumnCount(5)
-        table.setHorizontalHeaderLabels(["Player", "MIN", "PTS", "REB", "AST"])
+    def _create_box_score_table(self, model):
+        table = QTableView()
+        table.setModel(create_box_score_proxy(model, table))
         table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        for i in range(1, 5):
+        for i in range(1, len(HEADERS)):
             table.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeToContents)
         table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableView.NoEditTriggers)
+        # Click a header to sort by that stat; minutes played first by default
+        table.setSortingEnabled(True)
+        table.sortByColumn(MINUTES_COLUMN, Qt.DescendingOrder)
         return table
     
-    def update_game_status(self, game_update: GameUpdate):
+    @perf.timed("GameDetailView.update_game_status", "ui")
+    def update_game_status(self, game_update: "GameUpdate"):
+        """Render a snapshot in full, e.g. when the view is opened"""
         if not game_update:
             return
-            
+
+        # Identical snapshot: nothing to redraw
+        if game_update is self.game_update or game_update == self.game_update:
+            return
+        self.apply_changes(game_update, GameChange.ALL)
+
+    @perf.timed("GameDetailView.apply_changes", "ui")
+    def apply_changes(self, game_update: "GameUpdate", changes: GameChange):
+        """Redraw only the parts of the view covered by changes"""
         self.game_update = game_update
-        self.home_score.setText(str(game_update.home_score))
-        self.away_score.setText(str(game_update.away_score))
-        
-        if "Final" in game_update.status:
-            self.status_label.setText(f"{game_update.status}")
-        elif "PM" in game_update.status or "AM" in game_update.status:
-            self.status_label.setText(f"{self.game.game_time}")
-        else:
-            self.status_label.setText(f"Q{game_update.period} - {game_update.clock}")
+
+        if changes & (GameChange.SCORE | GameChange.STATUS | GameChange.PERIOD | GameChange.CLOCK):
+            self.home_score.setText(str(game_update.home_score))
+            self.away_score.setText(str(game_update.away_score))
+            
+            if "Final" in game_update.status:
+                self.status_label.setText(f"{game_update.status}")
+            elif "Not Started" in game_update.status or "PM" in game_update.status.upper() or "AM" in game_update.status.upper():
+                self.status_label.setText(f"{self.game.game_time}")
+            else:
+                self.status_label.setText(f"Q{game_update.period} - {game_update.clock}")
             
         # Update feed tab
-        self.update_feed(game_update.recent_plays)
+        if changes & GameChange.PLAYS:
+            self.update_feed(game_update.recent_plays)
         
         # Update box score tab
-        self.update_box_score(game_update.home_players, game_update.away_players)
+        if changes & GameChange.STATS:
+            self.update_box_score(game_update.home_players, game_update.away_players)
     
+    @perf.timed("GameDetailView.update_feed", "ui")
     def update_feed(self, recent_plays):
-        # Clear existing items
-        while self.feed_layout.count():
-            child = self.feed_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Add new items
-        for play in recent_plays:
-            play_label = QLabel(play)
-            play_label.setWordWrap(True)
-            self.feed_layout.addWidget(play_label)
-    
+        """Bring the feed in line with recent_plays, recycling labels instead of rebuilding"""
+        rendered = self.rendered_plays
+        if recent_plays == rendered:
+            return
+
+        shift = _feed_shift(rendered, recent_plays)
+        if shift is not None:
+            # The feed scrolled: move the `shift` oldest labels to the bottom with the newest plays
+            new_plays = recent_plays[len(rendered) - shift:]
+            for play in new_plays:
+                if shift:
+                    label = self.feed_labels.pop(0)
+                    self.feed_layout.removeWidget(label)
+                    label.setText(play)
+                    shift -= 1
+                else:
+                    label = self._create_feed_label(play)
+                self.feed_layout.addWidget(label)
+                self.feed_labels.append(label)
+            # Plays scrolled out with no replacement (e.g. a deletion at the tail)
+            for _ in range(shift):
+                self._remove_feed_label(0)
+        else:
+            # Corrections or deletions mid-feed: rewrite texts in place
+            for label, play in zip(self.feed_labels, recent_plays):
+                if label.text() != play:
+                    label.setText(play)
+            for play in recent_plays[len(self.feed_labels):]:
+                label = self._create_feed_label(play)
+                self.feed_layout.addWidget(label)
+                self.feed_labels.append(label)
+            while len(self.feed_labels) > len(recent_plays):
+                self._remove_feed_label(len(self.feed_labels) - 1)
+
+        self.rendered_plays = recent_plays
+
+    def _create_feed_label(self, play):
+        play_label = QLabel(play)
+        play_label.setObjectName("feedPlay")
+        play_label.setWordWrap(True)
+        return play_label
+
+    def _remove_feed_label(self, index):
+        label = self.feed_labels.pop(index)
+        self.feed_layout.removeWidget(label)
+        label.deleteLater()
+
+    @perf.timed("GameDetailView.update_box_score", "ui")
     def update_box_score(self, home_players, away_players):
-        def update_table(table, players):
-            table.setRowCount(len(players))
-            for i, player in enumerate(players):
-                table.setItem(i, 0, QTableWidgetItem(player.player_name))
-                table.setItem(i, 1, QTableWidgetItem(str(player.minutes_played)))
-                table.setItem(i, 2, QTableWidgetItem(str(player.points)))
-                table.setItem(i, 3, QTableWidgetItem(str(player.rebounds)))
-                table.setItem(i, 4, QTableWidgetItem(str(player.assists)))
-                
-        update_table(self.home_box_score, home_players)
-        update_table(self.away_box_score, away_players)
-            
-    def _apply_specific_theme(self, theme):
-        self.setStyleSheet(f"background-color: {theme['main_bg']}; color: {theme['text_color']};")
-        self.home_score.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {theme['text_color']};")
-        self.away_score.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {theme['text_color']};")
-        self.home_team_name.setStyleSheet(f"color: {theme['text_color']};")
-        self.away_team_name.setStyleSheet(f"color: {theme['text_color']};")
-        self.status_label.setStyleSheet(f"color: {theme['text_color']};")
-        self.home_box_score_label.setStyleSheet(f"font-weight: bold; font-size: 14px; color: {theme['text_color']};")
-        self.away_box_score_label.setStyleSheet(f"font-weight: bold; font-size: 14px; color: {theme['text_color']};")
-        
-        self.tab_widget.setStyleSheet(f"""
-            QTabWidget::pane {{ border: 1px solid {theme['border_color']}; }}
-            QTabBar::tab {{ background-color: {theme['tab_bg']}; color: {theme['tab_text']}; padding: 8px 12px; }}
-            QTabBar::tab:selected {{ background-color: {theme['tab_selected_bg']}; color: {theme['text_color']}; }}
-        """)
-        
-        self.home_box_score.setStyleSheet(f"QTableWidget {{ background-color: {theme['bg_color']}; color: {theme['text_color']}; }}")
-        self.away_box_score.setStyleSheet(f"QTableWidget {{ background-color: {theme['bg_color']}; color: {theme['text_color']}; }}")
-        self.back_button.setStyleSheet(f"QPushButton {{ background-color: {theme['tab_bg']}; color: {theme['text_color']}; }}")
-        
-        # Update feed labels
-        for i in range(self.feed_layout.count()):
-            widget = self.feed_layout.itemAt(i).widget()
-            if isinstance(widget, QLabel):
-                widget.setStyleSheet(f"padding: 5px; border-bottom: 1px solid {theme['border_color']}; color: {theme['text_color']};")
\ No newline at end of file
+        self.home_box_score_model.set_players(home_players)
+        self.away_box_score_model.set_players(away_players)
+
+
+def _feed_shift(rendered, recent_plays):
+    """Return how many plays scrolled off the top between two feeds, or None.
+
+    A shift s means rendered[s:] is the start of recent_plays, i.e. the old
+    feed can be reused by dropping s rows at the top and appending the rest.
+    At least one rendered play has to survive for the feeds to line up.
+    """
+    if not rendered:
+        return 0
+    for shift in range(len(rendered)):
+        if rendered[shift:] == recent_plays[:len(rendered) - shift]:
+            return shift
+    return None
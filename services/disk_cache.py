@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import NamedTuple, Optional
+
+CACHE_FILENAME = "responses.sqlite3"
+PRUNE_AFTER = 2 * 24 * 3600  # Drop payloads older than two days when the cache opens
+
+
+def default_cache_dir() -> str:
+    """Per-user cache directory; NBA_WIDGET_CACHE_DIR overrides it."""
+    override = os.environ.get("NBA_WIDGET_CACHE_DIR")
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "nba-desktop-widget")
+
+
+class CacheEntry(NamedTuple):
+    fetched_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+    ttl: Optional[float]  # None: never expires (final games)
+
+    def is_fresh(self, now: float) -> bool:
+        return self.ttl is None or now - self.fetched_at < self.ttl
+
+# ResponseCache
+# Persists raw endpoint payloads across launches. It:
+
+# Stores each endpoint's last body (zlib-compressed) in SQLite with its fetch time,
+#   HTTP validators and a status-aware TTL
+# Mirrors the small metadata rows in memory so freshness checks never hit disk
+# Reads a body back only when it has to be decoded (cold start, final games)
+# Is safe to call from the HTTP loop thread and the refresh worker
+
+class ResponseCache:
+    def __init__(self, path=None):
+        if path is None:
+            cache_dir = default_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+            path = os.path.join(cache_dir, CACHE_FILENAME)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " endpoint TEXT PRIMARY KEY, fetched_at REAL NOT NULL, etag TEXT,"
+            " last_modified TEXT, ttl REAL, body BLOB NOT NULL)"
+        )
+        self._conn.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - PRUNE_AFTER,))
+        self._conn.commit()
+        self._entries = {
+            endpoint: CacheEntry(fetched_at, etag, last_modified, ttl)
+            for endpoint, fetched_at, etag, last_modified, ttl in self._conn.execute(
+                "SELECT endpoint, fetched_at, etag, last_modified, ttl FROM responses"
+            )
+        }
+
+    def get(self, endpoint) -> Optional[CacheEntry]:
+        return self._entries.get(endpoint)
+
+    def body(self, endpoint) -> Optional[bytes]:
+        """Return the stored raw body for endpoint, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM responses WHERE endpoint = ?", (endpoint,)).fetchone()
+        return zlib.decompress(row[0]) if row else None
+
+    def put(self, endpoint, body: bytes, etag, last_modified, fetched_at, ttl=0.0):
+        """Store a freshly downloaded body. ttl=0 means revalidate on next use."""
+        entry = CacheEntry(fetched_at, etag, last_modified, ttl)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (endpoint, fetched_at, etag, last_modified, ttl, zlib.compress(body, 1)),
+            )
+            self._conn.commit()
+            self._entries[endpoint] = entry
+
+    def touch(self, endpoint, fetched_at):
+        """Record a successful revalidation (HTTP 304) of the stored body."""
+        self._update(endpoint, fetched_at=fetched_at)
+
+    def set_ttl(self, endpoint, ttl: Optional[float]):
+        """Set how long the stored body stays fresh; None keeps it forever."""
+        self._update(endpoint, ttl=ttl)
+
+    def _update(self, endpoint, **fields):
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is None or all(getattr(entry, name) == value for name, value in fields.items()):
+                return
+            entry = entry._replace(**fields)
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, ttl = ? WHERE endpoint = ?",
+                (entry.fetched_at, entry.ttl, endpoint),
+            )
+            self._conn.commit()
+            self._entries[endpoint] = entry
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,203 @@
+import bisect
+import gzip
+import json
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+from services.http_client import LiveDataClient, FetchedPayload, NOT_MODIFIED
+
+# An archive is a gzip stream of records, each a one-line JSON header
+#   {"t": fetched_at, "endpoint": ..., "etag": ..., "last_modified": ..., "size": n}
+# followed by the n raw body bytes and a newline. Every recording session
+# appends a new gzip member, which gzip readers treat as one stream.
+
+POLL_WINDOW = 1.0  # Records fetched this close together belong to one poll (one batch of requests)
+
+
+class ArchivedPayload(NamedTuple):
+    fetched_at: float
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+def parse_speed(value: str) -> Optional[float]:
+    """Replay speed from a CLI/env string: "max" (None) or a positive multiplier such as "1" or "10"."""
+    if value.strip().lower() == "max":
+        return None
+    speed = float(value)
+    if speed <= 0:
+        raise ValueError(f"Replay speed must be positive or 'max', got {value!r}")
+    return speed
+
+# FeedRecorder
+# Appends live payloads to an archive as they are fetched. It:
+
+# Writes the raw response body untouched, with its fetch time and validators
+# Skips a payload identical to the last one recorded for its endpoint, so polling
+#   a quiet feed costs nothing
+# Flushes after every record, so a crash loses at most the record being written
+# Is safe to call from the HTTP loop thread and the caller's thread alike
+
+class FeedRecorder:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = gzip.open(path, "ab")
+        self._last_bodies: Dict[str, int] = {}  # endpoint -> hash of the last body written
+        self._lock = threading.Lock()
+        self.records = 0
+
+    def record(self, endpoint: str, payload: FetchedPayload, fetched_at: Optional[float] = None):
+        body_hash = hash(payload.body)
+        with self._lock:
+            if self._file is None or self._last_bodies.get(endpoint) == body_hash:
+                return
+            self._last_bodies[endpoint] = body_hash
+            header = {
+                "t": time.time() if fetched_at is None else fetched_at,
+                "endpoint": endpoint,
+                "etag": payload.etag,
+                "last_modified": payload.last_modified,
+                "size": len(payload.body),
+            }
+            self._file.write(json.dumps(header, separators=(",", ":")).encode() + b"\n")
+            self._file.write(payload.body + b"\n")
+            self._file.flush()
+            self.records += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+# FeedArchive
+# A recorded archive loaded for replay. It:
+
+# Indexes every endpoint's payloads by fetch time for bisecting
+# Groups records into polls, so replay never lands between two requests of one batch
+# Tolerates a truncated tail (a recorder that was killed mid-write)
+# Answers "what did this endpoint serve at time t" and "when does anything change next"
+
+class FeedArchive:
+    def __init__(self, payloads: Dict[str, List[ArchivedPayload]]):
+        self._payloads = {endpoint: sorted(records, key=lambda record: record.fetched_at)
+                          for endpoint, records in payloads.items()}
+        self._times = {endpoint: [record.fetched_at for record in records]
+                       for endpoint, records in self._payloads.items()}
+        # One event per poll: the time its last request finished
+        self.event_times = []
+        for t in sorted(t for times in self._times.values() for t in times):
+            if self.event_times and t - self.event_times[-1] < POLL_WINDOW:
+                self.event_times[-1] = t
+            else:
+                self.event_times.append(t)
+
+    @classmethod
+    def load(cls, path: str) -> "FeedArchive":
+        payloads: Dict[str, List[ArchivedPayload]] = {}
+        with gzip.open(path, "rb") as archive:
+            try:
+                while True:
+                    line = archive.readline()
+                    if not line:
+                        break
+                    header = json.loads(line)
+                    body = archive.read(header["size"])
+                    if len(body) < header["size"] or archive.read(1) != b"\n":
+                        break
+                    payloads.setdefault(header["endpoint"], []).append(
+                        ArchivedPayload(header["t"], body, header["etag"], header["last_modified"]))
+            except (EOFError, gzip.BadGzipFile, ValueError) as e:
+                print(f"Archive {path} ends early, replaying what was read: {e}")
+        return cls(payloads)
+
+    @property
+    def start(self) -> float:
+        return self.event_times[0] if self.event_times else 0.0
+
+    @property
+    def end(self) -> float:
+        return self.event_times[-1] if self.event_times else 0.0
+
+    def endpoints(self) -> List[str]:
+        return list(self._payloads)
+
+    def __len__(self):
+        return sum(len(records) for records in self._payloads.values())
+
+    def lookup(self, endpoint: str, at: float):
+        """(index, payload) most recently recorded for endpoint at or before at, or (-1, None)."""
+        times = self._times.get(endpoint)
+        if not times:
+            return -1, None
+        index = bisect.bisect_right(times, at) - 1
+        return (index, self._payloads[endpoint][index]) if index >= 0 else (-1, None)
+
+    def next_event(self, after: float) -> Optional[float]:
+        index = bisect.bisect_right(self.event_times, after)
+        return self.event_times[index] if index < len(self.event_times) else None
+
+# ReplayClient
+# A LiveDataClient that serves an archive instead of the network. It:
+
+# Plugs in behind get_client(), so every fetch_* call in api_services runs unchanged
+# Keeps a virtual clock starting at the archive's first poll, which the data layer and
+#   the refresh worker read through now() / wait_time() in place of the wall clock
+# At speed N runs that clock N times faster than the wall clock from the first request
+# At max speed (None) only moves the clock when a caller waits, jumping ahead instead
+#   of sleeping, so a whole night replays as fast as it can be processed, deterministically
+# Serves the last payload recorded at or before the time of each run() call, with a
+#   per-record ETag, so conditional requests get NOT_MODIFIED exactly when the feed didn't change
+# Fails a request for anything not recorded yet, like a CDN 404
+
+class ReplayClient(LiveDataClient):
+    persistent_cache = False  # Replayed payloads must never reach the user's cache
+
+    def __init__(self, archive: FeedArchive, speed: Optional[float] = 1.0):
+        super().__init__(base_url="replay:")
+        self.archive = archive
+        self.speed = speed
+        self._virtual_now = archive.start  # Max speed: advanced by wait_time()
+        self._started_at = None            # Timed replay: wall clock at the first request
+        self._served_at = archive.start    # Virtual time the current run() serves
+        self.requests = 0
+        self.not_modified = 0
+
+    @classmethod
+    def open(cls, path: str, speed: Optional[float] = 1.0) -> "ReplayClient":
+        return cls(FeedArchive.load(path), speed)
+
+    def now(self) -> float:
+        if self.speed is None or self._started_at is None:
+            return self._virtual_now
+        return self.archive.start + (time.monotonic() - self._started_at) * self.speed
+
+    def wait_time(self, seconds: float) -> float:
+        if self.speed is not None:
+            return seconds / self.speed
+        if self.finished:
+            return seconds  # Nothing left to replay: idle at wall-clock pace instead of spinning
+        self._virtual_now += seconds
+        return 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self.now() >= self.archive.end
+
+    def run(self, coro, timeout=None):
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        self._served_at = self.now()
+        return super().run(coro, timeout)
+
+    async def fetch(self, endpoint, etag=None, last_modified=None):
+        self.requests += 1
+        index, payload = self.archive.lookup(endpoint, self._served_at)
+        if payload is None:
+            raise LookupError(f"Nothing recorded for {endpoint} by {self._served_at:.0f}")
+        replay_etag = f'"replay-{index}"'
+        if etag == replay_etag:
+            self.not_modified += 1
+            return NOT_MODIFIED
+        return FetchedPayload(payload.body, replay_etag, payload.last_modified)
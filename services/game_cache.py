@@ -0,0 +1,280 @@
+import math
+import os
+import threading
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+from services.change_events import GameComponent
+from services.game_state import GameState
+from services.pbp_store import PlayByPlayStore
+from services.poll_scheduler import POLL_INTERVALS, poll_interval
+
+MAX_SCOREBOARD_TTL = 600  # 10 minutes at most between scoreboard polls, even with no game live
+MAX_GAMES = 64            # Game entries kept before games from past days are evicted
+POLICY_ENV = "NBA_CACHE_POLICY"  # e.g. "live=10,clutch=3,max_games=32", see CachePolicy.parse
+SCOREBOARD_KEY = "scoreboard"    # The scoreboard's entry in stats(), next to one entry per game id
+STATE_NAMES = frozenset(state.value for state in GameState)  # Policy keys: live, clutch, halftime...
+
+# Components fetched independently, each with its own fetch time
+COMPONENTS = (GameComponent.BOXSCORE, GameComponent.PLAYBYPLAY)
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """How long cached feeds stay fresh in each game state, and how many games are kept.
+
+    A TTL of None keeps a game's data forever (final games). The refresh
+    worker polls on the same TTLs, so the policy sets the request volume.
+    """
+    ttls: Mapping[GameState, Optional[float]] = field(default_factory=lambda: MappingProxyType(dict(POLL_INTERVALS)))
+    max_scoreboard_ttl: float = MAX_SCOREBOARD_TTL
+    max_games: int = MAX_GAMES
+
+    def __post_init__(self):
+        # A zero, negative or NaN TTL would have the refresh worker poll the CDN in a tight loop
+        for state in GameState:
+            ttl = self.ttls.get(state)
+            if state not in self.ttls or (ttl is not None and not _positive(ttl)):
+                raise ValueError(f"{state.value} TTL must be a positive number of seconds or None, not {ttl!r}")
+        if not _positive(self.max_scoreboard_ttl):
+            raise ValueError(f"scoreboard TTL must be a positive number of seconds, not {self.max_scoreboard_ttl!r}")
+        if self.max_games < 1:
+            raise ValueError(f"max_games must be at least 1, not {self.max_games!r}")
+
+    def ttl(self, state: GameState, tip_off: float = 0.0, now: float = 0.0) -> Optional[float]:
+        """Seconds a game's data stays fresh in state; scheduled games stay fresh until shortly before tip_off"""
+        return poll_interval(state, tip_off, now, self.ttls)
+
+    def scoreboard_ttl(self, games, summaries, now: float) -> float:
+        """Seconds the scoreboard stays fresh: until its most urgent game needs it"""
+        ttls = [self.max_scoreboard_ttl]
+        for game in games:
+            summary = summaries.get(game.game_id)
+            ttl = self.ttl(summary.state if summary else GameState.UNKNOWN, game.start_time, now)
+            if ttl is not None:
+                ttls.append(ttl)
+        return min(ttls)
+
+    def with_ttls(self, **ttls: Optional[float]) -> "CachePolicy":
+        """Copy with some states' TTLs replaced: policy.with_ttls(live=10, clutch=3)"""
+        merged = dict(self.ttls)
+        for name, ttl in ttls.items():
+            merged[GameState(name)] = ttl
+        return replace(self, ttls=MappingProxyType(merged))
+
+    @classmethod
+    def parse(cls, spec: str) -> "CachePolicy":
+        """Build a policy from "state=seconds" pairs ("none" never expires), max_games=N and scoreboard=seconds.
+
+        Raises ValueError for an unknown key, a bad number, a TTL that is not a
+        positive finite number of seconds or max_games below 1.
+        """
+        policy, ttls = cls(), {}
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            key, _, value = (text.strip().lower() for text in item.partition("="))
+            if key == "max_games":
+                policy = replace(policy, max_games=int(value))
+            elif key == "scoreboard":
+                policy = replace(policy, max_scoreboard_ttl=float(value))
+            elif key in STATE_NAMES:
+                ttls[key] = None if value == "none" else float(value)
+            else:
+                raise ValueError(f"unknown cache policy key {key!r}")
+        return policy.with_ttls(**ttls)
+
+
+def _positive(seconds) -> bool:
+    return isinstance(seconds, (int, float)) and math.isfinite(seconds) and seconds > 0
+
+
+def policy_from_environment() -> CachePolicy:
+    """The policy NBA_CACHE_POLICY describes; the default one if it is unset or invalid"""
+    spec = os.environ.get(POLICY_ENV)
+    if not spec:
+        return CachePolicy()
+    try:
+        return CachePolicy.parse(spec)
+    except ValueError as e:
+        print(f"Warning: ignoring {POLICY_ENV}={spec!r} and using the default cache policy: {e}")
+        return CachePolicy()
+
+# CacheStats
+# Counts how well one cache entry (the scoreboard or one game) works. It:
+
+# Counts hits (answered from memory or from a fresh on-disk payload) and misses
+#   (a request went out), and how many of those misses the server answered with a 304
+# Counts stale serves: data handed out past its TTL, from disk at startup or
+#   because a refetch failed
+# Adds up the body bytes downloaded and tracks the oldest data served, in seconds,
+#   the freshness side of the request volume / freshness trade-off
+
+class CacheStats:
+    __slots__ = ("hits", "misses", "not_modified", "stale_serves", "bytes", "max_age")
+
+    def __init__(self):
+        self.hits = self.misses = self.not_modified = self.stale_serves = self.bytes = 0
+        self.max_age = 0.0
+
+    def hit(self, age: float):
+        self.hits += 1
+        self.max_age = max(self.max_age, age)
+
+    def stale(self, age: float):
+        self.stale_serves += 1
+        self.max_age = max(self.max_age, age)
+
+    def add(self, other: "CacheStats"):
+        for name in ("hits", "misses", "not_modified", "stale_serves", "bytes"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.max_age = max(self.max_age, other.max_age)
+
+    def as_dict(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {name: getattr(self, name) for name in self.__slots__} | {
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None}
+
+# GameEntry
+# Everything cached for one game. It:
+
+# Holds the last update handed out and the last one that parsed, which a 304 reuses
+# Stamps each component with its own fetch time
+# Owns the game's play-by-play window, so evicting the game frees it too
+
+class GameEntry:
+    __slots__ = ("update", "parsed", "fetched_at", "pbp", "stats", "on_slate")
+
+    def __init__(self, on_slate=True):
+        self.update = None
+        self.parsed = None
+        self.fetched_at: Dict[GameComponent, float] = {}
+        self.pbp: Optional[PlayByPlayStore] = None
+        self.stats = CacheStats()
+        self.on_slate = on_slate  # False once a newer scoreboard no longer lists the game (a past day's game)
+
+    def play_by_play(self) -> PlayByPlayStore:
+        if self.pbp is None:
+            self.pbp = PlayByPlayStore()
+        return self.pbp
+
+# GameCache
+# The data layer's in-memory cache of parsed feeds. It:
+
+# Keeps the last parsed scoreboard and one GameEntry per game, fresh for as long
+#   as the CachePolicy allows in the game's state
+# Answers which of a game's components have expired
+# Is bounded: past max_games entries, games no longer on the scoreboard (past days)
+#   are evicted, least recently used first; today's slate is never evicted
+# Keeps CacheStats per entry, and those of evicted games in the totals
+# Is read and written by the refresh worker and the HTTP loop thread (which runs
+#   while the worker waits on it); stats() may be called from any thread
+
+class GameCache:
+    def __init__(self, policy: Optional[CachePolicy] = None):
+        self.policy = policy or CachePolicy()
+        self.scoreboard = None  # (games, summaries) from the last parsed scoreboard
+        self.scoreboard_fetched_at = 0.0
+        self.scoreboard_ttl = 0.0
+        self.scoreboard_stats = CacheStats()
+        self.evictions = 0
+        self._slate = None  # Game ids on the last scoreboard
+        self._games: Dict[str, GameEntry] = {}  # Least recently used first
+        self._evicted = CacheStats()
+        self._lock = threading.Lock()
+
+    def set_policy(self, policy: CachePolicy):
+        """Apply policy from the next freshness check on; shrinking max_games evicts right away"""
+        self.policy = policy
+        with self._lock:
+            self._evict()
+
+    def scoreboard_fresh(self, now: float) -> bool:
+        return self.scoreboard is not None and now - self.scoreboard_fetched_at < self.scoreboard_ttl
+
+    def set_scoreboard(self, games, summaries, now: float) -> float:
+        """Store a freshly parsed scoreboard and return its TTL; games missing from it become evictable"""
+        self.scoreboard = games, summaries
+        self.scoreboard_fetched_at = now
+        self.scoreboard_ttl = self.policy.scoreboard_ttl(games, summaries, now)
+        with self._lock:
+            self._slate = frozenset(game.game_id for game in games)
+            for game_id, entry in self._games.items():
+                entry.on_slate = game_id in self._slate
+            self._evict()
+        return self.scoreboard_ttl
+
+    def seed_scoreboard(self, games, summaries):
+        """Hold a scoreboard read back from disk, already expired, so the next fetch revalidates it"""
+        self.scoreboard = games, summaries
+        self.scoreboard_fetched_at = self.scoreboard_ttl = 0.0
+        self.scoreboard_stats.stale_serves += 1
+
+    def game(self, game_id: str) -> Optional[GameEntry]:
+        return self._games.get(game_id)
+
+    def game_entry(self, game_id: str) -> GameEntry:
+        """game_id's entry, created if needed and marked most recently used"""
+        with self._lock:
+            entry = self._games.pop(game_id, None)
+            if entry is None:
+                entry = GameEntry(on_slate=self._slate is None or game_id in self._slate)
+            self._games[game_id] = entry
+            self._evict()
+        return entry
+
+    def game_ttl(self, game_update) -> Optional[float]:
+        """Seconds a game's update stays fresh in its state; None once it is final"""
+        return self.policy.ttl(game_update.state if game_update else GameState.UNKNOWN)
+
+    def stale_components(self, entry: GameEntry, components: GameComponent, now: float) -> GameComponent:
+        """The subset of components whose cached copy has expired; fresh ones count as hits"""
+        if entry.update is None:
+            return components
+        ttl = self.game_ttl(entry.update)
+
+        stale = GameComponent.NONE
+        for component in COMPONENTS:
+            if not components & component:
+                continue
+            fetched_at = entry.fetched_at.get(component)
+            if fetched_at is None or (ttl is not None and now - fetched_at >= ttl):
+                stale |= component
+            else:
+                entry.stats.hit(now - fetched_at)
+        return stale
+
+    def _evict(self):
+        excess = len(self._games) - self.policy.max_games
+        if excess <= 0:
+            return
+        past_games = [game_id for game_id, entry in self._games.items() if not entry.on_slate][:excess]
+        for game_id in past_games:
+            self._evicted.add(self._games.pop(game_id).stats)
+        self.evictions += len(past_games)
+
+    def __len__(self):
+        return len(self._games)
+
+    def stats(self) -> Dict:
+        """Cache stats: {"entries": {"scoreboard" or game id: counters}, "total": counters, "games", "evictions", "policy"}
+
+        Counters are CacheStats.as_dict(); game entries also carry the game's
+        state and whether it is on today's slate. The total includes evicted games.
+        """
+        with self._lock:
+            games = list(self._games.items())
+        total = CacheStats()
+        total.add(self._evicted)
+        total.add(self.scoreboard_stats)
+        entries = {SCOREBOARD_KEY: self.scoreboard_stats.as_dict() | {"ttl": self.scoreboard_ttl}}
+        for game_id, entry in games:
+            total.add(entry.stats)
+            state = entry.update.state if entry.update else GameState.UNKNOWN
+            entries[game_id] = entry.stats.as_dict() | {"state": state.value, "on_slate": entry.on_slate}
+        return {
+            "entries": entries,
+            "total": total.as_dict(),
+            "games": len(games),
+            "evictions": self.evictions,
+            "policy": {"ttls": {state.value: ttl for state, ttl in self.policy.ttls.items()},
+                       "max_scoreboard_ttl": self.policy.max_scoreboard_ttl, "max_games": self.policy.max_games},
+        }
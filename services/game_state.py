@@ -0,0 +1,40 @@
+from enum import Enum
+from typing import Optional, Tuple
+
+CLUTCH_SECONDS = 120  # Final two minutes of the fourth quarter or any overtime
+REGULATION_PERIODS = 4
+
+
+class GameState(Enum):
+    """Phase of a game, derived from the feed's gameStatus, period and clock."""
+    UNKNOWN = "unknown"      # Nothing could be parsed yet (request failed, bad payload)
+    SCHEDULED = "scheduled"
+    LIVE = "live"
+    CLUTCH = "clutch"        # Live, inside CLUTCH_SECONDS of the fourth quarter or overtime
+    BREAK = "break"          # Clock at 0:00 between quarters or before overtime
+    HALFTIME = "halftime"
+    FINAL = "final"
+
+
+def classify_game(game_status: int, status_text: str, period: int, clock: Optional[Tuple[int, int]]) -> GameState:
+    """Classify a game from boxscore/scoreboard fields.
+
+    game_status is the feed's gameStatus (1 scheduled, 2 in progress, 3 final)
+    and clock the (minutes, seconds) from time_parsing.parse_duration, or None
+    when the feed has no clock.
+    """
+    if game_status == 3 or status_text.startswith("Final"):
+        return GameState.FINAL
+    if game_status == 1 or period == 0:
+        return GameState.SCHEDULED
+    if "half" in status_text.lower():
+        return GameState.HALFTIME
+    if clock is None:
+        return GameState.LIVE
+
+    seconds_left = clock[0] * 60 + clock[1]
+    if seconds_left == 0:
+        return GameState.HALFTIME if period == 2 else GameState.BREAK
+    if period >= REGULATION_PERIODS and seconds_left <= CLUTCH_SECONDS:
+        return GameState.CLUTCH
+    return GameState.LIVE
@@ -0,0 +1,178 @@
+import asyncio
+import atexit
+import os
+import threading
+import time
+from typing import NamedTuple, Optional
+
+# Live data endpoints; point NBA_LIVE_BASE_URL at a local stub server to run offline
+LIVE_BASE_URL = os.environ.get("NBA_LIVE_BASE_URL", "https://cdn.nba.com/static/json/liveData")
+SCOREBOARD_ENDPOINT = "scoreboard/todaysScoreboard_00.json"
+BOXSCORE_ENDPOINT = "boxscore/boxscore_{game_id}.json"
+PLAYBYPLAY_ENDPOINT = "playbyplay/playbyplay_{game_id}.json"
+
+# Record-and-replay (see services.feed_archive); read when the client is first created
+RECORD_ARCHIVE_ENV = "NBA_RECORD_ARCHIVE"  # Append every fetched payload to this archive
+REPLAY_ARCHIVE_ENV = "NBA_REPLAY_ARCHIVE"  # Serve this archive instead of the network
+REPLAY_SPEED_ENV = "NBA_REPLAY_SPEED"      # "1" (real time), "10" (ten times faster) or "max"
+
+# Same browser-like headers nba_api sends to cdn.nba.com
+REQUEST_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36",
+}
+
+# Returned by fetch when a conditional request comes back 304 Not Modified
+NOT_MODIFIED = object()
+
+
+class FetchedPayload(NamedTuple):
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+MAX_CONNECTIONS = 8       # Upper bound on concurrent requests to the CDN
+KEEPALIVE_TIMEOUT = 60    # Seconds an idle pooled connection stays open
+REQUEST_TIMEOUT = 10      # Seconds before a single request is abandoned
+
+# LiveDataClient
+# The async HTTP backend for the live endpoints. It:
+
+# Runs a private asyncio event loop on a daemon thread
+# Shares one keep-alive aiohttp session, so TCP/TLS handshakes are paid once
+# Bounds concurrency with the connection pool size
+# Issues conditional requests from caller-supplied ETag / Last-Modified validators
+# Lets synchronous callers (the refresh worker) block on coroutines with run()
+# Hands every fresh payload to an optional FeedRecorder
+# Owns the clock the data layer runs on (the wall clock here; a virtual one when replaying)
+
+class LiveDataClient:
+    def __init__(self, base_url=LIVE_BASE_URL, max_connections=MAX_CONNECTIONS, recorder=None):
+        self.base_url = base_url.rstrip("/")
+        self.max_connections = max_connections
+        self.recorder = recorder
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def persistent_cache(self) -> bool:
+        """Whether callers may serve this client's payloads from the on-disk cache.
+
+        Not while recording: every payload has to reach the recorder.
+        """
+        return self.recorder is None
+
+    def now(self) -> float:
+        """Current time on this client's clock, which callers judge freshness and deadlines by."""
+        return time.time()
+
+    def wait_time(self, seconds: float) -> float:
+        """Wall-clock seconds to wait for seconds to pass on this client's clock."""
+        return seconds
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="nba-http", daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def run(self, coro, timeout=None):
+        """Run coro on the client loop and block the calling thread for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result(timeout)
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=KEEPALIVE_TIMEOUT)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=REQUEST_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            )
+        return self._session
+
+    async def fetch(self, endpoint, etag=None, last_modified=None):
+        """GET base_url/endpoint on the pooled session and return its raw body.
+
+        When validators are given they are sent as If-None-Match /
+        If-Modified-Since, and NOT_MODIFIED is returned on a 304 without
+        reading a body.
+        """
+        session = await self._get_session()
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        async with session.get(f"{self.base_url}/{endpoint}", headers=headers) as response:
+            if response.status == 304:
+                return NOT_MODIFIED
+            response.raise_for_status()
+            body = await response.read()
+            payload = FetchedPayload(body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        if self.recorder is not None:
+            self.recorder.record(endpoint, payload)
+        return payload
+
+    async def _close_session(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def close(self):
+        """Close the pooled session, the recorder and stop the loop thread."""
+        if self.recorder is not None:
+            self.recorder.close()
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_session(), loop).result(2)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _client_from_environment() -> LiveDataClient:
+    replay_path = os.environ.get(REPLAY_ARCHIVE_ENV)
+    if replay_path:
+        from services.feed_archive import ReplayClient, parse_speed
+        return ReplayClient.open(replay_path, parse_speed(os.environ.get(REPLAY_SPEED_ENV, "1")))
+    record_path = os.environ.get(RECORD_ARCHIVE_ENV)
+    if record_path:
+        from services.feed_archive import FeedRecorder
+        return LiveDataClient(recorder=FeedRecorder(record_path))
+    return LiveDataClient()
+
+
+def get_client() -> LiveDataClient:
+    """Return the process-wide client, creating it on first use.
+
+    That is a LiveDataClient, recording if NBA_RECORD_ARCHIVE is set, or a
+    ReplayClient when NBA_REPLAY_ARCHIVE names an archive.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = _client_from_environment()
+            atexit.register(_client.close)
+    return _client
+
+
+def set_client(client: LiveDataClient):
+    """Install client as the process-wide client (benchmarks and tools); call before the first fetch."""
+    global _client
+    with _client_lock:
+        _client = client
+        atexit.register(client.close)
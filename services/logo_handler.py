@@ -1,9 +1,126 @@
+import atexit
+import json
 import os
 import re
+from collections import OrderedDict
+from services.teams import TEAMS, team_by_id, find_team
 
-# In-memory caches populated at startup by _preload_logos
-_logo_cache = {}
+LOGO_CACHE_BYTES = 4 * 1024 * 1024  # Decoded pixmaps kept across all teams, sizes and pixel ratios
+LOGOS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nba-logos")
+# Built by scripts/build_logo_atlas.py; per-file loading is the fallback when it's missing
+ATLAS_INDEX_PATH = os.path.join(LOGOS_DIR, "atlas", "logos.json")
+ATLAS_VERSION = 2  # Bump when the index layout changes; older atlases are ignored until rebuilt
+ATLAS_KEY = ("atlas", 0, 0.0)  # Loader key of the atlas image itself
+
+# _logo_lookup and _atlas are filled by _index_logos; decoded pixmaps live in the LogoCache
 _logo_lookup = {}
+_atlas = None
+
+# LogoCache
+# Least-recently-used store of decoded, scaled logo pixmaps. It:
+
+# Keys each pixmap by (team ID, logical size, devicePixelRatio), so HiDPI variants coexist
+# Charges every entry its pixel memory and evicts the oldest once over max_bytes
+# Counts hits and misses so the cache can be sized from real use
+
+class LogoCache:
+    def __init__(self, max_bytes=LOGO_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._pixmaps = OrderedDict()  # key -> (pixmap, cost), oldest first
+
+    def get(self, key):
+        entry = self._pixmaps.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._pixmaps.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, pixmap):
+        cost = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        previous = self._pixmaps.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= previous[1]
+        self._pixmaps[key] = (pixmap, cost)
+        self.total_bytes += cost
+        while self.total_bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, (_, evicted_cost) = self._pixmaps.popitem(last=False)
+            self.total_bytes -= evicted_cost
+
+    def __len__(self):
+        return len(self._pixmaps)
+
+    def __contains__(self, key):
+        return key in self._pixmaps
+
+    def stats(self):
+        return {"entries": len(self._pixmaps), "bytes": self.total_bytes, "hits": self.hits, "misses": self.misses}
+
+
+_logo_cache = LogoCache()
+
+# LogoAtlas
+# Index of the prebuilt logo atlas. It:
+
+# Maps (NBA team ID, pixel size) to a tile rectangle
+# Refuses an index of another version, or one whose logo files changed after it was built
+# Holds the atlas as one QImage once the loader has decoded it in the background
+# Answers a logo as a sub-rect copy, for the pixel sizes the atlas was built at
+
+class LogoAtlas:
+    def __init__(self, index, image_path):
+        self.image_path = image_path
+        self.image = None  # QImage, set by the loader
+        self._tiles = {
+            (int(team_id), int(pixels)): tuple(rect)
+            for team_id, team in index["teams"].items()
+            for pixels, rect in team["tiles"].items()
+        }
+
+    @classmethod
+    def load(cls, index_path=ATLAS_INDEX_PATH, logos_dir=LOGOS_DIR):
+        """Read the atlas index (one small JSON file); None if there is no usable atlas."""
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+            image_path = os.path.join(os.path.dirname(index_path), index["image"])
+            if not os.path.exists(image_path):
+                return None
+            if index.get("version") != ATLAS_VERSION:
+                print(f"Logo atlas is version {index.get('version')}, expected {ATLAS_VERSION}; "
+                      f"loading logo files instead (rerun scripts/build_logo_atlas.py)")
+                return None
+            stale = cls._stale_sources(index, logos_dir)
+            if stale:
+                print(f"Logo atlas is out of date for {', '.join(stale)}; "
+                      f"loading logo files instead (rerun scripts/build_logo_atlas.py)")
+                return None
+            return cls(index, image_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Logo atlas unavailable, loading logo files instead: {e}")
+            return None
+
+    @staticmethod
+    def _stale_sources(index, logos_dir):
+        """Source files that are missing or were modified since the atlas was built (one stat per team)"""
+        stale = []
+        for team in index["teams"].values():
+            try:
+                modified = os.path.getmtime(os.path.join(logos_dir, team["source"]))
+            except OSError:
+                modified = None
+            if modified != team["mtime"]:
+                stale.append(team["source"])
+        return stale
+
+    def tile(self, team_id: int, pixels: int):
+        return self._tiles.get((team_id, pixels))
 
 
 def _generate_logo_candidates(team_name: str):
@@ -57,18 +174,16 @@ def _generate_logo_candidates(team_name: str):
 def _find_logo_file(team_name: str):
     """Return an existing logo file path for team_name or None.
 
-    Looks in the local `nba-logos/` folder and tries several filename patterns.
+    Looks in the `nba-logos/` folder and tries several filename patterns.
     """
-    # Check in-memory lookup first (populated by _preload_logos)
+    # Check in-memory lookup first (populated by _index_logos)
     candidates = _generate_logo_candidates(team_name)
     for stem in candidates:
         if stem in _logo_lookup:
             return _logo_lookup[stem]
 
     # Fallback: attempt to find a matching image file on disk using candidates
-    logos_dir = os.path.join(os.path.dirname(__file__), "nba-logos")
-    if not os.path.isdir(logos_dir):
-        logos_dir = "nba-logos"
+    logos_dir = LOGOS_DIR
 
     for stem in candidates:
         for variant in (f"{stem}.png", f"{stem}.PNG", f"{stem}.jpg", f"{stem}.jpeg"):
@@ -83,14 +198,18 @@ def _find_logo_file(team_name: str):
     return None
 
 
-def _preload_logos(sizes=(40, 60)):
-    """Scan `nba-logos/`, populate `_logo_lookup` (stem -> abs path) and
-    preload scaled QPixmaps into `_logo_cache` for the provided sizes.
+def _index_logos():
+    """Scan `nba-logos/` and populate `_logo_lookup` (stem -> abs path),
+    and read the logo atlas index if it has been built.
+
+    Only lists the directory and reads one small JSON file, so it is cheap
+    enough to run before the first paint; images are decoded on demand.
     """
-    logos_dir = os.path.join(os.path.dirname(__file__), "nba-logos")
-    if not os.path.isdir(logos_dir):
-        logos_dir = "nba-logos"
+    global _atlas
+    if _atlas is None:
+        _atlas = LogoAtlas.load()
 
+    logos_dir = LOGOS_DIR
     try:
         files = os.listdir(logos_dir)
     except Exception:
@@ -111,58 +230,192 @@ def _preload_logos(sizes=(40, 60)):
             if c not in _logo_lookup:
                 _logo_lookup[c] = abs_path
 
-    # Try to preload pixmaps for requested sizes if PyQt is available
-    try:
-        from PyQt5.QtGui import QPixmap
+
+def _logo_loader():
+    """Return the GUI-thread object that turns decoded QImages into cached pixmaps."""
+    global _loader
+    if _loader is None:
+        from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+        from PyQt5.QtGui import QImage, QPixmap
         from PyQt5.QtCore import Qt
-        qt_available = True
-    except Exception:
-        qt_available = False
 
-    if not qt_available:
+        class LogoDecodeTask(QRunnable):
+            """Decode and smooth-scale one logo file as a QImage on a pool thread"""
+            def __init__(self, loader, key, path, pixels):
+                super().__init__()
+                self.loader, self.key, self.path, self.pixels = loader, key, path, pixels
+
+            def run(self):
+                image = QImage(self.path)
+                if not image.isNull() and self.pixels:
+                    image = image.scaled(self.pixels, self.pixels, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                self.loader.decoded.emit(self.key, image)
+
+        # LogoLoader
+        # Bridges the decode pool and the GUI thread. It:
+
+        # Queues each (team, size, dpr) decode once, however many labels wait for it
+        # Converts finished QImages to QPixmaps on the GUI thread (pixmaps aren't thread-safe)
+        # Stores them in the LogoCache and hands them to every waiting label still alive
+        # Decodes the atlas image the same way, once, and keeps it on the LogoAtlas
+        # Owns its decode pool and drains it when the application quits (or the interpreter
+        #   exits), so no task emits into a loader that is being torn down
+
+        class LogoLoader(QObject):
+            decoded = pyqtSignal(object, QImage)
+
+            def __init__(self):
+                super().__init__()
+                self._pool = QThreadPool(self)
+                self._waiting = {}  # key -> [callback]
+                self._shut_down = False
+                self.decoded.connect(self._on_decoded)
+                app = QCoreApplication.instance()
+                if app is not None:
+                    app.aboutToQuit.connect(self.shutdown)
+
+            def request(self, key, path, callback=None, pixels=None):
+                """Decode path (scaled to pixels when given) and call callback with the result"""
+                if self._shut_down:
+                    return
+                waiting = self._waiting.get(key)
+                if waiting is None:
+                    waiting = self._waiting[key] = []
+                    self._pool.start(LogoDecodeTask(self, key, path, pixels))
+                if callback is not None:
+                    waiting.append(callback)
+
+            def wait(self):
+                """Block until every queued decode has run; results arrive with the next event processing"""
+                self._pool.waitForDone()
+
+            @pyqtSlot()
+            def shutdown(self):
+                """Drop queued decodes and wait for the running ones; later requests are ignored"""
+                self._shut_down = True
+                self._pool.clear()
+                self._pool.waitForDone()
+
+            @pyqtSlot(object, QImage)
+            def _on_decoded(self, key, image):
+                global _atlas
+                if key == ATLAS_KEY:
+                    if image.isNull():
+                        print("Logo atlas image unreadable, loading logo files instead")
+                        _atlas = None
+                    elif _atlas is not None:
+                        _atlas.image = image
+                    for callback in self._waiting.pop(key, ()):
+                        callback(None)
+                    return
+
+                pixmap = None
+                if not image.isNull():
+                    pixmap = QPixmap.fromImage(image)
+                    pixmap.setDevicePixelRatio(key[2])
+                    _logo_cache.put(key, pixmap)
+                for callback in self._waiting.pop(key, ()):
+                    callback(pixmap)
+
+        _loader = LogoLoader()
+        atexit.register(shutdown_logo_decoding)  # Scripts that never run the event loop never see aboutToQuit
+    return _loader
+
+
+_loader = None
+
+
+def wait_for_logo_decodes():
+    """Block until every queued logo decode has finished (benchmarks and tools without an event loop)"""
+    if _loader is not None:
+        _loader.wait()
+
+
+def shutdown_logo_decoding():
+    """Stop background logo decoding; runs on aboutToQuit and at interpreter exit"""
+    if _loader is not None:
+        _loader.shutdown()
+
+
+def _preload_logos(sizes=(40, 60), device_pixel_ratio=1.0):
+    """Index `nba-logos/` and queue every logo at the given sizes for
+    background decoding, warming `_logo_cache` without blocking the GUI.
+    With a logo atlas only the atlas image itself needs decoding.
+    """
+    _index_logos()
+    if _atlas is not None:
+        _logo_loader().request(ATLAS_KEY, _atlas.image_path)
         return
-
-    for abs_path in set(_logo_lookup.values()):
+    for team in TEAMS:
         for size in sizes:
-            cache_key = f"{abs_path}::{size}"
-            if cache_key in _logo_cache:
-                continue
-            try:
-                pix = QPixmap(abs_path)
-                if not pix.isNull():
-                    scaled = pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    _logo_cache[cache_key] = scaled
-            except Exception:
-                continue
+            key = (team.team_id, size, device_pixel_ratio)
+            if key not in _logo_cache:
+                path = os.path.join(LOGOS_DIR, f"{team.logo}.png")
+                _logo_loader().request(key, path, pixels=round(size * device_pixel_ratio))
 
 
-def _load_logo_pixmap(team_name: str, size: int):
-    """Load and return a scaled QPixmap for team_name, or None if not found.
+def _set_logo(label, team_id: int, team_name: str, size: int):
+    """Show a team's logo in label at size x size.
 
-    Uses an internal cache keyed by absolute path + size to avoid repeated loads.
+    The team is resolved by teamId through services.teams; team_name is only
+    matched against the logo files for teams the registry doesn't know. A
+    cached pixmap is set immediately. Otherwise the logo is cut from the
+    prebuilt atlas, or its file is decoded off the GUI thread, and set when
+    ready. Falls back to the team name as text when there is no usable logo.
     """
-    try:
-        from PyQt5.QtGui import QPixmap
-        from PyQt5.QtCore import Qt
-    except Exception:
-        return None
-
-    logo_file = _find_logo_file(team_name)
-    if not logo_file:
-        return None
-
-    abs_path = os.path.abspath(logo_file)
-    cache_key = f"{abs_path}::{size}"
-    if cache_key in _logo_cache:
-        return _logo_cache[cache_key]
-
-    try:
-        pixmap = QPixmap(abs_path)
-        if pixmap and not pixmap.isNull():
-            scaled = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            _logo_cache[cache_key] = scaled
-            return scaled
-    except Exception:
-        return None
-
-    return None
\ No newline at end of file
+    from PyQt5 import sip
+
+    device_pixel_ratio = label.devicePixelRatioF()
+    pixels = round(size * device_pixel_ratio)
+    team = team_by_id(team_id) or find_team(team_name)
+    if team is not None:
+        key = (team.team_id, size, device_pixel_ratio)
+        pixmap = _logo_cache.get(key)
+        if pixmap is not None:
+            label.setPixmap(pixmap)
+            return
+        if _atlas is not None and _atlas.tile(team.team_id, pixels):
+            if _atlas.image is not None:
+                pixmap = _atlas_pixmap(team.team_id, pixels, device_pixel_ratio)
+                _logo_cache.put(key, pixmap)
+                label.setPixmap(pixmap)
+            else:
+                # Atlas still decoding: try again (atlas or file fallback) once it's ready
+                _logo_loader().request(ATLAS_KEY, _atlas.image_path,
+                                       lambda _: None if sip.isdeleted(label) else _set_logo(label, team_id, team_name, size))
+            return
+        logo_file = os.path.join(LOGOS_DIR, f"{team.logo}.png")
+    else:
+        logo_file = _find_logo_file(team_name)
+        if not logo_file:
+            label.setText(team_name)
+            return
+        key = (os.path.splitext(os.path.basename(logo_file))[0].lower(), size, device_pixel_ratio)
+        pixmap = _logo_cache.get(key)
+        if pixmap is not None:
+            label.setPixmap(pixmap)
+            return
+
+    def show(pixmap):
+        if sip.isdeleted(label):
+            return
+        if pixmap is None:
+            label.setText(team_name)
+        else:
+            label.setPixmap(pixmap)
+
+    _logo_loader().request(key, os.path.abspath(logo_file), show, pixels)
+
+
+def _atlas_pixmap(team_id: int, pixels: int, device_pixel_ratio: float):
+    """Copy one tile out of the decoded atlas as a pixmap"""
+    from PyQt5.QtCore import QRect
+    from PyQt5.QtGui import QPixmap
+    pixmap = QPixmap.fromImage(_atlas.image.copy(QRect(*_atlas.tile(team_id, pixels))))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
+
+
+def logo_cache_stats():
+    """Entries, bytes, hits and misses of the decoded logo cache"""
+    return _logo_cache.stats()
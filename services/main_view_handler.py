@@ -1,27 +1,34 @@
+from typing import TYPE_CHECKING
 from PyQt5.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout, QFrame
 from PyQt5.QtCore import Qt, pyqtSignal
-from services.theme_handler import ThemedWidget
-from services.logo_handler import _load_logo_pixmap
-from services.api_services import Game, GameUpdate
+from services.logo_handler import _set_logo
+from services.change_events import GameChange, GameComponent
+from services import perf
+
+if TYPE_CHECKING:
+    from services.api_services import Game, GameSummary
 
 # GameCell
 # Represents a single game card in the main view. It:
 
 # Displays basic game information (teams, logos, scores)
-# Shows game status and basic player stats
+# Shows game status and the leading player from the scoreboard's GameSummary
 # Handles click events to navigate to detail view
-# Updates dynamically as game data changes
-# Applies theming to all its components
+# Updates only when the game changes in a way the card displays
+# Is styled by the application stylesheet through object names
 # Has a fixed height for consistent UI
 
-class GameCell(QWidget, ThemedWidget):
+class GameCell(QWidget):
     clicked_signal = pyqtSignal(str)
+    # The card never shows plays, so new actions alone don't touch it
+    SUBSCRIBED_CHANGES = GameChange.SCORE | GameChange.PERIOD | GameChange.CLOCK | GameChange.STATUS | GameChange.STATS
+    REQUIRED_COMPONENTS = GameComponent.SUMMARY  # The scoreboard line is all a card shows
     
-    def __init__(self, game: Game, parent=None):
+    def __init__(self, game: "Game", parent=None):
         super().__init__(parent)
         self.game = game
         self.game_id = game.game_id
-        self.is_dark_mode = False
+        self.game_update = None
         self.init_ui()
         
     def init_ui(self):
@@ -30,6 +37,7 @@ class GameCell(QWidget, ThemedWidget):
         
         # Create frame for better visual separation
         self.frame = QFrame(self)
+        self.frame.setObjectName("gameCellFrame")
         self.frame.setFrameShape(QFrame.StyledPanel)
         self.frame.setFrameShadow(QFrame.Raised)
         
@@ -46,8 +54,8 @@ class GameCell(QWidget, ThemedWidget):
         left_layout = QVBoxLayout()
         
         # Team layouts
-        self.home_logo, self.home_score, home_layout = self._create_team_layout(self.game.home_team)
-        self.away_logo, self.away_score, away_layout = self._create_team_layout(self.game.away_team)
+        self.home_logo, self.home_score, home_layout = self._create_team_layout(self.game.home_team_id, self.game.home_team)
+        self.away_logo, self.away_score, away_layout = self._create_team_layout(self.game.away_team_id, self.game.away_team)
         
         left_layout.addLayout(home_layout)
         left_layout.addLayout(away_layout)
@@ -55,9 +63,11 @@ class GameCell(QWidget, ThemedWidget):
         # Right side (game status)
         right_layout = QVBoxLayout()
         self.status_label = QLabel(self.game.game_time)
+        self.status_label.setObjectName("gameCellStatus")
         self.status_label.setAlignment(Qt.AlignCenter)
         
         self.player_stats = QLabel("")
+        self.player_stats.setObjectName("gameCellStats")
         self.player_stats.setAlignment(Qt.AlignCenter)
         self.player_stats.setWordWrap(True)
         
@@ -71,20 +81,17 @@ class GameCell(QWidget, ThemedWidget):
         self.setFixedHeight(120)
         self.setStyleSheet("GameCell { border-radius: 10px; }")
 
-    def _create_team_layout(self, team_name):
+    def _create_team_layout(self, team_id, team_name):
         layout = QHBoxLayout()
         
         logo = QLabel()
         logo.setFixedSize(40, 40)
         
-        # Load logo from disk on demand
-        pixmap = _load_logo_pixmap(team_name, 40)
-        if pixmap:
-            logo.setPixmap(pixmap)
-        else:
-            logo.setText(team_name)
+        # Decoded off the GUI thread on first use, then served from the LRU
+        _set_logo(logo, team_id, team_name, 40)
         
         score = QLabel("--")
+        score.setObjectName("gameCellScore")
         score.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         
         layout.addWidget(logo)
@@ -97,7 +104,14 @@ class GameCell(QWidget, ThemedWidget):
             self.clicked_signal.emit(self.game_id)
         super().mousePressEvent(event)
     
-    def update_game_status(self, game_update: GameUpdate = None):
+    @perf.timed("GameCell.update_game_status", "ui")
+    def update_game_status(self, game_update: "GameSummary" = None):
+        # Same snapshot as last time: leave every label (and its paint) alone
+        if game_update is self.game_update or (game_update and game_update == self.game_update):
+            return
+        self.game_update = game_update
+
+        # QLabel.setText is a no-op for unchanged text, so only labels that changed repaint
         if not game_update:
             self.status_label.setText(self.game.game_time)
             return
@@ -109,7 +123,7 @@ class GameCell(QWidget, ThemedWidget):
             case status if "Final" in status:
                 self.status_label.setText(f"{game_update.status}")
                 self.player_stats.setText(f"{game_update.best_overall_player}")
-            case status if "Not Started" in status or "PM" in status or "AM" in status:
+            case status if "Not Started" in status or "PM" in status.upper() or "AM" in status.upper():
                 self.status_label.setText(f"{self.game.game_time}")
             case _:
                 # For cases not handled above, check the period and clock
@@ -122,10 +136,17 @@ class GameCell(QWidget, ThemedWidget):
                         elif game_update.period == 5: self.status_label.setText(f"OT - {game_update.clock}")
                         else: self.status_label.setText(f"{game_update.period - 4}OT - {game_update.clock}")
                         self.player_stats.setText(f"{game_update.best_overall_player}")
-                    
-    def _apply_specific_theme(self, theme):
-        self.frame.setStyleSheet(f"QFrame {{ background-color: {theme['bg_color']}; border-radius: 10px; }}")
-        self.home_score.setStyleSheet(f"QLabel {{ color: {theme['text_color']}; font-weight: bold; font-size: 16px; }}")
-        self.away_score.setStyleSheet(f"QLabel {{ color: {theme['text_color']}; font-weight: bold; font-size: 16px; }}")
-        self.status_label.setStyleSheet(f"QLabel {{ color: {theme['text_color']}; }}")
-        self.player_stats.setStyleSheet(f"QLabel {{ color: {theme['secondary_text']}; font-size: 10px; }}")
+
+# SkeletonCell
+# An empty placeholder card shown in the main grid before any game data
+# (cached or live) has arrived, so the window has its final shape on first paint.
+
+class SkeletonCell(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        frame = QFrame(self)
+        frame.setObjectName("gameCellFrame")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.addWidget(frame)
+        self.setFixedHeight(120)
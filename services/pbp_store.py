@@ -0,0 +1,67 @@
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Tuple
+from services.time_parsing import format_clock
+
+FEED_HISTORY_LENGTH = 25  # Plays retained per game and shown in the detail view feed
+
+
+def format_play(play: Dict) -> str:
+    """Format one play-by-play action as 'Q3 08:47 | description'."""
+    time_str = format_clock(play.get('clock'), default="")
+
+    play_period = play.get('period', 0)
+    period_str = f"Q{play_period}" if play_period <= 4 else f"OT{play_period - 4}"
+
+    play_description = play.get('description', 'Unknown action')
+    return f"{period_str} {time_str} | {play_description}"
+
+# PlayByPlayStore
+# Holds the most recent plays of one game's feed. It:
+
+# Remembers the highest actionNumber it has ingested
+# Walks the feed backwards from the newest action and stops once the window is full,
+#   so a 500-action feed costs O(capacity) per poll instead of a full sort
+# Reformats an action only when it is new or its 'edited' stamp changed (corrections)
+# Drops actions the feed no longer contains (deletions)
+# Answers "last N plays" from a bounded deque
+
+class PlayByPlayStore:
+    def __init__(self, capacity=FEED_HISTORY_LENGTH):
+        self.capacity = capacity
+        self.last_action_number = 0
+        self._plays = deque(maxlen=capacity)  # (actionNumber, edited, text), oldest first
+
+    def ingest(self, actions: List[Dict]) -> int:
+        """Reconcile the window with a full feed; return how many new actions arrived."""
+        known = {number: (edited, text) for number, edited, text in self._plays}
+
+        window = []
+        previous_number = None
+        for action in reversed(actions):
+            if len(window) == self.capacity:
+                break
+            number = action.get('actionNumber', 0)
+            if previous_number is not None and number > previous_number:
+                # The feed is normally ordered by actionNumber; fall back to sorting if it isn't
+                return self.ingest(sorted(actions, key=lambda x: x.get('actionNumber', 0)))
+            previous_number = number
+
+            edited = action.get('edited')
+            cached = known.get(number)
+            text = cached[1] if cached and cached[0] == edited else format_play(action)
+            window.append((number, edited, text))
+
+        window.reverse()
+        self._plays = deque(window, maxlen=self.capacity)
+
+        new_actions = sum(1 for number, _, _ in window if number > self.last_action_number)
+        if window:
+            self.last_action_number = max(self.last_action_number, window[-1][0])
+        return new_actions
+
+    def recent(self, count: int = FEED_HISTORY_LENGTH) -> Tuple[str, ...]:
+        """Return up to count most recent plays, oldest first."""
+        newest_first = [text for _, _, text in islice(reversed(self._plays), count)]
+        newest_first.reverse()
+        return tuple(newest_first)
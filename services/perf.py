@@ -0,0 +1,226 @@
+import atexit
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional
+
+SPAN_BUFFER_SIZE = 8192     # Most recent spans kept in memory, across all threads
+SAMPLE_BUFFER_SIZE = 1024   # Most recent samples kept per counter / value series
+RATE_WINDOW = 60.0          # Seconds the overlay's per-minute rates and summaries look back
+TRACE_FLUSH_EVERY = 256     # Trace events buffered before they are written out
+TRACE_ENV = "NBA_PERF_TRACE"  # Write a Chrome trace (JSON array, one event per line) to this path
+ASYNC_CATEGORIES = ("net",)   # Span categories whose spans overlap on one thread (concurrent requests)
+
+
+class SpanRecord(NamedTuple):
+    name: str
+    category: str
+    start_ns: int     # time.perf_counter_ns() at entry
+    duration_ns: int
+    thread_id: int
+
+# Spans are appended by whichever thread ran them; deque appends are atomic,
+# so the hot path takes no lock. Readers copy the deque before iterating.
+_spans = deque(maxlen=SPAN_BUFFER_SIZE)
+_counters: Dict[str, List] = {}   # name -> [total, deque of (perf_counter, n)]
+_values: Dict[str, deque] = {}    # name -> deque of (perf_counter, value)
+_counters_lock = threading.Lock()
+_trace = None
+
+# Span
+# Times one block of code into the ring buffer. It:
+
+# Is a slotted context manager (no generator frame), so entering and leaving costs
+#   two perf_counter_ns calls and a deque append
+# Records even when the block raises, so failing network calls still show up
+# Is also what timed() wraps around functions
+
+class Span:
+    __slots__ = ("name", "category", "start_ns")
+
+    def __init__(self, name: str, category: str = "app"):
+        self.name, self.category = name, category
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        record_span(self.name, self.category, self.start_ns, time.perf_counter_ns())
+        return False
+
+
+def span(name: str, category: str = "app") -> Span:
+    """with span("parse boxscore", "parse"): ... records how long the block took"""
+    return Span(name, category)
+
+
+def timed(name: Optional[str] = None, category: str = "app"):
+    """Decorator recording a span per call, named after the function's qualname by default."""
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_ns = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_span(span_name, category, start_ns, time.perf_counter_ns())
+        return wrapper
+    return decorate
+
+
+def record_span(name: str, category: str, start_ns: int, end_ns: int):
+    record = SpanRecord(name, category, start_ns, end_ns - start_ns, threading.get_ident())
+    _spans.append(record)
+    if _trace is not None:
+        _trace.add_span(record)
+
+
+def count(name: str, n: int = 1):
+    """Add n to a named counter (requests, cache hits...), timestamped for per-minute rates."""
+    with _counters_lock:
+        counter = _counters.get(name)
+        if counter is None:
+            counter = _counters[name] = [0, deque(maxlen=SAMPLE_BUFFER_SIZE)]
+        counter[0] += n
+        counter[1].append((time.perf_counter(), n))
+
+
+def record_value(name: str, value: float):
+    """Record one sample of a measured value (event-loop lag, in ms); also a counter track in the trace."""
+    samples = _values.get(name)
+    if samples is None:
+        samples = _values.setdefault(name, deque(maxlen=SAMPLE_BUFFER_SIZE))
+    samples.append((time.perf_counter(), value))
+    if _trace is not None:
+        _trace.add_value(name, value)
+
+
+def total(name: str) -> int:
+    counter = _counters.get(name)
+    return counter[0] if counter else 0
+
+
+def recent_count(name: str, window: float = RATE_WINDOW) -> int:
+    """How much counter name grew in the last window seconds (as far as its samples reach)"""
+    counter = _counters.get(name)
+    if not counter:
+        return 0
+    since = time.perf_counter() - window
+    with _counters_lock:
+        return sum(n for at, n in counter[1] if at >= since)
+
+
+def recent_values(name: str, window: float = RATE_WINDOW) -> List[float]:
+    since = time.perf_counter() - window
+    return [value for at, value in list(_values.get(name, ())) if at >= since]
+
+
+def recent_spans(window: float = RATE_WINDOW, name: Optional[str] = None) -> List[SpanRecord]:
+    since_ns = time.perf_counter_ns() - int(window * 1e9)
+    return [record for record in list(_spans)
+            if record.start_ns >= since_ns and (name is None or record.name == name)]
+
+
+def summarize(window: float = RATE_WINDOW) -> Dict[str, Dict[str, float]]:
+    """{span name: {"count", "total_ms", "max_ms"}} over the last window seconds, costliest first"""
+    summary = {}
+    for record in recent_spans(window):
+        entry = summary.setdefault(record.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        duration_ms = record.duration_ns / 1e6
+        entry["count"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+    return dict(sorted(summary.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+# ChromeTrace
+# Streams spans to a file chrome://tracing and Perfetto can open. It:
+
+# Writes the JSON Array Format one event per line, leaving the array unterminated,
+#   which both viewers accept, so the file stays valid however the process ends
+# Emits spans as complete ("X") events, timestamps in microseconds, one track per thread
+#   (named after the Python thread); network spans, which overlap, as async begin/end
+#   pairs; and recorded values as counter ("C") events
+# Buffers events and writes them TRACE_FLUSH_EVERY at a time, and at exit
+
+class ChromeTrace:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write("[\n")
+        self._pid = os.getpid()
+        self._pending = []
+        self._thread_names = {}
+        self._async_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _add(self, event):
+        with self._lock:
+            thread_id = event["tid"]
+            if thread_id not in self._thread_names:
+                self._thread_names[thread_id] = threading.current_thread().name
+                self._pending.append({"name": "thread_name", "ph": "M", "pid": self._pid, "tid": thread_id,
+                                      "args": {"name": self._thread_names[thread_id]}})
+            self._pending.append(event)
+            if len(self._pending) >= TRACE_FLUSH_EVERY:
+                self._write_pending()
+
+    def add_span(self, record: SpanRecord):
+        event = {"name": record.name, "cat": record.category, "pid": self._pid, "tid": record.thread_id,
+                 "ts": record.start_ns / 1000}
+        if record.category in ASYNC_CATEGORIES:
+            # Concurrent requests overlap on the loop thread: async begin/end pairs nest correctly
+            event_id = next(self._async_ids)
+            self._add(dict(event, ph="b", id=event_id))
+            self._add(dict(event, ph="e", id=event_id, ts=(record.start_ns + record.duration_ns) / 1000))
+        else:
+            self._add(dict(event, ph="X", dur=record.duration_ns / 1000))
+
+    def add_value(self, name: str, value: float):
+        self._add({"name": name, "ph": "C", "pid": self._pid, "tid": threading.get_ident(),
+                   "ts": time.perf_counter_ns() / 1000, "args": {name: value}})
+
+    def _write_pending(self):
+        if self._file is None:
+            return
+        self._file.writelines(json.dumps(event, separators=(",", ":")) + ",\n" for event in self._pending)
+        self._file.flush()
+        self._pending.clear()
+
+    def flush(self):
+        with self._lock:
+            self._write_pending()
+
+    def close(self):
+        with self._lock:
+            self._write_pending()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def start_trace(path: str) -> ChromeTrace:
+    """Stream every span and value recorded from now on to a Chrome trace file at path."""
+    global _trace
+    if _trace is not None:
+        _trace.close()
+    _trace = ChromeTrace(path)
+    atexit.register(_trace.close)
+    return _trace
+
+
+def trace_enabled() -> bool:
+    return _trace is not None
+
+
+if os.environ.get(TRACE_ENV):
+    try:
+        start_trace(os.environ[TRACE_ENV])
+    except OSError as e:
+        print(f"Error opening trace file: {e}")
@@ -0,0 +1,125 @@
+import time
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import Qt, QObject, QTimer, QEvent
+from services import perf
+
+LAG_PROBE_MS = 100         # How often the GUI event loop is asked to run a timer on time
+OVERLAY_REFRESH_MS = 1000  # How often the overlay text is rebuilt while shown
+OVERLAY_WINDOW = 60.0      # Seconds of spans and counters the overlay summarises
+LAG_METRIC = "event_loop_lag_ms"
+TICK_SPAN = "RefreshWorker.refresh"
+TOP_SPANS = 3
+
+# EventLoopLagProbe
+# Measures how late the GUI thread's event loop runs a timer. It:
+
+# Arms a precise repeating timer and records, each time it fires, how far past its
+#   due time it ran (time spent in slots, layout, paint or style polish delays it)
+# Records samples as the event_loop_lag_ms value, which the overlay reads and the
+#   Chrome trace shows as a counter track
+# Runs only while someone looks (overlay shown or a trace being written)
+
+class EventLoopLagProbe(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(LAG_PROBE_MS)
+        self._timer.timeout.connect(self._on_timeout)
+        self._due = None
+        self._users = 0
+
+    def acquire(self):
+        self._users += 1
+        if not self._timer.isActive():
+            self._due = time.perf_counter() + LAG_PROBE_MS / 1000
+            self._timer.start()
+
+    def release(self):
+        self._users = max(self._users - 1, 0)
+        if not self._users:
+            self._timer.stop()
+
+    def _on_timeout(self):
+        now = time.perf_counter()
+        perf.record_value(LAG_METRIC, max(now - self._due, 0.0) * 1000)
+        self._due = now + LAG_PROBE_MS / 1000
+
+# PerfOverlay
+# A small translucent panel in the window's bottom-right corner. It:
+
+# Shows requests/min, response cache hit ratio (fresh hits and 304s), refresh tick
+#   time, event-loop lag and the spans that cost the most over the last minute
+# Reads only the perf ring buffer and counters, so it adds nothing to the hot paths
+# Rebuilds its text once a second, and only while visible
+# Follows its parent's resizes and never takes mouse input
+
+class PerfOverlay(QLabel):
+    def __init__(self, parent, lag_probe: EventLoopLagProbe):
+        super().__init__(parent)
+        self.setObjectName("perfOverlay")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+        self.setStyleSheet("QLabel#perfOverlay { background-color: rgba(0, 0, 0, 170); color: #E0E0E0;"
+                           " font-family: monospace; font-size: 10px; padding: 6px; border-radius: 6px; }")
+        self.lag_probe = lag_probe
+        self._timer = QTimer(self)
+        self._timer.setInterval(OVERLAY_REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        parent.installEventFilter(self)
+        self.hide()
+
+    def toggle(self):
+        self.set_shown(not self.isVisible())
+
+    def set_shown(self, shown):
+        if shown == self.isVisible():
+            return
+        if shown:
+            self.lag_probe.acquire()
+            self.refresh()
+            self.show()
+            self.raise_()
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self.lag_probe.release()
+            self.hide()
+
+    def eventFilter(self, obj, event):
+        if obj is self.parent() and event.type() == QEvent.Resize and self.isVisible():
+            self._reposition()
+        return False
+
+    def _reposition(self):
+        self.adjustSize()
+        self.move(self.parent().width() - self.width() - 8, self.parent().height() - self.height() - 8)
+
+    def refresh(self):
+        self.setText(overlay_text())
+        self._reposition()
+
+
+def overlay_text(window: float = OVERLAY_WINDOW) -> str:
+    """The overlay's lines, from the last window seconds of perf data"""
+    requests = perf.recent_count("requests", window)
+    hits = perf.recent_count("cache_hit", window)
+    not_modified = perf.recent_count("not_modified", window)
+    lookups = requests + hits
+    hit_ratio = f"{(hits + not_modified) / lookups:.0%} ({not_modified} x 304)" if lookups else "--"
+
+    ticks = sorted(record.duration_ns / 1e6 for record in perf.recent_spans(window, TICK_SPAN))
+    tick = f"p50 {ticks[len(ticks) // 2]:.1f} ms, max {ticks[-1]:.1f} ms" if ticks else "--"
+    lags = perf.recent_values(LAG_METRIC, window)
+    lag = f"{lags[-1]:.1f} ms, max {max(lags):.1f} ms" if lags else "--"
+
+    lines = [
+        f"requests/min  {requests * 60 / window:.0f}",
+        f"cache hits    {hit_ratio}",
+        f"tick          {tick}",
+        f"loop lag      {lag}",
+        "",
+    ]
+    for name, stats in list(perf.summarize(window).items())[:TOP_SPANS]:
+        lines.append(f"{name[:34]:34} {stats['total_ms']:7.1f} ms / {stats['count']}")
+    return "\n".join(lines)
@@ -0,0 +1,73 @@
+import heapq
+from typing import Dict, List, Mapping, Optional
+from services.game_state import GameState
+
+# Seconds between polls of one game in each state; None stops polling
+POLL_INTERVALS = {
+    GameState.UNKNOWN: 5,      # Retry soon after a failed or unparseable fetch
+    GameState.SCHEDULED: 60,   # Floor while waiting for tip-off (see PREGAME_LEAD)
+    GameState.LIVE: 5,
+    GameState.CLUTCH: 2,
+    GameState.BREAK: 20,
+    GameState.HALFTIME: 60,
+    GameState.FINAL: None,
+}
+PREGAME_LEAD = 5 * 60  # Start polling a scheduled game this long before tip-off
+
+
+def poll_interval(state: GameState, tip_off: float = 0.0, now: float = 0.0,
+                  intervals: Mapping[GameState, Optional[float]] = POLL_INTERVALS) -> Optional[float]:
+    """Seconds until a game in state should be polled again, or None for never.
+
+    Scheduled games sleep until PREGAME_LEAD before tip_off (a UTC timestamp),
+    but never less than the scheduled floor, so a late tip-off is still
+    picked up. intervals replaces POLL_INTERVALS (see services.game_cache.CachePolicy).
+    """
+    interval = intervals[state]
+    if state is GameState.SCHEDULED and tip_off and interval is not None:
+        return max(interval, tip_off - PREGAME_LEAD - now)
+    return interval
+
+# PollScheduler
+# Tracks when each polled item (a game, the games list) is next due. It:
+
+# Keeps one deadline per key in a min-heap, so the next wakeup is O(1) to find
+# Replaces a key's deadline on reschedule and drops stale heap entries lazily
+# Pops every key whose deadline has passed in one call
+# Lets a key be unscheduled entirely (finished games, games that left the slate)
+
+class PollScheduler:
+    def __init__(self):
+        self._deadlines: Dict[str, float] = {}
+        self._heap = []  # (deadline, key); may hold superseded entries
+
+    def schedule(self, key: str, deadline: float):
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+
+    def discard(self, key: str):
+        self._deadlines.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._deadlines
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest pending deadline, or None when nothing is scheduled."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> List[str]:
+        """Unschedule and return every key due at or before now, earliest first."""
+        due = []
+        self._drop_stale()
+        while self._heap and self._heap[0][0] <= now:
+            _, key = heapq.heappop(self._heap)
+            del self._deadlines[key]
+            due.append(key)
+            self._drop_stale()
+        return due
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap and self._deadlines.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
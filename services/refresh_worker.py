@@ -0,0 +1,177 @@
+import math
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal, pyqtSlot
+from services.change_events import GameChange, GameComponent, fingerprint, diff_fingerprints
+from services.poll_scheduler import PollScheduler
+from services import perf
+
+SLATE_KEY = "slate"       # Scheduler key of the scoreboard (games list and every card's summary)
+PER_GAME_COMPONENTS = GameComponent.BOXSCORE | GameComponent.PLAYBYPLAY  # Fetched per game, not per slate
+RETRY_INTERVAL = 5        # Seconds before retrying a failed games list or batch fetch
+MAX_SLEEP = 600           # Upper bound on one timer wait, in case the wall clock jumps
+
+# RefreshWorker
+# The only owner of calls into services.api_services. It:
+
+# Lives on a dedicated QThread so HTTP round-trips never block the GUI
+# Imports the data layer itself, on that thread, so app startup never pays for it
+# Publishes the on-disk cached slate first, then revalidates it over the network
+# Fills every card from the scoreboard alone: one request per poll yields the games
+#   list and a GameSummary per game
+# Fetches boxscore / play-by-play only for games whose views need them (an open
+#   detail view), fetching newly needed components right away
+# Gives the scoreboard and every such game its own next-poll deadline from game state
+#   (fast when live or in the last two minutes, slow at breaks, asleep until shortly
+#   before tip-off, never again once final), following the data layer's cache policy,
+#   and wakes only for the earliest one
+# Fingerprints every GameSummary / GameUpdate and only publishes games that actually
+#   changed, tagged with GameChange flags (score, period, clock, status, final, plays, stats)
+# Delivers immutable Game / GameUpdate snapshots back through Qt signals
+# Lets the UI ask for an out-of-band refresh of a single game
+# Keeps time by the data layer's clock, so a replayed night (services.feed_archive)
+#   is polled on its own timeline at any replay speed
+
+class RefreshWorker(QObject):
+    games_ready = pyqtSignal(object)                # tuple of Game
+    summary_changed = pyqtSignal(str, object, int)  # game_id, GameSummary, GameChange flags
+    game_changed = pyqtSignal(str, object, int)     # game_id, GameUpdate, GameChange flags
+
+    def __init__(self, default_components=GameComponent.SUMMARY, parent=None):
+        super().__init__(parent)
+        self.default_components = default_components
+        self._components = {}  # game_id -> GameComponent, for games needing more or less than the default
+        self._timer = None
+        self._api = None
+        self._scheduler = PollScheduler()
+        self._games = {}  # game_id -> Game on the current slate
+        self._summary_fingerprints = {}
+        self._fingerprints = {}
+
+    @pyqtSlot()
+    def start(self):
+        """Start polling. Must run on the worker thread so the timer lives there."""
+        # Deferred import: asyncio, aiohttp, sqlite3 etc. load here, after the first paint
+        from services import api_services
+        self._api = api_services
+        self._publish_cached_snapshot()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)  # Never fire before a deadline
+        self._timer.timeout.connect(self.refresh)
+        self._scheduler.schedule(SLATE_KEY, 0)
+        self.refresh()
+
+    def _publish_cached_snapshot(self):
+        """Paint from the on-disk cache before the first network round-trip"""
+        try:
+            games, summaries = self._api.load_cached_snapshot()
+        except Exception as e:
+            print(f"Error loading cached games: {e}")
+            return
+        if games:
+            self.games_ready.emit(tuple(games))
+        self._publish_summaries(summaries)
+
+    @pyqtSlot()
+    def stop(self):
+        if self._timer:
+            self._timer.stop()
+
+    @pyqtSlot()
+    @perf.timed("RefreshWorker.refresh", "worker")
+    def refresh(self):
+        """Poll everything whose deadline has passed, then sleep until the next one"""
+        due = set(self._scheduler.pop_due(self._api.now()))
+        if SLATE_KEY in due:
+            self._refresh_scoreboard()
+
+        due_game_ids = [game_id for game_id in self._games if game_id in due]
+        if due_game_ids:
+            self._refresh_games(due_game_ids)
+        self._arm_timer()
+
+    def _refresh_scoreboard(self):
+        """Refetch the games list and every game's summary in one request"""
+        try:
+            games, summaries = self._api.fetch_scoreboard()
+        except Exception as e:
+            print(f"Error fetching games list: {e}")
+            self._scheduler.schedule(SLATE_KEY, self._api.now() + RETRY_INTERVAL)
+            return
+        games = tuple(games)
+        finished_at = self._api.now()
+        self._scheduler.schedule(SLATE_KEY, finished_at + self._api.scoreboard_poll_interval(games, summaries, finished_at))
+
+        if games != tuple(self._games.values()):
+            self.games_ready.emit(games)
+        previous_games, self._games = self._games, {game.game_id: game for game in games}
+        # Forget games that dropped off the slate
+        for game_id in previous_games.keys() - self._games.keys():
+            self._scheduler.discard(game_id)
+            self._summary_fingerprints.pop(game_id, None)
+            self._fingerprints.pop(game_id, None)
+            self._components.pop(game_id, None)
+        self._publish_summaries(summaries)
+
+    def _refresh_games(self, game_ids):
+        try:
+            game_updates = self._api.fetch_live_game_updates_many(
+                game_ids, {game_id: self._components_for(game_id) for game_id in game_ids})
+        except Exception as e:
+            print(f"Error updating games: {e}")
+            for game_id in game_ids:
+                self._scheduler.schedule(game_id, self._api.now() + RETRY_INTERVAL)
+            return
+
+        for game_id, game_update in game_updates.items():
+            self._publish(game_id, game_update)
+
+        # Deadlines count from when the batch finished, so the data layer's own
+        # freshness window (same policy) has always expired by the time they fire
+        finished_at = self._api.now()
+        for game_id, game_update in game_updates.items():
+            interval = self._api.game_poll_interval(game_update.state, self._games[game_id].start_time, finished_at)
+            if interval is not None and self._components_for(game_id) & PER_GAME_COMPONENTS:
+                self._scheduler.schedule(game_id, finished_at + interval)
+
+    def _arm_timer(self):
+        next_deadline = self._scheduler.next_deadline()
+        if next_deadline is None:
+            return
+        delay = min(max(next_deadline - self._api.now(), 0), MAX_SLEEP)
+        self._timer.start(math.ceil(self._api.wait_time(delay) * 1000))
+
+    def _components_for(self, game_id):
+        return self._components.get(game_id, self.default_components)
+
+    @pyqtSlot(str, int)
+    def set_components(self, game_id, components):
+        """Fetch components for game_id from now on; anything newly needed is fetched at once"""
+        components = GameComponent(components)
+        added = components & ~self._components_for(game_id)
+        if components == self.default_components:
+            self._components.pop(game_id, None)
+        else:
+            self._components[game_id] = components
+
+        if not components & PER_GAME_COMPONENTS:
+            self._scheduler.discard(game_id)  # Only the scoreboard covers this game now
+        elif added & PER_GAME_COMPONENTS and self._api is not None and game_id in self._games:
+            self._scheduler.schedule(game_id, self._api.now())
+            self.refresh()
+
+    def _publish_summaries(self, summaries):
+        """Emit summary_changed for every summary whose fingerprint moved"""
+        for game_id, summary in summaries.items():
+            new_fingerprint = fingerprint(summary)
+            changes = diff_fingerprints(self._summary_fingerprints.get(game_id), new_fingerprint)
+            self._summary_fingerprints[game_id] = new_fingerprint
+            if changes != GameChange.NONE:
+                self.summary_changed.emit(game_id, summary, int(changes))
+
+    def _publish(self, game_id, game_update):
+        """Emit game_changed only when the snapshot's fingerprint moved"""
+        new_fingerprint = fingerprint(game_update)
+        changes = diff_fingerprints(self._fingerprints.get(game_id), new_fingerprint)
+        self._fingerprints[game_id] = new_fingerprint
+        if changes != GameChange.NONE:
+            self.game_changed.emit(game_id, game_update, int(changes))
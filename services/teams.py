@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Team:
+    team_id: int
+    tricode: str
+    city: str
+    nickname: str
+    logo: str             # File stem in nba-logos/
+    primary_color: str
+    secondary_color: str
+    conference: str
+
+
+TEAMS: Tuple[Team, ...] = (
+    Team(1610612737, "ATL", "Atlanta", "Hawks", "hawks", "#E03A3E", "#C1D32F", "East"),
+    Team(1610612738, "BOS", "Boston", "Celtics", "celtics", "#007A33", "#BA9653", "East"),
+    Team(1610612739, "CLE", "Cleveland", "Cavaliers", "cavaliers", "#860038", "#FDBB30", "East"),
+    Team(1610612740, "NOP", "New Orleans", "Pelicans", "pelicans", "#0C2340", "#C8102E", "West"),
+    Team(1610612741, "CHI", "Chicago", "Bulls", "bulls", "#CE1141", "#000000", "East"),
+    Team(1610612742, "DAL", "Dallas", "Mavericks", "mavericks", "#00538C", "#002B5E", "West"),
+    Team(1610612743, "DEN", "Denver", "Nuggets", "nuggets", "#0E2240", "#FEC524", "West"),
+    Team(1610612744, "GSW", "Golden State", "Warriors", "warriors", "#1D428A", "#FFC72C", "West"),
+    Team(1610612745, "HOU", "Houston", "Rockets", "rockets", "#CE1141", "#000000", "West"),
+    Team(1610612746, "LAC", "LA", "Clippers", "clippers", "#C8102E", "#1D428A", "West"),
+    Team(1610612747, "LAL", "Los Angeles", "Lakers", "lakers", "#552583", "#FDB927", "West"),
+    Team(1610612748, "MIA", "Miami", "Heat", "heat", "#98002E", "#F9A01B", "East"),
+    Team(1610612749, "MIL", "Milwaukee", "Bucks", "bucks", "#00471B", "#EEE1C6", "East"),
+    Team(1610612750, "MIN", "Minnesota", "Timberwolves", "timberwolves", "#0C2340", "#236192", "West"),
+    Team(1610612751, "BKN", "Brooklyn", "Nets", "nets", "#000000", "#FFFFFF", "East"),
+    Team(1610612752, "NYK", "New York", "Knicks", "knicks", "#006BB6", "#F58426", "East"),
+    Team(1610612753, "ORL", "Orlando", "Magic", "magic", "#0077C0", "#C4CED4", "East"),
+    Team(1610612754, "IND", "Indiana", "Pacers", "pacers", "#002D62", "#FDBB30", "East"),
+    Team(1610612755, "PHI", "Philadelphia", "76ers", "76ers", "#006BB6", "#ED174C", "East"),
+    Team(1610612756, "PHX", "Phoenix", "Suns", "suns", "#1D1160", "#E56020", "West"),
+    Team(1610612757, "POR", "Portland", "Trail Blazers", "trail blazers", "#E03A3E", "#000000", "West"),
+    Team(1610612758, "SAC", "Sacramento", "Kings", "kings", "#5A2D81", "#63727A", "West"),
+    Team(1610612759, "SAS", "San Antonio", "Spurs", "spurs", "#C4CED4", "#000000", "West"),
+    Team(1610612760, "OKC", "Oklahoma City", "Thunder", "thunder", "#007AC1", "#EF3B24", "West"),
+    Team(1610612761, "TOR", "Toronto", "Raptors", "raptors", "#CE1141", "#000000", "East"),
+    Team(1610612762, "UTA", "Utah", "Jazz", "jazz", "#002B5C", "#F9A01B", "West"),
+    Team(1610612763, "MEM", "Memphis", "Grizzlies", "grizzlies", "#5D76A9", "#12173F", "West"),
+    Team(1610612764, "WAS", "Washington", "Wizards", "wizards", "#002B5C", "#E31837", "East"),
+    Team(1610612765, "DET", "Detroit", "Pistons", "pistons", "#C8102E", "#1D42BA", "East"),
+    Team(1610612766, "CHA", "Charlotte", "Hornets", "hornets", "#1D1160", "#00788C", "East"),
+)
+
+TEAMS_BY_ID: Dict[int, Team] = {team.team_id: team for team in TEAMS}
+TEAMS_BY_TRICODE: Dict[str, Team] = {team.tricode: team for team in TEAMS}
+
+# Lower-cased tricode, nickname and "city nickname" -> Team, for names from outside the feed
+_TEAMS_BY_NAME: Dict[str, Team] = {}
+for _team in TEAMS:
+    for _name in (_team.tricode, _team.nickname, f"{_team.city} {_team.nickname}"):
+        _TEAMS_BY_NAME[_name.lower()] = _team
+del _team, _name
+
+
+def team_by_id(team_id: int) -> Optional[Team]:
+    return TEAMS_BY_ID.get(team_id)
+
+
+def find_team(name: str) -> Optional[Team]:
+    """Resolve a tricode, nickname or full name to a Team; the feed itself always has teamId."""
+    return _TEAMS_BY_NAME.get(name.strip().lower())
@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import QPushButton
 from PyQt5.QtCore import pyqtSignal
+from services import perf
 # Theme constants
 LIGHT_THEME = {
     "bg_color": "#FFFFFF",
@@ -46,21 +47,53 @@ class DarkModeToggle(QPushButton):
         self.setText("Light Mode" if self.dark_mode else "Dark Mode")
         self.theme_changed.emit(self.dark_mode)
 
-# ThemedWidget
-# A mixin class (not instantiated directly) that:
+# Theme stylesheet
+# Every themed widget is styled from one application-level stylesheet. It:
 
-# Provides shared functionality for theme application
-# Defines a common interface for themed components
-# Contains methods for applying specific theme properties
-# Uses the DARK_THEME and LIGHT_THEME constants
+# Selects widgets by objectName (set once when each widget is built)
+# Is compiled once per theme and cached
+# Is applied to the QApplication only when DarkModeToggle.theme_changed fires,
+#   so refreshing data never triggers a style recalculation
 
-class ThemedWidget:
-    """Mixin for theming widgets"""
-    def apply_theme(self, is_dark_mode):
-        self.is_dark_mode = is_dark_mode
+_STYLESHEET_TEMPLATE = """
+QMainWindow {{ background-color: {main_bg}; }}
+QScrollArea {{ background-color: {main_bg}; border: none; }}
+QWidget {{ background-color: {main_bg}; color: {text_color}; }}
+QLabel {{ color: {text_color}; }}
+QLabel#titleLabel {{ font-size: 24px; font-weight: bold; }}
+
+QFrame#gameCellFrame {{ background-color: {bg_color}; border-radius: 10px; }}
+QFrame#gameCellFrame QLabel {{ background-color: {bg_color}; }}
+QLabel#gameCellScore {{ color: {text_color}; font-weight: bold; font-size: 16px; }}
+QLabel#gameCellStatus {{ color: {text_color}; }}
+QLabel#gameCellStats {{ color: {secondary_text}; font-size: 10px; }}
+
+QLabel#detailScore {{ font-size: 24px; font-weight: bold; color: {text_color}; }}
+QLabel#detailTeamName, QLabel#detailStatus {{ color: {text_color}; }}
+QLabel#boxScoreLabel {{ font-weight: bold; font-size: 14px; color: {text_color}; }}
+QLabel#feedPlay {{ padding: 5px; border-bottom: 1px solid {border_color}; color: {text_color}; }}
+QPushButton#detailBackButton {{ background-color: {tab_bg}; color: {text_color}; }}
+QTabWidget::pane {{ border: 1px solid {border_color}; }}
+QTabBar::tab {{ background-color: {tab_bg}; color: {tab_text}; padding: 8px 12px; }}
+QTabBar::tab:selected {{ background-color: {tab_selected_bg}; color: {text_color}; }}
+QTableView {{ background-color: {bg_color}; color: {text_color}; }}
+"""
+
+_compiled_stylesheets = {}
+
+
+def compile_stylesheet(is_dark_mode):
+    """Return the application stylesheet for a theme, compiling it on first use."""
+    if is_dark_mode not in _compiled_stylesheets:
         theme = DARK_THEME if is_dark_mode else LIGHT_THEME
-        self._apply_specific_theme(theme)
-    
-    def _apply_specific_theme(self, theme):
-        # To be overridden by child classes
-        pass
\ No newline at end of file
+        _compiled_stylesheets[is_dark_mode] = _STYLESHEET_TEMPLATE.format(**theme)
+    return _compiled_stylesheets[is_dark_mode]
+
+
+def apply_app_theme(is_dark_mode):
+    """Install the compiled stylesheet for a theme on the running QApplication."""
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance()
+    if app is not None:
+        with perf.span("setStyleSheet (re-polish)", "ui"):
+            app.setStyleSheet(compile_stylesheet(is_dark_mode))
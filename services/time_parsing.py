@@ -0,0 +1,63 @@
+import re
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+# ISO-8601 durations as the live feed writes them: PT08M47.00S, PT33M, PT00M00.00S, PT1H02M
+_DURATION_PATTERN = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)(?:\.\d*)?S)?")
+
+
+def parse_utc_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp such as gameTimeUTC into an aware UTC datetime.
+
+    A trailing 'Z' is stripped so the C-level datetime.fromisoformat handles
+    every Python version; naive values are taken as UTC. Raises ValueError on
+    malformed input.
+    """
+    if value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _is_clock_shape(value: str) -> bool:
+    """True for the feed's usual 'PTmmMss.ffS' clock, which can be sliced directly"""
+    return (len(value) == 11 and value[4] == "M" and value[7] == "." and value.startswith("PT")
+            and value[2:4].isdigit() and value[5:7].isdigit())
+
+
+def parse_duration(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Split an ISO-8601 duration into (minutes, whole seconds).
+
+    Hours fold into minutes and fractional seconds are truncated, matching how
+    the game clock is displayed. Returns None for an empty or malformed value
+    (the boxscore's gameClock is '' before tip-off).
+    """
+    if not value:
+        return None
+    if _is_clock_shape(value):
+        return int(value[2:4]), int(value[5:7])
+    match = _DURATION_PATTERN.fullmatch(value)
+    if match is None or match.lastindex is None:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 60 + int(minutes or 0), int(seconds or 0)
+
+
+def format_clock(value: Optional[str], default: str = "--") -> str:
+    """Render a game or play clock duration as 'MM:SS', or default if it can't be parsed."""
+    if value and _is_clock_shape(value):
+        return value[2:4] + ":" + value[5:7]
+    duration = parse_duration(value)
+    if duration is None:
+        return default
+    return f"{duration[0]:02d}:{duration[1]:02d}"
+
+
+def parse_minutes(value: Optional[str]) -> int:
+    """Whole minutes of a duration such as minutesCalculated ('PT33M'); 0 if missing."""
+    if value and value.startswith("PT") and value.endswith("M") and value[2:-1].isdigit():
+        return int(value[2:-1])
+    duration = parse_duration(value)
+    return duration[0] if duration else 0
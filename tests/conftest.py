@@ -0,0 +1,59 @@
+import importlib
+import os
+import time
+
+import pytest
+
+from tests.stub_cdn import StubCDN
+
+# The live endpoints' base URL is read when services.http_client is imported,
+# so the stub has to be up before any test module imports the data layer
+_stub = StubCDN()
+_stub.start()
+os.environ["NBA_LIVE_BASE_URL"] = _stub.base_url
+
+from services.http_client import LiveDataClient, set_client  # noqa: E402
+
+START_TIME = float(int(time.time()))  # The on-disk cache prunes by wall-clock age
+
+
+class ClockedClient(LiveDataClient):
+    """A LiveDataClient whose clock only moves when a test advances it"""
+
+    def __init__(self):
+        super().__init__()
+        self.clock = START_TIME
+
+    def now(self) -> float:
+        return self.clock
+
+    def advance(self, seconds: float):
+        self.clock += seconds
+
+
+def pytest_unconfigure(config):
+    _stub.stop()
+
+
+@pytest.fixture
+def stub_cdn():
+    _stub.reset()
+    yield _stub
+    _stub.reset()
+
+
+@pytest.fixture
+def client():
+    client = ClockedClient()
+    set_client(client)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def api(stub_cdn, client, tmp_path, monkeypatch):
+    """A freshly imported services.api_services on an empty on-disk cache, talking to the stub CDN"""
+    monkeypatch.setenv("NBA_WIDGET_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("NBA_CACHE_POLICY", raising=False)
+    from services import api_services
+    return importlib.reload(api_services)
@@ -0,0 +1,60 @@
+"""Minimal live-feed payloads carrying every field the parsers read."""
+import zlib
+
+STAT_NAMES = ("points", "reboundsTotal", "assists", "fieldGoalsMade", "fieldGoalsAttempted",
+              "threePointersMade", "threePointersAttempted", "freeThrowsMade", "freeThrowsAttempted",
+              "turnovers", "steals", "blocks", "foulsPersonal")
+
+
+def team(team_id, name, score, players=None):
+    block = {"teamId": team_id, "teamName": name, "teamCity": "City", "teamTricode": name[:3].upper(), "score": score}
+    if players is not None:
+        block["players"] = players
+    return block
+
+
+def player(name, minutes, points, rebounds=0, assists=0):
+    statistics = dict.fromkeys(STAT_NAMES, 0)
+    statistics.update(points=points, reboundsTotal=rebounds, assists=assists,
+                      minutesCalculated=f"PT{minutes:02d}M", plusMinusPoints=1.0)
+    return {"personId": zlib.crc32(name.encode()) % 10_000, "name": name, "statistics": statistics}
+
+
+def scoreboard_game(game_id, status=2, status_text="Q2 5:00", period=2, clock="PT05M00.00S",
+                    tip_off="2026-10-17T00:00:00Z", home_score=50, away_score=48):
+    leaders = {
+        "homeLeaders": {"personId": 1, "name": "Home Leader", "points": 20, "rebounds": 5, "assists": 3},
+        "awayLeaders": {"personId": 2, "name": "Away Leader", "points": 18, "rebounds": 9, "assists": 4},
+    }
+    if status == 1:  # Leaders are blank before tip-off
+        leaders = {side: {"personId": 0, "name": "", "points": 0, "rebounds": 0, "assists": 0} for side in leaders}
+    return {
+        "gameId": game_id, "gameStatus": status, "gameStatusText": status_text,
+        "period": period, "gameClock": clock, "gameTimeUTC": tip_off,
+        "homeTeam": team(1610612738, "Celtics", home_score), "awayTeam": team(1610612747, "Lakers", away_score),
+        "gameLeaders": leaders,
+    }
+
+
+def scoreboard(*games):
+    return {"meta": {}, "scoreboard": {"games": list(games)}}
+
+
+def boxscore(game_id, status=2, status_text="Q2 5:00", period=2, clock="PT05M00.00S", home_score=50, away_score=48):
+    return {"meta": {}, "game": {
+        "gameId": game_id, "gameStatus": status, "gameStatusText": status_text,
+        "period": period, "gameClock": clock,
+        "homeTeam": team(1610612738, "Celtics", home_score,
+                         [player("Home Starter", 20, home_score - 10, 5, 3), player("Home Bench", 8, 10)]),
+        "awayTeam": team(1610612747, "Lakers", away_score,
+                         [player("Away Bench", 6, 8), player("Away Starter", 22, away_score - 8, 9, 4)]),
+    }}
+
+
+def action(number, description=None, period=1, clock="PT10M00.00S", edited="2026-10-17T00:10:00Z"):
+    return {"actionNumber": number, "period": period, "clock": clock, "edited": edited,
+            "description": description or f"Action {number}"}
+
+
+def playbyplay(game_id, actions):
+    return {"meta": {}, "game": {"gameId": game_id, "actions": list(actions)}}
@@ -0,0 +1,83 @@
+"""A local stand-in for the cdn.nba.com live endpoints, served by http.server.
+
+Routes map an endpoint path (as in services.http_client) to a JSON payload
+or an error status. Every payload gets an ETag derived from its body, so
+conditional requests get a 304 exactly when the payload did not change.
+Each request's path and headers are kept for assertions.
+"""
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple, Union
+
+
+class StubRequest(NamedTuple):
+    endpoint: str
+    headers: Dict[str, str]
+
+
+class StubCDN:
+    def __init__(self):
+        self.routes: Dict[str, Union[dict, int]] = {}  # endpoint -> payload, or an HTTP error status
+        self.requests: List[StubRequest] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-cdn", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.routes.clear()
+            self.requests.clear()
+
+    def serve(self, endpoint: str, payload: Union[dict, int]):
+        """Answer endpoint with payload (a JSON-able dict) or with an error status such as 500"""
+        with self._lock:
+            self.routes[endpoint] = payload
+
+    def requests_for(self, endpoint: str) -> List[StubRequest]:
+        with self._lock:
+            return [request for request in self.requests if request.endpoint == endpoint]
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                endpoint = self.path.lstrip("/")
+                with stub._lock:
+                    stub.requests.append(StubRequest(endpoint, dict(self.headers)))
+                    payload = stub.routes.get(endpoint, 404)
+                if isinstance(payload, int):
+                    self.send_error(payload)
+                    return
+                body = json.dumps(payload).encode()
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
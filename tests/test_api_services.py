@@ -0,0 +1,172 @@
+import importlib
+
+import aiohttp
+import pytest
+
+from services.change_events import GameComponent
+from services.game_state import GameState
+from services.http_client import SCOREBOARD_ENDPOINT, BOXSCORE_ENDPOINT, PLAYBYPLAY_ENDPOINT
+from tests import feeds
+
+LIVE_GAME = "0022600001"
+LATE_GAME = "0022600002"
+
+
+def boxscore_endpoint(game_id):
+    return BOXSCORE_ENDPOINT.format(game_id=game_id)
+
+
+def playbyplay_endpoint(game_id):
+    return PLAYBYPLAY_ENDPOINT.format(game_id=game_id)
+
+
+def serve_game(stub_cdn, game_id, home_score=50, actions=3):
+    stub_cdn.serve(boxscore_endpoint(game_id), feeds.boxscore(game_id, home_score=home_score))
+    stub_cdn.serve(playbyplay_endpoint(game_id), feeds.playbyplay(game_id, map(feeds.action, range(1, actions + 1))))
+
+
+def test_fetch_scoreboard_builds_games_and_summaries(api, stub_cdn):
+    stub_cdn.serve(SCOREBOARD_ENDPOINT, feeds.scoreboard(
+        feeds.scoreboard_game(LATE_GAME, status=1, status_text="7:30 pm ET", period=0, clock="",
+                              tip_off="2026-10-17T02:00:00Z", home_score=0, away_score=0),
+        feeds.scoreboard_game(LIVE_GAME),
+    ))
+
+    games, summaries = api.fetch_scoreboard()
+
+    assert [game.game_id for game in games] == [LIVE_GAME, LATE_GAME]  # Sorted by tip-off
+    assert games[0].home_team == "Celtics" and games[0].home_team_id == 1610612738
+    assert summaries[LIVE_GAME].state is GameState.LIVE
+    assert summaries[LIVE_GAME].clock == "05:00"
+    assert summaries[LIVE_GAME].best_overall_player == "Leader: 18 PTS, 9 REB, 4 AST"
+    assert summaries[LATE_GAME].state is GameState.SCHEDULED
+    assert summaries[LATE_GAME].best_home_player == ""
+
+
+def test_fetch_scoreboard_is_served_from_memory_while_fresh(api, stub_cdn, client):
+    stub_cdn.serve(SCOREBOARD_ENDPOINT, feeds.scoreboard(feeds.scoreboard_game(LIVE_GAME)))
+
+    first = api.fetch_scoreboard()
+    client.advance(1)
+    assert api.fetch_scoreboard() is first
+    assert len(stub_cdn.requests_for(SCOREBOARD_ENDPOINT)) == 1
+
+
+def test_fetch_live_game_updates_many_fetches_every_game(api, stub_cdn):
+    serve_game(stub_cdn, LIVE_GAME, home_score=50, actions=3)
+    serve_game(stub_cdn, LATE_GAME, home_score=61, actions=5)
+
+    updates = api.fetch_live_game_updates_many([LATE_GAME, LIVE_GAME])
+
+    assert list(updates) == [LATE_GAME, LIVE_GAME]
+    live = updates[LIVE_GAME]
+    assert (live.home_score, live.away_score, live.clock, live.state) == (50, 48, "05:00", GameState.LIVE)
+    assert live.home_players.names == ("Home Starter", "Home Bench")  # Sorted by minutes
+    assert live.away_players.names == ("Away Starter", "Away Bench")
+    assert live.recent_plays[-1] == "Q1 10:00 | Action 3"
+    assert live.last_action_number == 3
+    assert updates[LATE_GAME].home_score == 61 and updates[LATE_GAME].last_action_number == 5
+
+
+def test_fetch_live_game_updates_many_fetches_only_requested_components(api, stub_cdn):
+    serve_game(stub_cdn, LIVE_GAME)
+
+    api.fetch_live_game_updates_many([LIVE_GAME], {LIVE_GAME: GameComponent.BOXSCORE})
+
+    assert len(stub_cdn.requests_for(boxscore_endpoint(LIVE_GAME))) == 1
+    assert stub_cdn.requests_for(playbyplay_endpoint(LIVE_GAME)) == []
+
+
+def test_unchanged_feeds_are_revalidated_with_304(api, stub_cdn, client):
+    serve_game(stub_cdn, LIVE_GAME)
+    first = api.fetch_live_game_updates(LIVE_GAME)
+
+    client.advance(api.game_poll_interval(GameState.LIVE))
+    second = api.fetch_live_game_updates(LIVE_GAME)
+
+    revalidation = stub_cdn.requests_for(boxscore_endpoint(LIVE_GAME))[-1]
+    assert "If-None-Match" in revalidation.headers
+    assert second is first  # NOT_MODIFIED on both components: the same snapshot, nothing decoded
+    stats = api.cache_stats()["entries"][LIVE_GAME]
+    assert (stats["misses"], stats["not_modified"]) == (4, 2)
+
+
+def test_changed_feed_after_304_is_merged(api, stub_cdn, client):
+    serve_game(stub_cdn, LIVE_GAME, home_score=50, actions=3)
+    api.fetch_live_game_updates(LIVE_GAME)
+
+    stub_cdn.serve(boxscore_endpoint(LIVE_GAME), feeds.boxscore(LIVE_GAME, home_score=53))
+    client.advance(api.game_poll_interval(GameState.LIVE))
+    update = api.fetch_live_game_updates(LIVE_GAME)
+
+    assert update.home_score == 53
+    assert update.last_action_number == 3  # Play-by-play came back 304 and kept its window
+
+
+def test_error_status_for_an_unseen_game_gives_an_empty_update(api, stub_cdn):
+    stub_cdn.serve(boxscore_endpoint(LIVE_GAME), 500)
+    stub_cdn.serve(playbyplay_endpoint(LIVE_GAME), feeds.playbyplay(LIVE_GAME, []))
+
+    update = api.fetch_live_game_updates(LIVE_GAME)
+
+    assert update.status == "Not Started" and update.state is GameState.UNKNOWN
+
+
+def test_error_status_serves_the_last_snapshot_and_retries(api, stub_cdn, client):
+    serve_game(stub_cdn, LIVE_GAME)
+    first = api.fetch_live_game_updates(LIVE_GAME)
+
+    stub_cdn.serve(boxscore_endpoint(LIVE_GAME), 503)
+    client.advance(api.game_poll_interval(GameState.LIVE))
+    assert api.fetch_live_game_updates(LIVE_GAME) is first
+    assert api.cache_stats()["entries"][LIVE_GAME]["stale_serves"] == 1
+
+    serve_game(stub_cdn, LIVE_GAME, home_score=55)
+    assert api.fetch_live_game_updates(LIVE_GAME).home_score == 55  # Nothing was stamped fresh
+
+
+def test_scoreboard_error_status_raises(api, stub_cdn):
+    stub_cdn.serve(SCOREBOARD_ENDPOINT, 404)
+
+    with pytest.raises(aiohttp.ClientResponseError) as raised:
+        api.fetch_scoreboard()
+    assert raised.value.status == 404
+
+
+def test_restart_revalidates_stale_disk_entries_instead_of_downloading(api, stub_cdn, client):
+    serve_game(stub_cdn, LIVE_GAME, home_score=50, actions=3)
+    api.fetch_live_game_updates(LIVE_GAME)
+
+    # A new launch: empty memory cache, same on-disk cache, its payloads now stale
+    client.advance(api.game_poll_interval(GameState.LIVE))
+    restarted = importlib.reload(api)
+    update = restarted.fetch_live_game_updates(LIVE_GAME)
+
+    for endpoint in (boxscore_endpoint(LIVE_GAME), playbyplay_endpoint(LIVE_GAME)):
+        assert "If-None-Match" in stub_cdn.requests_for(endpoint)[-1].headers
+    assert (update.home_score, update.last_action_number) == (50, 3)  # Decoded from the cached bodies
+    stats = restarted.cache_stats()["entries"][LIVE_GAME]
+    assert (stats["not_modified"], stats["bytes"]) == (2, 0)
+
+
+def test_malformed_boxscore_is_logged(api, stub_cdn, capsys):
+    serve_game(stub_cdn, LIVE_GAME)
+    malformed = feeds.boxscore(LIVE_GAME)
+    del malformed["game"]["homeTeam"]["players"]
+    stub_cdn.serve(boxscore_endpoint(LIVE_GAME), malformed)
+
+    update = api.fetch_live_game_updates(LIVE_GAME)
+
+    assert update.state is GameState.UNKNOWN
+    assert "Error parsing boxscore: KeyError('players')" in capsys.readouterr().out
+
+
+def test_malformed_playbyplay_is_logged(api, stub_cdn, capsys):
+    serve_game(stub_cdn, LIVE_GAME)
+    # A null actionNumber can't be compared with the newest action seen
+    stub_cdn.serve(playbyplay_endpoint(LIVE_GAME), feeds.playbyplay(LIVE_GAME, [feeds.action(None)]))
+
+    update = api.fetch_live_game_updates(LIVE_GAME)
+
+    assert update.state is GameState.UNKNOWN
+    assert "Error parsing play-by-play" in capsys.readouterr().out
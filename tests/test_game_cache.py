@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+import pytest
+
+from services.game_cache import CachePolicy, GameCache, POLICY_ENV, policy_from_environment
+from services.game_state import GameState
+from services.poll_scheduler import POLL_INTERVALS, PREGAME_LEAD
+
+
+def game(game_id, start_time=0.0):
+    return SimpleNamespace(game_id=game_id, start_time=start_time)
+
+
+def test_default_policy_follows_the_poll_intervals():
+    policy = CachePolicy()
+    for state, interval in POLL_INTERVALS.items():
+        assert policy.ttl(state) == interval
+
+
+def test_parse_overrides_states_games_and_scoreboard():
+    policy = CachePolicy.parse(" live=10, Clutch=3 ,final=none,max_games=32,scoreboard=300")
+
+    assert policy.ttl(GameState.LIVE) == 10 and policy.ttl(GameState.CLUTCH) == 3
+    assert policy.ttl(GameState.FINAL) is None
+    assert policy.ttl(GameState.HALFTIME) == POLL_INTERVALS[GameState.HALFTIME]
+    assert (policy.max_games, policy.max_scoreboard_ttl) == (32, 300)
+
+
+def test_scheduled_games_stay_fresh_until_shortly_before_tip_off():
+    policy = CachePolicy()
+    assert policy.ttl(GameState.SCHEDULED, tip_off=10_000, now=0) == 10_000 - PREGAME_LEAD
+
+
+@pytest.mark.parametrize("spec", [
+    "live=0", "live=-5", "clutch=nan", "halftime=inf", "live=abc",
+    "max_games=0", "max_games=-1", "max_games=2.5", "scoreboard=0", "overtime=5",
+])
+def test_parse_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        CachePolicy.parse(spec)
+
+
+def test_policies_built_in_code_are_checked_too():
+    with pytest.raises(ValueError):
+        CachePolicy().with_ttls(live=0)
+    with pytest.raises(ValueError):
+        CachePolicy(max_games=0)
+
+
+def test_bad_environment_policy_falls_back_to_the_default(monkeypatch, capsys):
+    monkeypatch.setenv(POLICY_ENV, "live=0")
+
+    assert policy_from_environment() == CachePolicy()
+    assert "Warning" in capsys.readouterr().out
+
+
+def test_environment_policy(monkeypatch):
+    monkeypatch.setenv(POLICY_ENV, "live=10")
+    assert policy_from_environment().ttl(GameState.LIVE) == 10
+
+
+def test_scoreboard_ttl_is_set_by_its_most_urgent_game():
+    policy = CachePolicy()
+    games = [game("a"), game("b")]
+    summaries = {"a": SimpleNamespace(state=GameState.HALFTIME), "b": SimpleNamespace(state=GameState.CLUTCH)}
+
+    assert policy.scoreboard_ttl(games, summaries, now=0) == POLL_INTERVALS[GameState.CLUTCH]
+    assert policy.scoreboard_ttl([], {}, now=0) == policy.max_scoreboard_ttl
+
+
+def test_only_past_days_games_are_evicted_least_recently_used_first():
+    cache = GameCache(CachePolicy(max_games=2))
+    cache.set_scoreboard([game("a"), game("b")], {}, now=0)
+    cache.game_entry("a").stats.misses += 1
+    cache.game_entry("b").stats.misses += 1
+
+    cache.set_scoreboard([game("c")], {}, now=10)  # A new day: a and b left the slate
+    cache.game_entry("b")
+    cache.game_entry("c")
+
+    assert (len(cache), cache.evictions) == (2, 1)
+    assert cache.game("a") is None and cache.game("b") is not None
+    assert cache.stats()["total"]["misses"] == 2  # Evicted games stay in the totals
+
+
+def test_todays_slate_is_never_evicted():
+    cache = GameCache(CachePolicy(max_games=1))
+    cache.set_scoreboard([game("a"), game("b")], {}, now=0)
+    cache.game_entry("a")
+    cache.game_entry("b")
+
+    assert len(cache) == 2 and cache.evictions == 0
@@ -0,0 +1,69 @@
+import json
+import os
+
+import pytest
+
+from services.logo_handler import ATLAS_VERSION, LogoAtlas
+
+
+@pytest.fixture
+def atlas_files(tmp_path):
+    """An atlas index and image built from one logo file, and a writer for other index versions"""
+    logos_dir = tmp_path / "nba-logos"
+    atlas_dir = logos_dir / "atlas"
+    atlas_dir.mkdir(parents=True)
+    source = logos_dir / "bucks.png"
+    source.write_bytes(b"png")
+    (atlas_dir / "logos.png").write_bytes(b"png")
+
+    def write_index(**overrides):
+        index = {
+            "version": ATLAS_VERSION,
+            "image": "logos.png",
+            "pixel_sizes": [40],
+            "teams": {"1610612749": {"name": "Bucks", "source": "bucks.png", "mtime": os.path.getmtime(source),
+                                     "tiles": {"40": [0, 0, 40, 40]}}},
+        }
+        index.update(overrides)
+        (atlas_dir / "logos.json").write_text(json.dumps(index))
+        return str(atlas_dir / "logos.json")
+
+    return write_index, str(logos_dir), source
+
+
+def test_current_atlas_is_loaded(atlas_files):
+    write_index, logos_dir, _ = atlas_files
+
+    atlas = LogoAtlas.load(write_index(), logos_dir)
+
+    assert atlas.tile(1610612749, 40) == (0, 0, 40, 40)
+    assert atlas.tile(1610612749, 60) is None
+
+
+def test_missing_atlas_is_not_an_error(tmp_path, capsys):
+    assert LogoAtlas.load(str(tmp_path / "logos.json"), str(tmp_path)) is None
+    assert capsys.readouterr().out == ""
+
+
+def test_atlas_of_another_version_is_ignored(atlas_files, capsys):
+    write_index, logos_dir, _ = atlas_files
+
+    assert LogoAtlas.load(write_index(version=ATLAS_VERSION - 1), logos_dir) is None
+    assert "version" in capsys.readouterr().out
+
+
+def test_atlas_older_than_a_logo_file_is_ignored(atlas_files, capsys):
+    write_index, logos_dir, source = atlas_files
+    index_path = write_index()
+    os.utime(source, (os.path.getmtime(source) + 60,) * 2)
+
+    assert LogoAtlas.load(index_path, logos_dir) is None
+    assert "bucks.png" in capsys.readouterr().out
+
+
+def test_atlas_whose_logo_file_is_gone_is_ignored(atlas_files):
+    write_index, logos_dir, source = atlas_files
+    index_path = write_index()
+    source.unlink()
+
+    assert LogoAtlas.load(index_path, logos_dir) is None
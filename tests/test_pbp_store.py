@@ -0,0 +1,82 @@
+from services.pbp_store import PlayByPlayStore, format_play
+from tests.feeds import action
+
+
+def actions(*numbers):
+    return [action(number) for number in numbers]
+
+
+def test_format_play():
+    assert format_play(action(7, "Tatum 3PT jump shot", period=3, clock="PT08M47.00S")) == "Q3 08:47 | Tatum 3PT jump shot"
+    assert format_play(action(8, "Jump ball", period=5, clock="PT05M00.00S")) == "OT1 05:00 | Jump ball"
+    assert format_play({}) == "Q0  | Unknown action"
+
+
+def test_ingest_counts_new_actions_and_tracks_the_newest():
+    store = PlayByPlayStore()
+
+    assert store.ingest(actions(1, 2, 3)) == 3
+    assert store.ingest(actions(1, 2, 3, 4, 5)) == 2
+    assert store.ingest(actions(1, 2, 3, 4, 5)) == 0
+    assert store.last_action_number == 5
+    assert store.recent() == tuple(f"Q1 10:00 | Action {number}" for number in (1, 2, 3, 4, 5))
+
+
+def test_window_is_trimmed_to_capacity_keeping_the_newest():
+    store = PlayByPlayStore(capacity=3)
+
+    store.ingest(actions(*range(1, 11)))
+
+    assert store.recent() == ("Q1 10:00 | Action 8", "Q1 10:00 | Action 9", "Q1 10:00 | Action 10")
+    assert store.recent(2) == ("Q1 10:00 | Action 9", "Q1 10:00 | Action 10")
+    assert store.last_action_number == 10
+
+
+def test_corrected_action_is_reformatted_when_its_edited_stamp_changes():
+    store = PlayByPlayStore()
+    store.ingest(actions(1, 2, 3))
+
+    corrected = actions(1, 2, 3)
+    corrected[1] = action(2, "Brown layup (corrected)", edited="2026-10-17T00:11:00Z")
+    assert store.ingest(corrected) == 0
+
+    assert store.recent()[1] == "Q1 10:00 | Brown layup (corrected)"
+
+
+def test_unchanged_edited_stamp_reuses_the_formatted_text():
+    store = PlayByPlayStore()
+    store.ingest(actions(1, 2))
+
+    same_stamp = actions(1, 2)
+    same_stamp[1] = action(2, "Different text, same stamp")
+    store.ingest(same_stamp)
+
+    assert store.recent()[1] == "Q1 10:00 | Action 2"
+
+
+def test_actions_removed_from_the_feed_are_dropped():
+    store = PlayByPlayStore()
+    store.ingest(actions(1, 2, 3, 4))
+
+    store.ingest(actions(1, 2, 4))
+
+    assert store.recent() == ("Q1 10:00 | Action 1", "Q1 10:00 | Action 2", "Q1 10:00 | Action 4")
+    assert store.last_action_number == 4
+
+
+def test_out_of_order_feed_falls_back_to_sorting():
+    store = PlayByPlayStore(capacity=3)
+
+    assert store.ingest(actions(1, 5, 2, 4, 3)) == 3
+
+    assert store.recent() == ("Q1 10:00 | Action 3", "Q1 10:00 | Action 4", "Q1 10:00 | Action 5")
+    assert store.last_action_number == 5
+
+
+def test_empty_feed_empties_the_window():
+    store = PlayByPlayStore()
+    store.ingest(actions(1, 2))
+
+    assert store.ingest([]) == 0
+    assert store.recent() == ()
+    assert store.last_action_number == 2
@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from services.time_parsing import format_clock, parse_duration, parse_minutes, parse_utc_timestamp
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("PT08M47.00S", (8, 47)),
+    ("PT00M00.00S", (0, 0)),
+    ("PT00M05.70S", (0, 5)),    # Fractions are truncated, like the displayed clock
+    ("PT33M", (33, 0)),
+    ("PT45S", (0, 45)),
+    ("PT5M3S", (5, 3)),
+    ("PT1H02M", (62, 0)),       # Hours fold into minutes
+    ("PT2H00M30.5S", (120, 30)),
+    ("", None),                 # gameClock before tip-off
+    (None, None),
+    ("PT", None),
+    ("08:47", None),
+    ("PT8X", None),
+    ("P1D", None),
+])
+def test_parse_duration(value, expected):
+    assert parse_duration(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("PT08M47.00S", "08:47"),
+    ("PT5M3S", "05:03"),
+    ("PT1H02M", "62:00"),
+    ("", "--"),
+    (None, "--"),
+    ("PT", "--"),
+    ("garbage", "--"),
+])
+def test_format_clock(value, expected):
+    assert format_clock(value) == expected
+
+
+def test_format_clock_default():
+    assert format_clock("", default="") == ""
+    assert format_clock("PT", default="0:00") == "0:00"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("PT33M", 33),
+    ("PT00M", 0),
+    ("PT33M12.00S", 33),
+    ("PT1H02M", 62),
+    ("", 0),
+    (None, 0),
+    ("PT", 0),
+    ("33", 0),
+])
+def test_parse_minutes(value, expected):
+    assert parse_minutes(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "2026-10-17T00:30:00Z",
+    "2026-10-17T00:30:00",          # Naive: taken as UTC
+    "2026-10-17T02:30:00+02:00",    # Offsets are converted to UTC
+    "2026-10-17T00:30:00.000Z",
+])
+def test_parse_utc_timestamp(value):
+    parsed = parse_utc_timestamp(value)
+    assert parsed == datetime(2026, 10, 17, 0, 30, tzinfo=timezone.utc)
+    assert parsed.tzinfo == timezone.utc
+
+
+@pytest.mark.parametrize("value", ["", "Z", "not a date", "2026-13-01T00:00:00Z", "2026-10-17T25:00:00Z", "17/10/2026"])
+def test_parse_utc_timestamp_rejects_malformed_values(value):
+    with pytest.raises(ValueError):
+        parse_utc_timestamp(value)